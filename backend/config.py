@@ -14,3 +14,60 @@ DEFAULT_DEBUG = False
 
 # Whisper (Speech-to-Text): "base" für Mac M4 8 GB, "small" bei mehr RAM
 WHISPER_MODEL = os.getenv("ZYQURAFLOW_WHISPER_MODEL", "base")
+
+# Memory budget for parsed summaries cached by the session list (bytes)
+SUMMARY_CACHE_MAX_BYTES = int(os.getenv("ZYQURAFLOW_SUMMARY_CACHE_BYTES", str(4 * 1024 * 1024)))
+
+# Audio uploads are streamed to disk in chunks of this size (bytes)
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Background job workers (transcription is CPU-bound: one per core)
+JOB_WORKERS = int(os.getenv("ZYQURAFLOW_JOB_WORKERS", str(os.cpu_count() or 2)))
+
+# Transcription language (ISO code); unset = auto-detect per recording
+TRANSCRIBE_LANGUAGE = os.getenv("ZYQURAFLOW_TRANSCRIBE_LANGUAGE") or None
+
+# Streaming transcription: save the partial transcript every N segments
+TRANSCRIBE_CHECKPOINT_SEGMENTS = int(os.getenv("ZYQURAFLOW_TRANSCRIBE_CHECKPOINT", "20"))
+
+# RAM budget for loaded Whisper models (MB); least recently used are evicted
+WHISPER_RAM_BUDGET_MB = int(os.getenv("ZYQURAFLOW_WHISPER_RAM_MB", "1500"))
+# Load the configured Whisper model in the background at startup
+WHISPER_PRELOAD = os.getenv("ZYQURAFLOW_WHISPER_PRELOAD", "false").lower() == "true"
+
+# Long-audio mode: recordings of at least this length (s) are split on silence
+# and transcribed in parallel chunks of about LONG_AUDIO_CHUNK_SECONDS
+LONG_AUDIO_MIN_SECONDS = float(os.getenv("ZYQURAFLOW_LONG_AUDIO_MIN_SECONDS", "900"))
+LONG_AUDIO_CHUNK_SECONDS = 120.0
+LONG_AUDIO_MAX_CHUNK_SECONDS = 300.0
+LONG_AUDIO_MAX_WORKERS = int(os.getenv("ZYQURAFLOW_LONG_AUDIO_WORKERS", str(max(1, (os.cpu_count() or 2) // 2))))
+
+# Map-reduce summarization: transcripts above SUMMARY_CHUNK_TOKENS (estimated)
+# are summarized in overlapping chunks, SUMMARY_PARALLELISM LLM calls at a time,
+# then merged. Keep chunks well inside the model context (llama3.2:3b: 4k default).
+SUMMARY_CHUNK_TOKENS = int(os.getenv("ZYQURAFLOW_SUMMARY_CHUNK_TOKENS", "2000"))
+SUMMARY_CHUNK_OVERLAP_TOKENS = int(os.getenv("ZYQURAFLOW_SUMMARY_CHUNK_OVERLAP", "150"))
+SUMMARY_PARALLELISM = int(os.getenv("ZYQURAFLOW_SUMMARY_PARALLELISM", "2"))
+
+# Persistent LLM response cache (SQLite table llm_cache): size budget in bytes,
+# entries older than the TTL are not served. ZYQURAFLOW_LLM_CACHE=false disables it.
+LLM_CACHE_ENABLED = os.getenv("ZYQURAFLOW_LLM_CACHE", "true").lower() == "true"
+LLM_CACHE_MAX_BYTES = int(os.getenv("ZYQURAFLOW_LLM_CACHE_BYTES", str(64 * 1024 * 1024)))
+LLM_CACHE_TTL_SECONDS = float(os.getenv("ZYQURAFLOW_LLM_CACHE_TTL", str(30 * 24 * 3600)))
+
+# Auto-process pipeline (ingest -> transcribe -> summarize): worker threads per
+# stage and the size of the bounded queues between stages (backpressure)
+PIPELINE_INGEST_WORKERS = int(os.getenv("ZYQURAFLOW_PIPELINE_INGEST_WORKERS", "1"))
+PIPELINE_TRANSCRIBE_WORKERS = int(os.getenv("ZYQURAFLOW_PIPELINE_TRANSCRIBE_WORKERS", "1"))
+PIPELINE_SUMMARIZE_WORKERS = int(os.getenv("ZYQURAFLOW_PIPELINE_SUMMARIZE_WORKERS", str(SUMMARY_PARALLELISM)))
+PIPELINE_QUEUE_SIZE = int(os.getenv("ZYQURAFLOW_PIPELINE_QUEUE_SIZE", "2"))
+# App shutdown waits at most this long (seconds) for busy pipeline workers
+PIPELINE_SHUTDOWN_TIMEOUT = float(os.getenv("ZYQURAFLOW_PIPELINE_SHUTDOWN_TIMEOUT", "10"))
+
+# POST /api/cases/bulk: most cases per request (one transaction)
+CASE_BULK_MAX = int(os.getenv("ZYQURAFLOW_CASE_BULK_MAX", "1000"))
+
+# Response compression (gzip, or brotli when installed) for bodies of at least this size
+COMPRESS_MIN_BYTES = int(os.getenv("ZYQURAFLOW_COMPRESS_MIN_BYTES", "1024"))
+COMPRESS_GZIP_LEVEL = int(os.getenv("ZYQURAFLOW_COMPRESS_GZIP_LEVEL", "6"))
+COMPRESS_BROTLI_QUALITY = int(os.getenv("ZYQURAFLOW_COMPRESS_BROTLI_QUALITY", "5"))
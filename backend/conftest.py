@@ -1,20 +1,64 @@
 """Pytest fixtures: temporäres Datenverzeichnis + Test-DB, API-Client."""
+import json
+import time
+from types import SimpleNamespace
+
 import pytest
 from pathlib import Path
 
 from fastapi.testclient import TestClient
 
 
+class FakeWhisper:
+    """Liefert Segmente nacheinander; wartet optional auf ein Event pro Segment."""
+
+    def __init__(self, n=4, duration=40.0, gate=None):
+        self.n, self.duration, self.gate = n, duration, gate
+
+    def transcribe(self, path, language=None):
+        def segments():
+            step = self.duration / self.n
+            for i in range(self.n):
+                if self.gate is not None:
+                    self.gate.wait(2)
+                yield SimpleNamespace(start=i * step, end=(i + 1) * step, text=f"Teil {i}")
+        return segments(), SimpleNamespace(duration=self.duration)
+
+
+def sse_events(body: str) -> list:
+    """Server-Sent-Events-Antwort -> [(event, data), ...]."""
+    events = []
+    for block in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
 @pytest.fixture(autouse=True)
 def test_env(tmp_path, monkeypatch):
     """Pro Test: eigenes Temp-Verzeichnis und Test-DB, keine echten Daten."""
     db_path = tmp_path / "test.db"
     monkeypatch.setattr("backend.config.DATA_ROOT", tmp_path)
+    monkeypatch.setattr("backend.storage.DATA_ROOT", tmp_path)
+    monkeypatch.setattr("backend.services.session_service.DATA_ROOT", tmp_path)
     monkeypatch.setattr("backend.config.DB_PATH", db_path)
     monkeypatch.setattr("backend.db.DB_PATH", db_path)
-    from backend.db import init_db
+    from backend.db import init_db, pool
     init_db()
     yield
+    from backend.pipeline import shutdown_pipeline
+    shutdown_pipeline()
+    pool.close_all()
+    from backend.summary_cache import summary_cache
+    summary_cache.clear()
+    from backend.llm_metrics import summary_metrics
+    summary_metrics.clear()
+    from backend.llm_cache import llm_cache
+    llm_cache.reset_stats()
+    from backend.prompts import prompt_registry
+    prompt_registry.reset_stats()
+    from backend.llm import config_store
+    config_store.invalidate()
 
 
 @pytest.fixture
@@ -22,3 +66,18 @@ def client():
     """FastAPI TestClient gegen die echte App (mit gepatchter Config)."""
     from backend.main import app
     return TestClient(app)
+
+
+@pytest.fixture
+def wait_for_job(client):
+    """Pollt /api/jobs/{job_id}, bis der Job fertig, fehlgeschlagen oder abgebrochen ist."""
+    def wait(job_id: str, timeout: float = 5.0) -> dict:
+        deadline = time.monotonic() + timeout
+        while True:
+            job = client.get(f"/api/jobs/{job_id}").json()
+            if job["status"] in ("done", "failed", "cancelled"):
+                return job
+            if time.monotonic() > deadline:
+                raise AssertionError(f"Job {job_id} did not finish: {job}")
+            time.sleep(0.02)
+    return wait
@@ -1,46 +1,120 @@
 """SQLite database for metadata index."""
 import sqlite3
+import threading
 from contextlib import contextmanager
 from pathlib import Path
 
 from backend.config import DB_PATH
 
+# Prepared statements kept per connection (sqlite3's built-in statement cache).
+STATEMENT_CACHE_SIZE = 256
+
+PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA cache_size=-16000",
+    "PRAGMA mmap_size=134217728",
+    "PRAGMA temp_store=MEMORY",
+)
+
+
+def _connect(path) -> sqlite3.Connection:
+    conn = sqlite3.connect(
+        path,
+        timeout=5.0,
+        check_same_thread=False,
+        cached_statements=STATEMENT_CACHE_SIZE,
+    )
+    for pragma in PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
 
 def get_conn():
-    return sqlite3.connect(DB_PATH)
+    """Standalone connection (caller closes it). Hot paths use db_cursor()."""
+    return _connect(DB_PATH)
+
+
+class ConnectionPool:
+    """Long-lived connections, one per (worker thread, database file).
+
+    Connections are never shared between threads; check_same_thread is off
+    only so close_all() and dead-thread cleanup can close them from outside.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._by_thread = {}  # Thread -> {path: Connection}
+        self._generation = 0
+
+    def _thread_conns(self) -> dict:
+        if getattr(self._local, "generation", None) != self._generation:
+            self._local.conns = {}
+            self._local.depth = {}
+            self._local.generation = self._generation
+            with self._lock:
+                self._by_thread[threading.current_thread()] = self._local.conns
+        return self._local.conns
+
+    def acquire(self, path) -> sqlite3.Connection:
+        conns = self._thread_conns()
+        key = str(path)
+        conn = conns.get(key)
+        if conn is None:
+            self._close_dead_threads()
+            conn = _connect(key)
+            conn.row_factory = sqlite3.Row
+            conns[key] = conn
+        return conn
 
+    def enter(self, path) -> tuple:
+        """Acquire connection and bump nesting depth. Returns (conn, outermost)."""
+        conn = self.acquire(path)
+        depth = self._local.depth
+        key = str(path)
+        depth[key] = depth.get(key, 0) + 1
+        return conn, depth[key] == 1
 
-def init_db():
+    def exit(self, path) -> None:
+        depth = self._local.depth
+        key = str(path)
+        depth[key] = max(depth.get(key, 1) - 1, 0)
+
+    def _close_dead_threads(self) -> None:
+        with self._lock:
+            dead = [t for t in self._by_thread if not t.is_alive()]
+            for t in dead:
+                for conn in self._by_thread.pop(t).values():
+                    conn.close()
+
+    def close_all(self) -> None:
+        """Close every pooled connection (shutdown, tests switching DB_PATH)."""
+        with self._lock:
+            self._generation += 1
+            for conns in self._by_thread.values():
+                for conn in conns.values():
+                    conn.close()
+            self._by_thread.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "threads": len(self._by_thread),
+                "connections": sum(len(c) for c in self._by_thread.values()),
+            }
+
+
+pool = ConnectionPool()
+
+
+def init_db() -> int:
+    """Bring the schema up to date. Called once at startup, not per request."""
+    from backend.migrations import migrate
     conn = get_conn()
     try:
-        conn.executescript("""
-            CREATE TABLE IF NOT EXISTS config (
-                key TEXT PRIMARY KEY,
-                value TEXT
-            );
-            CREATE TABLE IF NOT EXISTS cases (
-                case_id TEXT PRIMARY KEY,
-                alias TEXT NOT NULL,
-                created_at TEXT NOT NULL
-            );
-            CREATE TABLE IF NOT EXISTS sessions (
-                session_id TEXT PRIMARY KEY,
-                case_id TEXT,
-                created_at TEXT NOT NULL,
-                audio_path TEXT,
-                summary_path TEXT,
-                file_size INTEGER DEFAULT 0,
-                duration REAL,
-                status TEXT DEFAULT 'draft',
-                transcript TEXT,
-                FOREIGN KEY (case_id) REFERENCES cases(case_id)
-            );
-            INSERT OR IGNORE INTO config (key, value) VALUES
-                ('provider', 'ollama'),
-                ('model', 'llama3.2:3b'),
-                ('debug', 'false');
-        """)
-        conn.commit()
+        return migrate(conn)
     finally:
         conn.close()
 
@@ -53,10 +127,22 @@ def row_to_dict(row) -> dict:
 
 @contextmanager
 def db_cursor():
-    conn = get_conn()
-    conn.row_factory = sqlite3.Row
+    """Cursor on the calling thread's pooled connection.
+
+    Commits when the outermost block exits cleanly, rolls back on error.
+    Nested blocks on the same thread share the outer transaction.
+    """
+    path = Path(DB_PATH)
+    conn, outermost = pool.enter(path)
+    cur = conn.cursor()
     try:
-        yield conn.cursor()
-        conn.commit()
+        yield cur
+        if outermost:
+            conn.commit()
+    except BaseException:
+        if outermost:
+            conn.rollback()
+        raise
     finally:
-        conn.close()
+        cur.close()
+        pool.exit(path)
@@ -0,0 +1,286 @@
+"""Persistent background jobs (jobs table + bounded worker pool)."""
+import logging
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+
+from backend.config import JOB_WORKERS
+from backend.db import db_cursor, row_to_dict
+
+TERMINAL_STATUSES = ("done", "failed", "cancelled")
+
+# Progress is written to the DB at most this often (seconds) while a job runs
+PROGRESS_WRITE_INTERVAL = 1.0
+
+log = logging.getLogger("zyquraflow")
+
+
+class JobCancelled(Exception):
+    """Raised inside a handler when its job was cancelled."""
+
+
+class JobContext:
+    """Handed to job handlers: progress reporting and cancellation checks."""
+
+    def __init__(self, queue: "JobQueue", job_id: str):
+        self.queue = queue
+        self.job_id = job_id
+        self._last_write = 0.0
+
+    def cancelled(self) -> bool:
+        return self.job_id in self.queue._cancel_requested
+
+    def check_cancelled(self) -> None:
+        if self.cancelled():
+            raise JobCancelled(self.job_id)
+
+    def report(self, progress: float) -> None:
+        now = time.monotonic()
+        if now - self._last_write < PROGRESS_WRITE_INTERVAL:
+            return
+        self._last_write = now
+        with db_cursor() as cur:
+            cur.execute(
+                "UPDATE jobs SET progress = ? WHERE job_id = ?",
+                (max(0.0, min(progress, 1.0)), self.job_id),
+            )
+
+
+def _job_dto(row) -> dict:
+    j = row_to_dict(row)
+    return {
+        "job_id": j["job_id"],
+        "kind": j["kind"],
+        "session_id": j["session_id"],
+        "status": j["status"],
+        "progress": j["progress"] or 0.0,
+        "error": j["error"],
+        "created_at": j["created_at"],
+        "started_at": j["started_at"],
+        "finished_at": j["finished_at"],
+    }
+
+
+class JobQueue:
+    """Jobs are rows in the jobs table; a bounded thread pool executes them.
+
+    Queued (and interrupted running) jobs are picked up again by resume() at
+    startup, so they survive a backend restart. Handlers are registered per
+    kind and called as handler(session_id, ctx).
+    """
+
+    def __init__(self, max_workers: int = JOB_WORKERS):
+        self.max_workers = max_workers
+        self._handlers: dict = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._finished = threading.Condition()
+        self._closed = False
+        self._cancel_requested: set = set()
+
+    def register(self, kind: str, handler: Callable) -> None:
+        self._handlers[kind] = handler
+
+    def _pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            self._closed = False
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="zyq-job"
+                )
+            return self._executor
+
+    def submit(self, kind: str, session_id: Optional[str] = None) -> dict:
+        """Queue a job. An active job of the same kind for the session is returned instead.
+
+        The unique index idx_jobs_active makes the check atomic: of two
+        concurrent submits only one INSERT succeeds.
+        """
+        if kind not in self._handlers:
+            raise ValueError(f"Unknown job kind: {kind}")
+        job_id = f"JOB-{uuid.uuid4().hex}"
+        while True:
+            with db_cursor() as cur:
+                cur.execute(
+                    "INSERT INTO jobs (job_id, kind, session_id, status, progress, created_at) "
+                    "VALUES (?, ?, ?, 'queued', 0, datetime('now')) ON CONFLICT DO NOTHING",
+                    (job_id, kind, session_id),
+                )
+                if cur.rowcount:
+                    break
+                row = self._active_row(cur, kind, session_id)
+            if row:
+                return _job_dto(row)
+            # the active job finished between INSERT and SELECT: try again
+        self._pool().submit(self._run, job_id)
+        return self.get(job_id)
+
+    @staticmethod
+    def _active_row(cur, kind: str, session_id: Optional[str]):
+        cur.execute(
+            "SELECT * FROM jobs WHERE kind = ? AND session_id IS ? AND status IN ('queued', 'running') "
+            "ORDER BY created_at LIMIT 1",
+            (kind, session_id),
+        )
+        return cur.fetchone()
+
+    def active(self, kind: str, session_id: Optional[str] = None) -> Optional[dict]:
+        """The queued or running job of this kind for the session, if any."""
+        with db_cursor() as cur:
+            row = self._active_row(cur, kind, session_id)
+        return _job_dto(row) if row else None
+
+    def wait(self, job_id: str, timeout: Optional[float] = None) -> Optional[dict]:
+        """Block until the job is done, failed or cancelled and return it.
+
+        Returns the job as it is when the timeout expires or the pool is shut
+        down first (status still queued/running), None for an unknown job.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._finished:
+            while True:
+                job = self.get(job_id)
+                if job is None or job["status"] in TERMINAL_STATUSES or self._closed:
+                    return job
+                remaining = 1.0 if deadline is None else min(1.0, deadline - time.monotonic())
+                if remaining <= 0:
+                    return job
+                self._finished.wait(remaining)
+
+    def start_inline(self, kind: str, session_id: Optional[str] = None) -> Optional[dict]:
+        """Register work the caller runs itself (live SSE transcription) as a running job.
+
+        Returns None if an active job of this kind for the session exists. The
+        caller reports the outcome with finish(); cancel() works through a
+        JobContext as for pooled jobs.
+        """
+        if kind not in self._handlers:
+            raise ValueError(f"Unknown job kind: {kind}")
+        job_id = f"JOB-{uuid.uuid4().hex}"
+        with db_cursor() as cur:
+            cur.execute(
+                "INSERT INTO jobs (job_id, kind, session_id, status, progress, created_at, started_at) "
+                "VALUES (?, ?, ?, 'running', 0, datetime('now'), datetime('now')) ON CONFLICT DO NOTHING",
+                (job_id, kind, session_id),
+            )
+            if not cur.rowcount:
+                return None
+        return self.get(job_id)
+
+    def finish(self, job_id: str, status: str, error: Optional[str] = None) -> None:
+        """Record the outcome (done/failed/cancelled) of a start_inline() job."""
+        self._finish(job_id, status, error)
+
+    def get(self, job_id: str) -> Optional[dict]:
+        with db_cursor() as cur:
+            cur.execute("SELECT * FROM jobs WHERE job_id = ?", (job_id,))
+            row = cur.fetchone()
+        return _job_dto(row) if row else None
+
+    def list(self, session_id: Optional[str] = None, status: Optional[str] = None, limit: int = 100) -> list:
+        where, params = [], []
+        if session_id:
+            where.append("session_id = ?")
+            params.append(session_id)
+        if status:
+            where.append("status = ?")
+            params.append(status)
+        sql = "SELECT * FROM jobs"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY created_at DESC LIMIT ?"
+        params.append(limit)
+        with db_cursor() as cur:
+            cur.execute(sql, params)
+            return [_job_dto(r) for r in cur.fetchall()]
+
+    def cancel(self, job_id: str) -> Optional[dict]:
+        """Queued jobs are cancelled at once, running ones at their next checkpoint."""
+        with db_cursor() as cur:
+            cur.execute(
+                "UPDATE jobs SET status = 'cancelled', finished_at = datetime('now') "
+                "WHERE job_id = ? AND status = 'queued'",
+                (job_id,),
+            )
+            cur.execute(
+                "UPDATE jobs SET cancel_requested = 1 WHERE job_id = ? AND status = 'running'",
+                (job_id,),
+            )
+            if cur.rowcount:
+                self._cancel_requested.add(job_id)
+        return self.get(job_id)
+
+    def _claim(self, job_id: str) -> Optional[tuple]:
+        with db_cursor() as cur:
+            cur.execute(
+                "UPDATE jobs SET status = 'running', started_at = datetime('now'), progress = 0 "
+                "WHERE job_id = ? AND status = 'queued'",
+                (job_id,),
+            )
+            if not cur.rowcount:
+                return None
+            cur.execute("SELECT kind, session_id FROM jobs WHERE job_id = ?", (job_id,))
+            row = cur.fetchone()
+        return row["kind"], row["session_id"]
+
+    def _finish(self, job_id: str, status: str, error: Optional[str] = None) -> None:
+        self._cancel_requested.discard(job_id)
+        with db_cursor() as cur:
+            cur.execute(
+                "UPDATE jobs SET status = ?, error = ?, finished_at = datetime('now'), "
+                "progress = CASE WHEN ? = 'done' THEN 1 ELSE progress END WHERE job_id = ?",
+                (status, error, status, job_id),
+            )
+        with self._finished:
+            self._finished.notify_all()
+
+    def _run(self, job_id: str) -> None:
+        claimed = self._claim(job_id)
+        if claimed is None:
+            return  # cancelled while queued, or already taken
+        kind, session_id = claimed
+        ctx = JobContext(self, job_id)
+        try:
+            self._handlers[kind](session_id, ctx)
+        except JobCancelled:
+            self._finish(job_id, "cancelled")
+        except Exception as e:
+            log.warning("Job %s (%s) failed: %s", job_id, kind, e)
+            self._finish(job_id, "failed", str(e))
+        else:
+            self._finish(job_id, "done")
+
+    def resume(self) -> int:
+        """Startup: re-queue interrupted jobs and schedule everything queued. Returns the count."""
+        with db_cursor() as cur:
+            cur.execute(
+                "UPDATE jobs SET status = 'queued', started_at = NULL "
+                "WHERE status = 'running' AND cancel_requested = 0"
+            )
+            cur.execute(
+                "UPDATE jobs SET status = 'cancelled', finished_at = datetime('now') "
+                "WHERE status = 'running' AND cancel_requested = 1"
+            )
+            cur.execute("SELECT job_id, kind FROM jobs WHERE status = 'queued' ORDER BY created_at")
+            rows = cur.fetchall()
+        n = 0
+        for r in rows:
+            if r["kind"] in self._handlers:
+                self._pool().submit(self._run, r["job_id"])
+                n += 1
+        return n
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Stop the pool; running jobs are re-queued by the next resume()."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+            self._closed = True
+        with self._finished:
+            self._finished.notify_all()
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+
+job_queue = JobQueue()
@@ -0,0 +1,69 @@
+"""Incremental parser for a streamed JSON object: yields top-level fields as they complete."""
+import json
+
+
+class IncrementalJSONParser:
+    """Feed text chunks of one JSON object; get back (key, value) of each finished member.
+
+    Only the top level is tracked: a member is complete when the ',' or '}'
+    after it arrives outside any string or nested value. Text before the
+    opening '{' (e.g. a ```json fence) is skipped. Members that do not parse
+    are ignored here; the full text is still validated at the end.
+    """
+
+    def __init__(self):
+        self._member = []
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self.done = False
+        self.fields = {}
+
+    def feed(self, chunk: str) -> list:
+        completed = []
+        for ch in chunk:
+            if self.done:
+                break
+            if self._depth == 0:
+                if ch == "{":
+                    self._depth = 1
+                continue
+            if self._in_string:
+                self._member.append(ch)
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                continue
+            if ch == '"':
+                self._in_string = True
+            elif ch in "{[":
+                self._depth += 1
+            elif ch in "}]":
+                self._depth -= 1
+            if (self._depth == 1 and ch == ",") or self._depth == 0:
+                member = self._parse_member()
+                if member is not None:
+                    completed.append(member)
+                self._member = []
+                if self._depth == 0:
+                    self.done = True
+                continue
+            self._member.append(ch)
+        return completed
+
+    def _parse_member(self):
+        text = "".join(self._member).strip()
+        if not text:
+            return None
+        try:
+            obj = json.loads("{" + text + "}")
+        except ValueError:
+            return None
+        if len(obj) != 1:
+            return None
+        key, value = next(iter(obj.items()))
+        self.fields[key] = value
+        return key, value
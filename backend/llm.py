@@ -1,21 +1,18 @@
 """LLM provider registry and config."""
-from typing import Optional
+import logging
+import threading
+from typing import Callable, Optional
 
 from backend.config import DEFAULT_PROVIDER, DEFAULT_MODEL, DEFAULT_DEBUG, WHISPER_MODEL
-from backend.db import init_db, get_conn
+from backend.db import db_cursor
 
 
 _provider_instance = None
 
+log = logging.getLogger("zyquraflow")
 
-def get_config():
-    init_db()
-    conn = get_conn()
-    conn.row_factory = lambda c, r: dict(zip([col[0] for col in c.description], r))
-    cur = conn.cursor()
-    cur.execute("SELECT key, value FROM config")
-    rows = {r["key"]: r["value"] for r in cur.fetchall()}
-    conn.close()
+
+def _parse_config(rows: dict) -> dict:
     return {
         "provider": rows.get("provider", DEFAULT_PROVIDER),
         "model": rows.get("model", DEFAULT_MODEL),
@@ -24,25 +21,87 @@ def get_config():
     }
 
 
+class ConfigStore:
+    """The config table, read once and then served from memory.
+
+    update() writes SQLite and swaps in the new values in one step, then
+    calls subscribers with (changed, config) where changed maps each key that
+    changed to its new value. Assumes this process is the only writer.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._values: Optional[dict] = None
+        self._subscribers: list = []
+        self.loads = 0
+
+    def _load(self) -> dict:
+        with db_cursor() as cur:
+            cur.execute("SELECT key, value FROM config")
+            rows = {r["key"]: r["value"] for r in cur.fetchall()}
+        self.loads += 1
+        return _parse_config(rows)
+
+    def get(self) -> dict:
+        values = self._values
+        if values is None:
+            with self._lock:
+                if self._values is None:
+                    self._values = self._load()
+                values = self._values
+        return dict(values)
+
+    def update(self, **changes) -> dict:
+        changes = {k: v for k, v in changes.items() if v is not None}
+        with self._lock:
+            old = self._values if self._values is not None else self._load()
+            with db_cursor() as cur:
+                cur.executemany(
+                    "INSERT OR REPLACE INTO config (key, value) VALUES (?, ?)",
+                    [(k, str(v).lower() if isinstance(v, bool) else v) for k, v in changes.items()],
+                )
+            self._values = {**old, **changes}
+            changed = {k: v for k, v in changes.items() if old.get(k) != v}
+            values, subscribers = dict(self._values), list(self._subscribers)
+        if changed:
+            for fn in subscribers:
+                try:
+                    fn(changed, dict(values))
+                except Exception:
+                    log.exception("Config subscriber %r failed", fn)
+        return values
+
+    def subscribe(self, fn: Callable[[dict, dict], None]) -> Callable[[], None]:
+        """Call fn(changed, config) after each change; returns an unsubscribe function."""
+        with self._lock:
+            self._subscribers.append(fn)
+
+        def unsubscribe() -> None:
+            with self._lock:
+                if fn in self._subscribers:
+                    self._subscribers.remove(fn)
+        return unsubscribe
+
+    def invalidate(self) -> None:
+        """Drop the cached values; the next get() reads SQLite again."""
+        with self._lock:
+            self._values = None
+
+
+config_store = ConfigStore()
+
+
+def get_config():
+    return config_store.get()
+
+
 def set_config(
     provider: Optional[str] = None,
     model: Optional[str] = None,
     debug: Optional[bool] = None,
     whisper_model: Optional[str] = None,
 ):
-    init_db()
-    conn = get_conn()
-    cur = conn.cursor()
-    if provider is not None:
-        cur.execute("INSERT OR REPLACE INTO config (key, value) VALUES ('provider', ?)", (provider,))
-    if model is not None:
-        cur.execute("INSERT OR REPLACE INTO config (key, value) VALUES ('model', ?)", (model,))
-    if debug is not None:
-        cur.execute("INSERT OR REPLACE INTO config (key, value) VALUES ('debug', ?)", (str(debug).lower(),))
-    if whisper_model is not None:
-        cur.execute("INSERT OR REPLACE INTO config (key, value) VALUES ('whisper_model', ?)", (whisper_model,))
-    conn.commit()
-    conn.close()
+    return config_store.update(provider=provider, model=model, debug=debug, whisper_model=whisper_model)
 
 
 def get_llm():
@@ -0,0 +1,189 @@
+"""Persistent LLM response cache keyed by hash(prompt_id, prompt, model, params)."""
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import AsyncIterator, Optional
+
+from starlette.concurrency import run_in_threadpool
+
+from backend.config import LLM_CACHE_ENABLED, LLM_CACHE_MAX_BYTES, LLM_CACHE_TTL_SECONDS
+from backend.db import db_cursor
+from backend.providers.base import CachedText, LLMProvider, LLMResponse, MockText
+
+# Responses waiting for validation before they may be stored (see LLMCache.stage)
+MAX_STAGED = 256
+
+
+def cache_key(prompt_id: str, prompt: str, model: str, params: dict) -> str:
+    payload = json.dumps([prompt_id, prompt, model, params], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LLMCache:
+    """Responses in the llm_cache table, evicted least recently used above max_bytes.
+
+    Entries older than ttl_seconds count as misses and are deleted on lookup
+    or during eviction. Hit/miss counters are per process.
+
+    Fresh responses are only staged in memory; they are written once the
+    caller has validated them (commit), so invalid output is never replayed.
+    """
+
+    def __init__(self, max_bytes: int = LLM_CACHE_MAX_BYTES, ttl_seconds: float = LLM_CACHE_TTL_SECONDS):
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._staged: OrderedDict = OrderedDict()  # response text -> [(key, prompt_id, model)]
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[str]:
+        now = time.time()
+        with db_cursor() as cur:
+            cur.execute("SELECT response, created_at FROM llm_cache WHERE key = ?", (key,))
+            row = cur.fetchone()
+            if row is not None and row[1] < now - self.ttl_seconds:
+                cur.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                row = None
+            if row is not None:
+                cur.execute("UPDATE llm_cache SET last_used = ? WHERE key = ?", (now, key))
+        with self._lock:
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return row[0]
+
+    def put(self, key: str, prompt_id: str, model: str, response: str) -> None:
+        size = len(response.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+        now = time.time()
+        evicted = 0
+        with db_cursor() as cur:
+            cur.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, prompt_id, model, response, size, created_at, last_used) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, prompt_id, model, response, size, now, now),
+            )
+            cur.execute("DELETE FROM llm_cache WHERE created_at < ?", (now - self.ttl_seconds,))
+            evicted += cur.rowcount
+            cur.execute("SELECT COALESCE(SUM(size), 0) FROM llm_cache")
+            total = cur.fetchone()[0]
+            if total > self.max_bytes:
+                cur.execute("SELECT key, size FROM llm_cache ORDER BY last_used")
+                victims = []
+                for victim, victim_size in cur.fetchall():
+                    if total <= self.max_bytes:
+                        break
+                    victims.append((victim,))
+                    total -= victim_size
+                cur.executemany("DELETE FROM llm_cache WHERE key = ?", victims)
+                evicted += len(victims)
+        with self._lock:
+            self.stores += 1
+            self.evictions += evicted
+
+    def stage(self, key: str, prompt_id: str, model: str, response: str) -> None:
+        """Remember a fresh response until commit() (oldest dropped beyond MAX_STAGED)."""
+        with self._lock:
+            self._staged.setdefault(response, []).append((key, prompt_id, model))
+            self._staged.move_to_end(response)
+            while len(self._staged) > MAX_STAGED:
+                self._staged.popitem(last=False)
+
+    def commit(self, response: str) -> None:
+        """Store staged entries whose response passed validation."""
+        with self._lock:
+            entries = self._staged.pop(response, [])
+        for key, prompt_id, model in entries:
+            self.put(key, prompt_id, model, response)
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.hits = self.misses = self.stores = self.evictions = 0
+            self._staged.clear()
+
+    def stats(self) -> dict:
+        with db_cursor() as cur:
+            cur.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM llm_cache")
+            entries, size = cur.fetchone()
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": LLM_CACHE_ENABLED,
+                "entries": entries,
+                "bytes": size,
+                "max_bytes": self.max_bytes,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "stores": self.stores,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+llm_cache = LLMCache()
+
+
+class CachedProvider(LLMProvider):
+    """Wraps a provider: serves repeated (prompt_id, prompt, model, params) from llm_cache.
+
+    Hits come back as LLMResponse.cached / CachedText. Misses are only staged;
+    the caller commits them after validation (commit_validated). Mock
+    fallback responses (LLMResponse.mock / MockText chunks) are never staged.
+    Cache lookups run in the threadpool, not on the event loop.
+    """
+
+    def __init__(self, inner: LLMProvider, cache: LLMCache = None):
+        self.inner = inner
+        self.cache = cache or llm_cache
+
+    async def complete(self, prompt: str, model: str, prompt_id: str, **kwargs) -> LLMResponse:
+        start = time.perf_counter()
+        key = cache_key(prompt_id, prompt, model, kwargs)
+        text = await run_in_threadpool(self.cache.get, key)
+        if text is not None:
+            return LLMResponse(text, model, prompt_id, (time.perf_counter() - start) * 1000, cached=True)
+        resp = await self.inner.complete(prompt, model, prompt_id, **kwargs)
+        if not getattr(resp, "mock", False):
+            self.cache.stage(key, prompt_id, model, resp.text)
+        return resp
+
+    async def stream(self, prompt: str, model: str, prompt_id: str, **kwargs) -> AsyncIterator[str]:
+        key = cache_key(prompt_id, prompt, model, kwargs)
+        text = await run_in_threadpool(self.cache.get, key)
+        if text is not None:
+            yield CachedText(text)
+            return
+        chunks = []
+        mock = False
+        async for chunk in self.inner.stream(prompt, model, prompt_id, **kwargs):
+            mock = mock or isinstance(chunk, MockText)
+            chunks.append(chunk)
+            yield chunk
+        if not mock:
+            self.cache.stage(key, prompt_id, model, "".join(chunks))
+
+    async def health(self, timeout: float = 2.0) -> bool:
+        return await self.inner.health(timeout)
+
+    async def aclose(self) -> None:
+        await self.inner.aclose()
+
+
+def cached(provider: LLMProvider, use_cache: bool = True) -> LLMProvider:
+    """The provider behind the response cache, unless bypassed or disabled."""
+    if not (use_cache and LLM_CACHE_ENABLED):
+        return provider
+    return CachedProvider(provider)
+
+
+async def commit_validated(text: str) -> None:
+    """Store a response (staged by CachedProvider) once it passed validation."""
+    await run_in_threadpool(llm_cache.commit, text)
@@ -0,0 +1,48 @@
+"""Per-model counters for summary generation: how often the fix_json repair still runs."""
+import threading
+from collections import defaultdict
+
+
+class SummaryMetrics:
+    """Counts summary attempts per model and how each one ended.
+
+    outcome is "valid" (first answer passed validation), "repaired" (fix_json
+    round made it valid) or "failed" (still invalid after repair). Every
+    repaired or failed summary cost one extra LLM call. "cached" counts
+    summaries served from the LLM response cache; they are not generations
+    and stay out of the totals and the repair rate.
+    """
+
+    OUTCOMES = ("valid", "repaired", "failed", "cached")
+    GENERATED = ("valid", "repaired", "failed")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts = defaultdict(lambda: dict.fromkeys(self.OUTCOMES, 0))
+
+    def record(self, model: str, outcome: str) -> None:
+        if outcome not in self.OUTCOMES:
+            raise ValueError(f"Unknown outcome: {outcome}")
+        with self._lock:
+            self._counts[model][outcome] += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._counts.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            models = {}
+            for model, counts in sorted(self._counts.items()):
+                total = sum(counts[o] for o in self.GENERATED)
+                repairs = counts["repaired"] + counts["failed"]
+                models[model] = {
+                    "summaries": total,
+                    **counts,
+                    "repair_calls": repairs,
+                    "repair_rate": round(repairs / total, 4) if total else 0.0,
+                }
+            return models
+
+
+summary_metrics = SummaryMetrics()
@@ -0,0 +1,179 @@
+"""Long-audio mode: split on silence (VAD), transcribe chunks in parallel, merge in order."""
+import itertools
+import math
+import os
+from collections import deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Iterator, Optional
+
+from backend.config import (
+    LONG_AUDIO_CHUNK_SECONDS,
+    LONG_AUDIO_MAX_CHUNK_SECONDS,
+    LONG_AUDIO_MAX_WORKERS,
+    LONG_AUDIO_MIN_SECONDS,
+)
+
+SAMPLING_RATE = 16000
+# Hard cuts inside long speech overlap by this much; the merge drops the duplicate
+OVERLAP_SECONDS = 1.0
+
+Segment = namedtuple("Segment", ["start", "end", "text"])
+
+
+def probe_duration(path) -> Optional[float]:
+    """Audio duration in seconds from the container header (None if unknown)."""
+    try:
+        import av  # PyAV, installed with faster-whisper
+        with av.open(str(path)) as container:
+            if container.duration:
+                return container.duration / av.time_base
+    except Exception:
+        pass
+    return None
+
+
+def workers_for(duration: Optional[float], cpu_count: Optional[int] = None) -> int:
+    """Parallel chunk workers for this duration; 1 means the single-stream path."""
+    if not duration or duration < LONG_AUDIO_MIN_SECONDS:
+        return 1
+    cpus = cpu_count or os.cpu_count() or 1
+    by_length = math.ceil(duration / LONG_AUDIO_MIN_SECONDS) + 1
+    return max(1, min(LONG_AUDIO_MAX_WORKERS, cpus, by_length))
+
+
+def plan_chunks(
+    speech: list,
+    total_samples: int,
+    sampling_rate: int = SAMPLING_RATE,
+    target_s: float = LONG_AUDIO_CHUNK_SECONDS,
+    max_s: float = LONG_AUDIO_MAX_CHUNK_SECONDS,
+    overlap_s: float = OVERLAP_SECONDS,
+) -> list:
+    """Group VAD speech regions ([{start, end}] in samples) into (start, end) chunks.
+
+    Chunks are closed once they reach target_s, cutting in the middle of the
+    following silence so no word is split. A single speech region longer than
+    max_s is cut hard with overlap_s of overlap (deduplicated by merge_segments).
+    """
+    target, max_len, overlap = (int(x * sampling_rate) for x in (target_s, max_s, overlap_s))
+    regions = []
+    for r in speech:
+        start, end = r["start"], r["end"]
+        while end - start > max_len:
+            regions.append((start, start + max_len))
+            start += max_len - overlap
+        regions.append((start, end))
+    if not regions:
+        return [(0, total_samples)] if total_samples else []
+
+    chunks = []
+    chunk_start = None
+    for i, (start, end) in enumerate(regions):
+        if chunk_start is None:
+            chunk_start = start
+        is_last = i == len(regions) - 1
+        if end - chunk_start >= target or is_last:
+            if is_last:
+                cut = total_samples
+            else:
+                next_start = regions[i + 1][0]
+                cut = end if next_start < end else (end + next_start) // 2
+            chunks.append((chunk_start, cut))
+            chunk_start = None
+        elif regions[i + 1][1] - chunk_start > max_len:
+            # Next region would overflow the chunk: cut in the silence before it
+            next_start = regions[i + 1][0]
+            cut = end if next_start < end else (end + next_start) // 2
+            chunks.append((chunk_start, cut))
+            chunk_start = None
+    if chunks:
+        chunks[0] = (0, chunks[0][1])
+    # Consecutive chunks start where the previous one ended (except overlapping hard cuts)
+    for i in range(1, len(chunks)):
+        prev_end = chunks[i - 1][1]
+        if chunks[i][0] > prev_end:
+            chunks[i] = (prev_end, chunks[i][1])
+    return chunks
+
+
+def merge_segments(chunk_results: Iterable, tolerance: float = 0.2) -> Iterator[Segment]:
+    """Yield segments of (offset_seconds, segments) chunk results in timestamp order.
+
+    Segments ending before the last emitted end (the overlap of a hard cut)
+    are dropped.
+    """
+    last_end = 0.0
+    for offset, segments in chunk_results:
+        for seg in segments:
+            start, end = seg.start + offset, seg.end + offset
+            if end <= last_end + tolerance:
+                continue
+            text = seg.text.strip()
+            if not text:
+                continue
+            yield Segment(max(start, last_end), end, seg.text)
+            last_end = end
+
+
+def transcribe_chunks(
+    model,
+    audio,
+    chunks: list,
+    workers: int,
+    language: Optional[str] = None,
+    sampling_rate: int = SAMPLING_RATE,
+) -> Iterator[Segment]:
+    """Transcribe sample ranges of audio across workers threads; yields merged segments.
+
+    Without a language, the first chunk runs alone to detect it once for all
+    chunks; with one, all chunks start in parallel right away.
+    Results are yielded in chunk order as soon as each chunk is done. At most
+    workers chunks are in flight; closing the generator (job cancelled, SSE
+    client gone) drops the chunks not yet started instead of waiting for them.
+    """
+    if not chunks:
+        return
+
+    def run(chunk, lang):
+        start, end = chunk
+        segments, info = model.transcribe(audio[start:end], language=lang, vad_filter=False)
+        return start / sampling_rate, list(segments), info
+
+    first = None
+    if not language:
+        first_offset, first_segments, info = run(chunks[0], None)
+        language = getattr(info, "language", None)
+        first = (first_offset, first_segments)
+
+    def results():
+        if first is not None:
+            yield first
+        rest = iter(chunks[1:] if first is not None else chunks)
+        ex = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="zyq-stt")
+        try:
+            pending = deque(ex.submit(run, c, language) for c in itertools.islice(rest, workers))
+            while pending:
+                offset, segments, _ = pending.popleft().result()
+                nxt = next(rest, None)
+                if nxt is not None:
+                    pending.append(ex.submit(run, nxt, language))
+                yield offset, segments
+        finally:
+            ex.shutdown(wait=False, cancel_futures=True)
+
+    chunk_results = results()
+    try:
+        yield from merge_segments(chunk_results)
+    finally:
+        chunk_results.close()
+
+
+def transcribe_long(model, path, workers: int, language: Optional[str] = None) -> Iterator[Segment]:
+    """Decode, split on silence with Silero VAD and transcribe chunks in parallel."""
+    from faster_whisper.audio import decode_audio
+    from faster_whisper.vad import VadOptions, get_speech_timestamps
+
+    audio = decode_audio(str(path), sampling_rate=SAMPLING_RATE)
+    speech = get_speech_timestamps(audio, VadOptions(min_silence_duration_ms=500))
+    chunks = plan_chunks(speech, len(audio))
+    return transcribe_chunks(model, audio, chunks, workers, language)
@@ -1,26 +1,45 @@
 """FastAPI application."""
-import asyncio
-import tempfile
-from pathlib import Path
+import hashlib
+import json
+import logging
+from contextlib import aclosing
 
-from fastapi import FastAPI, HTTPException, UploadFile, File
+from fastapi import FastAPI, HTTPException, UploadFile, File, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from typing import Optional
 from pydantic import BaseModel
 
-from backend.db import init_db
-from backend.services import session_service, case_service
-from backend.llm import get_config, set_config
-
-app = FastAPI(title="ZyquraFlow API")
+from backend.config import UPLOAD_CHUNK_SIZE, WHISPER_PRELOAD
+from backend.db import init_db, pool
+from backend.jobs import job_queue
+from backend.services import session_service, case_service, search_service
+from backend.llm import config_store, get_config, get_llm, set_config
+from backend.llm_cache import llm_cache
+from backend.pipeline import get_pipeline, shutdown_pipeline
+from backend.prompts import prompt_registry
+from backend.responses import CompressionMiddleware, FastJSONResponse
+from backend.llm_metrics import summary_metrics
+from backend.summary_cache import summary_cache
+from backend.whisper_models import whisper_models
+
+log = logging.getLogger("zyquraflow")
+
+app = FastAPI(title="ZyquraFlow API", default_response_class=FastJSONResponse)
+app.add_middleware(CompressionMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag", "X-Job-Id"],
 )
 
+# Keyset pagination: max page size for list endpoints
+MAX_PAGE_SIZE = 500
+
 
 class TranscriptBody(BaseModel):
     transcript: str
@@ -30,6 +49,19 @@ class CaseCreateBody(BaseModel):
     alias: str
 
 
+class CaseBulkBody(BaseModel):
+    aliases: list[str]
+
+
+class SummarizeBatchBody(BaseModel):
+    session_ids: list[str]
+    force: bool = False
+
+
+class SummarizeCaseBody(BaseModel):
+    force: bool = False
+
+
 class ConfigPatchBody(BaseModel):
     provider: Optional[str] = None
     model: Optional[str] = None
@@ -40,19 +72,52 @@ class ConfigPatchBody(BaseModel):
 @app.on_event("startup")
 def startup():
     init_db()
+    job_queue.resume()
+    if WHISPER_PRELOAD:
+        whisper_models.preload(get_config()["whisper_model"])
+        config_store.subscribe(_preload_switched_whisper_model)
+
+
+def _preload_switched_whisper_model(changed: dict, cfg: dict) -> None:
+    """Warm up a newly selected Whisper model, so the next transcription does not wait for the load."""
+    if "whisper_model" in changed:
+        whisper_models.preload(changed["whisper_model"])
+
+
+def _json(content, response: Optional[Response] = None) -> FastJSONResponse:
+    """Session/case DTOs are plain dicts already: render them directly, without jsonable_encoder."""
+    return FastJSONResponse(content, headers=dict(response.headers) if response is not None else None)
+
+
+def _etag(*parts) -> str:
+    """ETag from row/table versions plus whatever shapes the body (query string)."""
+    return '"' + hashlib.sha1(repr(parts).encode("utf-8")).hexdigest()[:20] + '"'
+
+
+def _not_modified(request: Request, response: Response, etag: str) -> Optional[Response]:
+    """Set the ETag; a 304 response if If-None-Match already has it, else None."""
+    response.headers["ETag"] = etag
+    header = request.headers.get("if-none-match")
+    if header:
+        tags = {t.strip().removeprefix("W/") for t in header.split(",")}
+        if etag in tags or "*" in tags:
+            return Response(status_code=304, headers={"ETag": etag})
+    return None
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    await run_in_threadpool(shutdown_pipeline)
+    job_queue.shutdown()
+    await get_llm().aclose()
+    pool.close_all()
 
 
 @app.get("/health")
-def health():
-    """Provider health check."""
+async def health():
+    """Provider health check (über den gemeinsamen Provider-Client)."""
     cfg = get_config()
-    ollama_available = False
-    try:
-        import httpx
-        r = httpx.get("http://localhost:11434/api/tags", timeout=2.0)
-        ollama_available = r.status_code == 200
-    except Exception:
-        pass
+    ollama_available = await get_llm().health(timeout=2.0)
     return {
         "status": "ok",
         "provider": cfg["provider"],
@@ -67,13 +132,25 @@ def get_system_config():
 
 @app.patch("/api/system/config")
 def patch_system_config(body: ConfigPatchBody):
-    set_config(
+    return set_config(
         provider=body.provider,
         model=body.model,
         debug=body.debug,
         whisper_model=body.whisper_model,
     )
-    return get_config()
+
+
+@app.get("/api/system/stats")
+def get_system_stats():
+    """Runtime counters (caches, DB pool, summary repair rate per model, LLM cache, audio dedup, prompt sizes)."""
+    return {
+        "summary_cache": summary_cache.stats(),
+        "db_pool": pool.stats(),
+        "summaries": summary_metrics.stats(),
+        "llm_cache": llm_cache.stats(),
+        "audio_store": session_service.audio_store_stats(),
+        "prompts": prompt_registry.stats(),
+    }
 
 
 @app.get("/api/system/providers")
@@ -103,38 +180,137 @@ def list_whisper_models():
     return {"models": WHISPER_MODEL_IDS}
 
 
+@app.get("/api/system/whisper-models/loaded")
+def loaded_whisper_models():
+    """Currently loaded Whisper models with estimated/measured memory footprint."""
+    return whisper_models.status()
+
+
 @app.post("/api/sessions")
 def create_session():
     return session_service.create_session(case_id=None)
 
 
 @app.get("/api/sessions")
-def list_sessions(case_id: Optional[str] = None):
-    return session_service.list_sessions(case_id=case_id)
+def list_sessions(
+    request: Request,
+    response: Response,
+    case_id: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    after: Optional[str] = None,
+    fields: Optional[str] = None,
+):
+    """Sessions newest first. With limit: next page cursor in X-Next-Cursor (pass as after=).
+
+    fields=a,b,c projects the DTOs; the default leaves out the transcript.
+    ETag/If-None-Match: 304 while no session has changed.
+    """
+    not_modified = _not_modified(
+        request, response, _etag("sessions", session_service.sessions_version(), request.url.query)
+    )
+    if not_modified:
+        return not_modified
+    try:
+        projection = session_service.parse_fields(fields, session_service.LIST_FIELDS)
+        items, next_cursor = session_service.list_sessions_page(
+            case_id=case_id, limit=limit, after=after, fields=projection
+        )
+    except ValueError as e:
+        raise HTTPException(400, str(e))
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return _json(items, response)
 
 
 @app.get("/api/sessions/{session_id}")
-def get_session(session_id: str):
-    s = session_service.get_session(session_id)
+def get_session(session_id: str, request: Request, response: Response, fields: Optional[str] = None):
+    try:
+        projection = session_service.parse_fields(fields)
+    except ValueError as e:
+        raise HTTPException(400, str(e))
+    version = session_service.session_version(session_id)
+    if version is None:
+        raise HTTPException(404, "Session not found")
+    not_modified = _not_modified(request, response, _etag("session", session_id, version, request.url.query))
+    if not_modified:
+        return not_modified
+    s = session_service.get_session(session_id, fields=projection)
     if not s:
         raise HTTPException(404, "Session not found")
-    return s
+    return _json(s, response)
+
+
+async def _stream_upload(upload, chunks) -> None:
+    try:
+        async for chunk in chunks:
+            await run_in_threadpool(upload.write, chunk)
+    except BaseException:
+        upload.abort()
+        raise
+    upload.close()
+
+
+async def _upload_file_chunks(file: UploadFile):
+    while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+        yield chunk
+
+
+def _begin_upload(session_id: str, filename: str, resume: bool = False):
+    try:
+        return session_service.begin_audio_upload(session_id, filename, resume=resume)
+    except ValueError as e:
+        raise HTTPException(404, str(e))
 
 
 @app.post("/api/sessions/{session_id}/audio")
 async def upload_audio(session_id: str, file: UploadFile = File(...)):
+    """Multipart upload, copied in chunks into the session directory."""
     if not file.filename:
         raise HTTPException(400, "No file")
-    ext = Path(file.filename).suffix
-    with tempfile.NamedTemporaryFile(delete=False, suffix=ext) as tmp:
-        content = await file.read()
-        tmp.write(content)
-        tmp_path = Path(tmp.name)
+    upload = _begin_upload(session_id, file.filename)
+    await _stream_upload(upload, _upload_file_chunks(file))
+    return await run_in_threadpool(session_service.finish_audio_upload, session_id, upload)
+
+
+@app.put("/api/sessions/{session_id}/audio")
+async def put_audio(session_id: str, request: Request, filename: str = Query(...)):
+    """Raw request body streamed straight into the session directory (no multipart spooling)."""
+    upload = _begin_upload(session_id, filename)
+    await _stream_upload(upload, request.stream())
+    return await run_in_threadpool(session_service.finish_audio_upload, session_id, upload)
+
+
+@app.get("/api/sessions/{session_id}/audio/chunks")
+def get_audio_upload_offset(session_id: str):
+    """Resumable upload: bytes already received (send the next chunk with this offset)."""
     try:
-        s = session_service.update_audio(session_id, tmp_path, len(content))
-        return s
+        return {"offset": session_service.audio_upload_offset(session_id)}
+    except ValueError as e:
+        raise HTTPException(404, str(e))
+
+
+@app.post("/api/sessions/{session_id}/audio/chunks")
+async def append_audio_chunk(
+    session_id: str,
+    request: Request,
+    filename: str = Query(...),
+    offset: int = Query(..., ge=0),
+    final: bool = False,
+):
+    """Resumable upload: append the raw body at offset; final=true moves the file into place."""
+    upload = _begin_upload(session_id, filename, resume=True)
+    if upload.size != offset:
+        upload.close()
+        raise HTTPException(409, f"Offset mismatch: expected {upload.size}")
+    try:
+        async for chunk in request.stream():
+            await run_in_threadpool(upload.write, chunk)
     finally:
-        tmp_path.unlink(missing_ok=True)
+        # Keep the partial file on failure so the client can resume
+        upload.close()
+    if not final:
+        return {"offset": upload.size}
+    return await run_in_threadpool(session_service.finish_audio_upload, session_id, upload)
 
 
 @app.put("/api/sessions/{session_id}/transcript")
@@ -142,26 +318,144 @@ def update_transcript(session_id: str, body: TranscriptBody):
     return session_service.update_transcript(session_id, body.transcript)
 
 
-@app.post("/api/sessions/{session_id}/transcribe")
-async def transcribe(session_id: str):
-    """Speech-to-Text: Audio der Sitzung transkribieren, Transkript speichern."""
+@app.post("/api/sessions/{session_id}/transcribe", status_code=202)
+def transcribe(session_id: str):
+    """Speech-to-Text als Hintergrund-Job: liefert sofort den Job (Status über /api/jobs/{job_id})."""
     try:
-        loop = asyncio.get_event_loop()
-        s = await loop.run_in_executor(None, lambda: session_service.transcribe_session(session_id))
-        return s
+        return session_service.enqueue_transcription(session_id)
     except ValueError as e:
         raise HTTPException(400, str(e))
 
 
+def _sse(event: str, data) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+@app.get("/api/sessions/{session_id}/transcribe/stream")
+def transcribe_stream(session_id: str):
+    """Speech-to-Text live als Server-Sent Events: ein `segment`-Event pro Segment, dann `done`.
+
+    Der Stream läuft als Transkriptions-Job der Sitzung (abbrechbar über
+    /api/jobs/{job_id}/cancel); 409, solange die Sitzung schon einen aktiven hat.
+    """
+    try:
+        job = session_service.start_live_transcription(session_id)
+    except ValueError as e:
+        raise HTTPException(400, str(e))
+    if job is None:
+        active = session_service.active_transcription(session_id)
+        raise HTTPException(409, f"Transkription läuft bereits als Job {active['job_id'] if active else ''}".rstrip())
+
+    def events():
+        try:
+            for seg in session_service.iter_live_transcription(job):
+                yield _sse("segment", seg)
+            yield _sse("done", session_service.get_session(session_id, fields=session_service.LIST_FIELDS))
+        except Exception as e:
+            yield _sse("error", {"detail": str(e)})
+
+    return StreamingResponse(
+        events(), media_type="text/event-stream", headers={"Cache-Control": "no-cache", "X-Job-Id": job["job_id"]}
+    )
+
+
+@app.get("/api/jobs")
+def list_jobs(session_id: Optional[str] = None, status: Optional[str] = None):
+    return job_queue.list(session_id=session_id, status=status)
+
+
+@app.get("/api/jobs/{job_id}")
+def get_job(job_id: str):
+    """Job status and progress (0..1)."""
+    j = job_queue.get(job_id)
+    if not j:
+        raise HTTPException(404, "Job not found")
+    return j
+
+
+@app.post("/api/jobs/{job_id}/cancel")
+def cancel_job(job_id: str):
+    j = job_queue.cancel(job_id)
+    if not j:
+        raise HTTPException(404, "Job not found")
+    return j
+
+
+def _batch_stream(session_ids: list, force: bool, no_cache: bool) -> StreamingResponse:
+    """SSE: `session` event per finished session (with done/total), then `done` with counts."""
+    async def events():
+        results = []
+        total = len(set(session_ids))
+        # aclosing: a disconnect cancels the LLM calls still holding or waiting for slots
+        batch = session_service.iter_summarize_batch(session_ids, force=force, use_cache=not no_cache)
+        async with aclosing(batch):
+            async for result in batch:
+                results.append(result)
+                yield _sse("session", {**result, "done": len(results), "total": total})
+        yield _sse("done", session_service.batch_summary(results))
+
+    return StreamingResponse(events(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
+
+
+@app.post("/api/sessions/summarize")
+async def summarize_sessions(body: SummarizeBatchBody, no_cache: bool = False):
+    """Mehrere Sitzungen zusammenfassen (parallel, begrenzt); bereits zusammengefasste nur mit force."""
+    return await session_service.summarize_batch(body.session_ids, force=body.force, use_cache=not no_cache)
+
+
+@app.post("/api/sessions/summarize/stream")
+async def summarize_sessions_stream(body: SummarizeBatchBody, no_cache: bool = False):
+    return _batch_stream(body.session_ids, body.force, no_cache)
+
+
+@app.post("/api/sessions/{session_id}/process", status_code=202)
+def process_session(session_id: str):
+    """Auto-Verarbeitung: Transkribieren und danach Zusammenfassen über die Pipeline (Status: /api/pipeline)."""
+    try:
+        session_service.check_transcribable(session_id)
+    except ValueError as e:
+        raise HTTPException(400, str(e))
+    return get_pipeline().submit_session(session_id)
+
+
+@app.get("/api/pipeline")
+def pipeline_status():
+    """Stage workers, queue depth, busy time, throughput (sessions/hour) and recent items."""
+    p = get_pipeline()
+    return {**p.stats(), "items": p.items()}
+
+
 @app.post("/api/sessions/{session_id}/summarize")
-async def summarize(session_id: str):
+async def summarize(session_id: str, no_cache: bool = False):
+    """no_cache=true: LLM-Antwort-Cache umgehen (neue Generierung erzwingen)."""
     try:
-        s = await session_service.summarize_session(session_id)
+        s = await session_service.summarize_session(session_id, use_cache=not no_cache)
         return s
     except ValueError as e:
         raise HTTPException(400, str(e))
 
 
+@app.post("/api/sessions/{session_id}/summarize/stream")
+async def summarize_stream(session_id: str, no_cache: bool = False):
+    """Zusammenfassen mit Token-Streaming als SSE: `field`-Events (title, key_points, …) sobald
+    vollständig, dann `done` mit der gespeicherten Sitzung."""
+    try:
+        session_service.check_summarizable(session_id)
+    except ValueError as e:
+        raise HTTPException(400, str(e))
+
+    async def events():
+        try:
+            async for event, data in session_service.stream_summary(session_id, use_cache=not no_cache):
+                yield _sse(event, data)
+        except Exception as e:
+            if not isinstance(e, ValueError):
+                log.exception("Summary stream failed for %s", session_id)
+            yield _sse("error", {"detail": str(e) or type(e).__name__})
+
+    return StreamingResponse(events(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
+
+
 @app.post("/api/sessions/{session_id}/unlink")
 def unlink(session_id: str):
     try:
@@ -171,9 +465,26 @@ def unlink(session_id: str):
         raise HTTPException(404, str(e))
 
 
+@app.get("/api/search")
+def search(
+    q: str,
+    case_id: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+):
+    """Volltextsuche über Transkripte und Zusammenfassungen (FTS5, bm25-Ranking, Snippets mit <mark>)."""
+    try:
+        return _json(search_service.search_sessions(q, case_id=case_id, limit=limit, offset=offset))
+    except ValueError as e:
+        raise HTTPException(400, str(e))
+
+
 @app.get("/api/cases")
-def list_cases():
-    return case_service.list_cases()
+def list_cases(request: Request, response: Response):
+    not_modified = _not_modified(request, response, _etag("cases", case_service.cases_version()))
+    if not_modified:
+        return not_modified
+    return _json(case_service.list_cases(), response)
 
 
 @app.post("/api/cases")
@@ -181,12 +492,61 @@ def create_case(body: CaseCreateBody):
     return case_service.create_case(body.alias)
 
 
+@app.post("/api/cases/bulk")
+def create_cases(body: CaseBulkBody):
+    """Viele Fälle in einer Transaktion anlegen (Import)."""
+    try:
+        return case_service.create_cases(body.aliases)
+    except ValueError as e:
+        raise HTTPException(400, str(e))
+
+
 @app.get("/api/cases/{case_id}")
-def get_case(case_id: str):
-    c = case_service.get_case(case_id)
+def get_case(
+    case_id: str,
+    request: Request,
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    after: Optional[str] = None,
+    fields: Optional[str] = None,
+):
+    """Case with its sessions; limit/after/fields page and project the embedded sessions like /api/sessions."""
+    version = case_service.case_version(case_id)
+    if version is None:
+        raise HTTPException(404, "Case not found")
+    not_modified = _not_modified(request, response, _etag("case", case_id, version, request.url.query))
+    if not_modified:
+        return not_modified
+    try:
+        projection = session_service.parse_fields(fields, session_service.LIST_FIELDS)
+        c, next_cursor = case_service.get_case_page(case_id, limit=limit, after=after, fields=projection)
+    except ValueError as e:
+        raise HTTPException(400, str(e))
     if not c:
         raise HTTPException(404, "Case not found")
-    return c
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return _json(c, response)
+
+
+@app.post("/api/cases/{case_id}/summarize")
+async def summarize_case(case_id: str, body: Optional[SummarizeCaseBody] = None, no_cache: bool = False):
+    """Alle Sitzungen eines Falls zusammenfassen (wie /api/sessions/summarize)."""
+    force = body.force if body else False
+    try:
+        session_ids = case_service.case_session_ids(case_id)
+    except ValueError as e:
+        raise HTTPException(404, str(e))
+    return await session_service.summarize_batch(session_ids, force=force, use_cache=not no_cache)
+
+
+@app.post("/api/cases/{case_id}/summarize/stream")
+async def summarize_case_stream(case_id: str, body: Optional[SummarizeCaseBody] = None, no_cache: bool = False):
+    try:
+        session_ids = case_service.case_session_ids(case_id)
+    except ValueError as e:
+        raise HTTPException(404, str(e))
+    return _batch_stream(session_ids, body.force if body else False, no_cache)
 
 
 @app.post("/api/cases/{case_id}/sessions/{session_id}")
@@ -0,0 +1,132 @@
+"""Map-reduce summarization for transcripts that do not fit one prompt."""
+import asyncio
+import json
+import re
+from typing import Callable, Optional
+
+from backend.config import SUMMARY_CHUNK_OVERLAP_TOKENS, SUMMARY_CHUNK_TOKENS, SUMMARY_PARALLELISM
+from backend.llm_cache import commit_validated
+from backend.prompts import CHARS_PER_TOKEN, estimate_tokens, load_prompt
+from backend.schema import SUMMARY_SCHEMA, validate_summary
+
+_PIECE_RE = re.compile(r"(?<=[.!?])\s+|\n+")
+
+
+def _pieces(text: str, max_chars: int) -> list:
+    """Sentences/lines of text; pieces longer than max_chars are cut at whitespace."""
+    pieces = []
+    for piece in _PIECE_RE.split(text):
+        piece = piece.strip()
+        while len(piece) > max_chars:
+            cut = piece.rfind(" ", 0, max_chars)
+            cut = cut if cut > 0 else max_chars
+            pieces.append(piece[:cut])
+            piece = piece[cut:].strip()
+        if piece:
+            pieces.append(piece)
+    return pieces
+
+
+def split_transcript(
+    text: str,
+    chunk_tokens: int = SUMMARY_CHUNK_TOKENS,
+    overlap_tokens: int = SUMMARY_CHUNK_OVERLAP_TOKENS,
+) -> list:
+    """Split at sentence boundaries into chunks of at most chunk_tokens (estimated).
+
+    Each chunk after the first starts with the trailing sentences (up to
+    overlap_tokens) of the previous one, so context at the cut is not lost.
+    """
+    max_chars = chunk_tokens * CHARS_PER_TOKEN
+    overlap_chars = min(overlap_tokens * CHARS_PER_TOKEN, max_chars // 2)
+    chunks = []
+    current: list = []
+    size = 0
+    for piece in _pieces(text, max_chars - overlap_chars):
+        if current and size + 1 + len(piece) > max_chars:
+            chunks.append(" ".join(current))
+            carried, carried_size = [], 0
+            for prev in reversed(current):
+                if carried_size + len(prev) + 1 > overlap_chars:
+                    break
+                carried.insert(0, prev)
+                carried_size += len(prev) + 1
+            current, size = carried, carried_size
+        current.append(piece)
+        size += len(piece) + 1
+    if current:
+        chunks.append(" ".join(current))
+    return chunks
+
+
+def _partial(text: str):
+    """Parsed chunk summary, or the raw text if the model did not return valid JSON."""
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError:
+        return text.strip()
+    return data if validate_summary(data)[0] else text.strip()
+
+
+async def _map(llm, model: str, prompt_id: str, prompts: list, parallelism: int, on_response: Optional[Callable]):
+    """Run prompts concurrently (at most parallelism at a time); responses in input order."""
+    semaphore = asyncio.Semaphore(max(1, parallelism))
+
+    async def run(prompt):
+        async with semaphore:
+            resp = await llm.complete(prompt, model, prompt_id, format=SUMMARY_SCHEMA)
+        if on_response:
+            on_response(resp)
+        partial = _partial(resp.text)
+        if isinstance(partial, dict):
+            await commit_validated(resp.text)  # only valid chunk summaries are cached
+        return partial
+
+    return await asyncio.gather(*(run(p) for p in prompts))
+
+
+def _partials_text(partials: list) -> str:
+    return json.dumps(partials, ensure_ascii=False, indent=1)
+
+
+def _reduce_prompt(partials: list) -> str:
+    return load_prompt("summary_reduce.v0.1", partials=_partials_text(partials))
+
+
+async def reduce_prompt_for(
+    llm,
+    model: str,
+    transcript: str,
+    chunk_tokens: int = SUMMARY_CHUNK_TOKENS,
+    overlap_tokens: int = SUMMARY_CHUNK_OVERLAP_TOKENS,
+    parallelism: int = SUMMARY_PARALLELISM,
+    on_response: Optional[Callable] = None,
+) -> str:
+    """Map phase: summarize the chunks, then build the final summary_reduce.v0.1 prompt.
+
+    The caller runs the final reduce call itself (blocking or streaming). If
+    the partial summaries are too long for one reduce prompt, they are merged
+    in groups first (tree reduce) until they fit.
+    """
+    chunks = split_transcript(transcript, chunk_tokens, overlap_tokens)
+    prompts = [
+        load_prompt("summary_chunk.v0.1", transcript=chunk, part=i, parts=len(chunks))
+        for i, chunk in enumerate(chunks, 1)
+    ]
+    partials = await _map(llm, model, "summary_chunk.v0.1", prompts, parallelism, on_response)
+
+    # chunk_tokens budgets the content of a prompt (transcript chunk or partials), not the template
+    while len(partials) > 1 and estimate_tokens(_partials_text(partials)) > chunk_tokens:
+        groups, group = [], []
+        for partial in partials:
+            if group and estimate_tokens(_partials_text(group + [partial])) > chunk_tokens:
+                groups.append(group)
+                group = []
+            group.append(partial)
+        groups.append(group)
+        if len(groups) == len(partials):
+            break  # every partial alone is already at the budget; reduce them as they are
+        partials = await _map(
+            llm, model, "summary_reduce.v0.1", [_reduce_prompt(g) for g in groups], parallelism, on_response
+        )
+    return _reduce_prompt(partials)
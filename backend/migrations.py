@@ -0,0 +1,359 @@
+"""Versioned schema migrations, applied once at startup by init_db()."""
+import json
+import sqlite3
+from pathlib import Path
+
+
+def _summary_json_column(conn: sqlite3.Connection) -> None:
+    """Store summaries in the DB; summary.json stays on disk as export artifact."""
+    import backend.config as config
+    conn.execute("ALTER TABLE sessions ADD COLUMN summary_json TEXT")
+    rows = conn.execute(
+        "SELECT session_id, summary_path FROM sessions WHERE summary_path IS NOT NULL AND summary_path != ''"
+    ).fetchall()
+    for session_id, raw in rows:
+        path = Path(raw) if Path(raw).is_absolute() else (config.DATA_ROOT / raw)
+        try:
+            text = path.read_text(encoding="utf-8")
+            json.loads(text)
+        except (OSError, ValueError):
+            continue
+        conn.execute("UPDATE sessions SET summary_json = ? WHERE session_id = ?", (text, session_id))
+
+
+def _fts_values(row: str, key: str = "") -> str:
+    """FTS column values of a sessions row (new/old/sessions): its key (rowid
+    unless given) plus transcript and summary fields."""
+    def summary_list(field):
+        return (
+            f"(SELECT group_concat(value, ' • ') FROM json_each({row}.summary_json, '$.{field}'))"
+        )
+    valid = f"json_valid({row}.summary_json)"
+    return f"""{key or f"{row}.rowid"},
+            coalesce({row}.transcript, ''),
+            CASE WHEN {valid} THEN coalesce(json_extract({row}.summary_json, '$.title'), '') ELSE '' END,
+            CASE WHEN {valid} THEN coalesce({summary_list('key_points')}, '') ELSE '' END,
+            CASE WHEN {valid} THEN coalesce({summary_list('action_items')}, '') ELSE '' END,
+            CASE WHEN {valid} THEN coalesce(json_extract({row}.summary_json, '$.summary'), '') ELSE '' END"""
+
+
+_FTS_COLUMNS = "rowid, transcript, title, key_points, action_items, summary"
+
+
+def _search_id(row: str) -> str:
+    return f"(SELECT search_id FROM session_search_ids WHERE session_id = {row}.session_id)"
+
+
+def _case_aggregates_sql() -> str:
+    """Per-case counters on cases plus case_status_counts, kept current by triggers on sessions."""
+    def apply(row: str, sign: str) -> str:
+        # add (sign "+") or remove (sign "-") the contribution of a sessions row to its case
+        status = f"coalesce({row}.status, 'draft')"
+        return f"""
+            UPDATE cases SET
+                session_count = session_count {sign} 1,
+                audio_bytes = audio_bytes {sign} coalesce({row}.file_size, 0),
+                duration_seconds = duration_seconds {sign} coalesce({row}.duration, 0),
+                last_activity_at = datetime('now')
+            WHERE case_id = {row}.case_id;
+            INSERT INTO case_status_counts (case_id, status, count) VALUES ({row}.case_id, {status}, {sign}1)
+                ON CONFLICT (case_id, status) DO UPDATE SET count = count {sign} 1;
+            DELETE FROM case_status_counts WHERE case_id = {row}.case_id AND status = {status} AND count <= 0;"""
+
+    changed = (
+        "old.case_id IS NOT new.case_id OR old.status IS NOT new.status "
+        "OR old.file_size IS NOT new.file_size OR old.duration IS NOT new.duration"
+    )
+    return f"""
+        ALTER TABLE cases ADD COLUMN session_count INTEGER NOT NULL DEFAULT 0;
+        ALTER TABLE cases ADD COLUMN audio_bytes INTEGER NOT NULL DEFAULT 0;
+        ALTER TABLE cases ADD COLUMN duration_seconds REAL NOT NULL DEFAULT 0;
+        ALTER TABLE cases ADD COLUMN last_activity_at TEXT;
+        CREATE TABLE IF NOT EXISTS case_status_counts (
+            case_id TEXT NOT NULL,
+            status TEXT NOT NULL,
+            count INTEGER NOT NULL,
+            PRIMARY KEY (case_id, status)
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS idx_cases_created ON cases (created_at);
+        UPDATE cases SET
+            session_count = (SELECT COUNT(*) FROM sessions s WHERE s.case_id = cases.case_id),
+            audio_bytes = (SELECT coalesce(SUM(s.file_size), 0) FROM sessions s WHERE s.case_id = cases.case_id),
+            duration_seconds = (SELECT coalesce(SUM(s.duration), 0) FROM sessions s WHERE s.case_id = cases.case_id),
+            last_activity_at = coalesce(
+                (SELECT MAX(s.created_at) FROM sessions s WHERE s.case_id = cases.case_id), created_at
+            );
+        INSERT INTO case_status_counts (case_id, status, count)
+            SELECT case_id, coalesce(status, 'draft'), COUNT(*) FROM sessions
+            WHERE case_id IS NOT NULL GROUP BY 1, 2;
+        CREATE TRIGGER IF NOT EXISTS sessions_case_agg_insert AFTER INSERT ON sessions
+        WHEN new.case_id IS NOT NULL BEGIN{apply("new", "+")}
+        END;
+        CREATE TRIGGER IF NOT EXISTS sessions_case_agg_delete AFTER DELETE ON sessions
+        WHEN old.case_id IS NOT NULL BEGIN{apply("old", "-")}
+        END;
+        CREATE TRIGGER IF NOT EXISTS sessions_case_agg_update_old
+        AFTER UPDATE OF case_id, status, file_size, duration ON sessions
+        WHEN old.case_id IS NOT NULL AND ({changed}) BEGIN{apply("old", "-")}
+        END;
+        CREATE TRIGGER IF NOT EXISTS sessions_case_agg_update_new
+        AFTER UPDATE OF case_id, status, file_size, duration ON sessions
+        WHEN new.case_id IS NOT NULL AND ({changed}) BEGIN{apply("new", "+")}
+        END;
+    """
+
+
+def _row_versions_sql() -> str:
+    """row_version/updated_at on sessions and cases, stamped by triggers for ETags.
+
+    Versions come from one counter per table (data_versions), so they only
+    ever grow: the counter itself versions the list endpoints, a row's
+    version versions its detail endpoint.
+    """
+    parts = ["""
+        CREATE TABLE IF NOT EXISTS data_versions (
+            name TEXT PRIMARY KEY,
+            version INTEGER NOT NULL
+        );"""]
+    for table in ("sessions", "cases"):
+        bump = f"UPDATE data_versions SET version = version + 1 WHERE name = '{table}';"
+        stamp = (
+            f"UPDATE {table} SET row_version = (SELECT version FROM data_versions WHERE name = '{table}'), "
+            f"updated_at = datetime('now') WHERE rowid = new.rowid;"
+        )
+        parts.append(f"""
+        ALTER TABLE {table} ADD COLUMN row_version INTEGER NOT NULL DEFAULT 0;
+        ALTER TABLE {table} ADD COLUMN updated_at TEXT;
+        UPDATE {table} SET row_version = 1, updated_at = created_at;
+        INSERT OR REPLACE INTO data_versions (name, version) VALUES ('{table}', 1);
+        CREATE TRIGGER IF NOT EXISTS {table}_version_insert AFTER INSERT ON {table} BEGIN
+            {bump}
+            {stamp}
+        END;
+        CREATE TRIGGER IF NOT EXISTS {table}_version_update AFTER UPDATE ON {table}
+        WHEN new.row_version IS old.row_version BEGIN
+            {bump}
+            {stamp}
+        END;
+        CREATE TRIGGER IF NOT EXISTS {table}_version_delete AFTER DELETE ON {table} BEGIN
+            {bump}
+        END;""")
+    parts.append("""
+        CREATE INDEX IF NOT EXISTS idx_sessions_case_version ON sessions (case_id, row_version);""")
+    return "".join(parts) + "\n"
+
+
+# (version, name, step) in ascending order. A step is either an SQL script or
+# a callable taking the connection. Never edit an applied step; append a new one.
+MIGRATIONS = [
+    (1, "baseline", """
+        CREATE TABLE IF NOT EXISTS config (
+            key TEXT PRIMARY KEY,
+            value TEXT
+        );
+        CREATE TABLE IF NOT EXISTS cases (
+            case_id TEXT PRIMARY KEY,
+            alias TEXT NOT NULL,
+            created_at TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS sessions (
+            session_id TEXT PRIMARY KEY,
+            case_id TEXT,
+            created_at TEXT NOT NULL,
+            audio_path TEXT,
+            summary_path TEXT,
+            file_size INTEGER DEFAULT 0,
+            duration REAL,
+            status TEXT DEFAULT 'draft',
+            transcript TEXT,
+            FOREIGN KEY (case_id) REFERENCES cases(case_id)
+        );
+        INSERT OR IGNORE INTO config (key, value) VALUES
+            ('provider', 'ollama'),
+            ('model', 'llama3.2:3b'),
+            ('debug', 'false');
+    """),
+    (2, "session_list_indexes", """
+        CREATE INDEX IF NOT EXISTS idx_sessions_case_created
+            ON sessions (case_id, created_at, session_id);
+        CREATE INDEX IF NOT EXISTS idx_sessions_created
+            ON sessions (created_at, session_id);
+    """),
+    (3, "sessions_summary_json", _summary_json_column),
+    (4, "sessions_audio_sha256", """
+        ALTER TABLE sessions ADD COLUMN audio_sha256 TEXT;
+    """),
+    (5, "jobs", """
+        CREATE TABLE IF NOT EXISTS jobs (
+            job_id TEXT PRIMARY KEY,
+            kind TEXT NOT NULL,
+            session_id TEXT,
+            status TEXT NOT NULL DEFAULT 'queued',
+            progress REAL DEFAULT 0,
+            error TEXT,
+            cancel_requested INTEGER NOT NULL DEFAULT 0,
+            created_at TEXT NOT NULL,
+            started_at TEXT,
+            finished_at TEXT
+        );
+        CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status, created_at);
+        CREATE INDEX IF NOT EXISTS idx_jobs_session ON jobs (session_id, created_at);
+    """),
+    (6, "llm_cache", """
+        CREATE TABLE IF NOT EXISTS llm_cache (
+            key TEXT PRIMARY KEY,
+            prompt_id TEXT NOT NULL,
+            model TEXT NOT NULL,
+            response TEXT NOT NULL,
+            size INTEGER NOT NULL,
+            created_at REAL NOT NULL,
+            last_used REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_llm_cache_last_used ON llm_cache (last_used);
+    """),
+    (7, "transcript_cache", """
+        CREATE TABLE IF NOT EXISTS transcript_cache (
+            audio_sha256 TEXT NOT NULL,
+            whisper_model TEXT NOT NULL,
+            language TEXT NOT NULL,
+            transcript TEXT NOT NULL,
+            segments_json TEXT NOT NULL,
+            duration REAL,
+            created_at TEXT NOT NULL,
+            PRIMARY KEY (audio_sha256, whisper_model, language)
+        );
+    """),
+    # Full-text search; rowid = sessions.rowid, kept in sync by triggers
+    (8, "sessions_fts", f"""
+        CREATE VIRTUAL TABLE IF NOT EXISTS sessions_fts USING fts5(
+            transcript, title, key_points, action_items, summary,
+            tokenize = 'unicode61 remove_diacritics 2',
+            prefix = '2 3'
+        );
+        INSERT INTO sessions_fts ({_FTS_COLUMNS}) SELECT {_fts_values("sessions")} FROM sessions;
+        CREATE TRIGGER IF NOT EXISTS sessions_fts_insert AFTER INSERT ON sessions BEGIN
+            INSERT INTO sessions_fts ({_FTS_COLUMNS}) VALUES ({_fts_values("new")});
+        END;
+        CREATE TRIGGER IF NOT EXISTS sessions_fts_update AFTER UPDATE OF transcript, summary_json ON sessions BEGIN
+            DELETE FROM sessions_fts WHERE rowid = old.rowid;
+            INSERT INTO sessions_fts ({_FTS_COLUMNS}) VALUES ({_fts_values("new")});
+        END;
+        CREATE TRIGGER IF NOT EXISTS sessions_fts_delete AFTER DELETE ON sessions BEGIN
+            DELETE FROM sessions_fts WHERE rowid = old.rowid;
+        END;
+    """),
+    # Per-year case number sequence (replaces COUNT(*) ... LIKE 'CASE-YYYY-%' per create)
+    (9, "case_sequences", """
+        CREATE TABLE IF NOT EXISTS case_sequences (
+            year TEXT PRIMARY KEY,
+            last_value INTEGER NOT NULL
+        );
+        INSERT OR REPLACE INTO case_sequences (year, last_value)
+            SELECT substr(case_id, 6, 4), MAX(CAST(substr(case_id, 11) AS INTEGER))
+            FROM cases WHERE case_id GLOB 'CASE-[0-9][0-9][0-9][0-9]-[0-9]*'
+            GROUP BY substr(case_id, 6, 4);
+    """),
+    (10, "case_aggregates", _case_aggregates_sql()),
+    (11, "row_versions", _row_versions_sql()),
+    # Re-key sessions_fts: the implicit rowid of sessions (TEXT primary key) may
+    # change on VACUUM; search_id is an INTEGER PRIMARY KEY and stays put
+    (12, "session_search_ids", f"""
+        DROP TRIGGER IF EXISTS sessions_fts_insert;
+        DROP TRIGGER IF EXISTS sessions_fts_update;
+        DROP TRIGGER IF EXISTS sessions_fts_delete;
+        DROP TABLE IF EXISTS sessions_fts;
+        CREATE TABLE IF NOT EXISTS session_search_ids (
+            search_id INTEGER PRIMARY KEY,
+            session_id TEXT NOT NULL UNIQUE
+        );
+        INSERT INTO session_search_ids (session_id) SELECT session_id FROM sessions ORDER BY rowid;
+        CREATE VIRTUAL TABLE sessions_fts USING fts5(
+            transcript, title, key_points, action_items, summary,
+            tokenize = 'unicode61 remove_diacritics 2',
+            prefix = '2 3'
+        );
+        INSERT INTO sessions_fts ({_FTS_COLUMNS})
+            SELECT {_fts_values("sessions", "k.search_id")}
+            FROM sessions JOIN session_search_ids k ON k.session_id = sessions.session_id;
+        CREATE TRIGGER sessions_fts_insert AFTER INSERT ON sessions BEGIN
+            INSERT INTO session_search_ids (session_id) VALUES (new.session_id);
+            INSERT INTO sessions_fts ({_FTS_COLUMNS}) VALUES ({_fts_values("new", _search_id("new"))});
+        END;
+        CREATE TRIGGER sessions_fts_update AFTER UPDATE OF transcript, summary_json ON sessions BEGIN
+            DELETE FROM sessions_fts WHERE rowid = {_search_id("old")};
+            INSERT INTO sessions_fts ({_FTS_COLUMNS}) VALUES ({_fts_values("new", _search_id("new"))});
+        END;
+        CREATE TRIGGER sessions_fts_delete AFTER DELETE ON sessions BEGIN
+            DELETE FROM sessions_fts WHERE rowid = {_search_id("old")};
+            DELETE FROM session_search_ids WHERE session_id = old.session_id;
+        END;
+    """),
+    # At most one active job per (kind, session): JobQueue.submit dedupes via
+    # INSERT ... ON CONFLICT instead of SELECT-then-INSERT
+    (13, "jobs_active_unique", """
+        UPDATE jobs SET status = 'cancelled', finished_at = datetime('now')
+            WHERE status IN ('queued', 'running') AND EXISTS (
+                SELECT 1 FROM jobs j
+                WHERE j.kind = jobs.kind AND j.session_id IS jobs.session_id
+                  AND j.status IN ('queued', 'running')
+                  AND (j.created_at, j.job_id) < (jobs.created_at, jobs.job_id)
+            );
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_jobs_active ON jobs (kind, ifnull(session_id, ''))
+            WHERE status IN ('queued', 'running');
+    """),
+]
+
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+
+def _statements(script: str):
+    """Split an SQL script into complete statements (trigger bodies stay intact)."""
+    buf = ""
+    for line in script.splitlines(keepends=True):
+        buf += line
+        if sqlite3.complete_statement(buf):
+            yield buf.strip()
+            buf = ""
+    if buf.strip():
+        yield buf.strip()
+
+
+def current_version(conn: sqlite3.Connection) -> int:
+    row = conn.execute("SELECT MAX(version) FROM schema_version").fetchone()
+    return row[0] or 0
+
+
+def migrate(conn: sqlite3.Connection) -> int:
+    """Apply all pending migrations in one write transaction. Returns the schema version."""
+    conn.isolation_level = None
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS schema_version (
+            version INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            applied_at TEXT NOT NULL
+        )
+    """)
+    if current_version(conn) >= LATEST_VERSION:
+        return LATEST_VERSION
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        # Re-read under the write lock: another process may have migrated meanwhile.
+        version = current_version(conn)
+        for step_version, name, step in MIGRATIONS:
+            if step_version <= version:
+                continue
+            if callable(step):
+                step(conn)
+            else:
+                for stmt in _statements(step):
+                    conn.execute(stmt)
+            conn.execute(
+                "INSERT INTO schema_version (version, name, applied_at) VALUES (?, ?, datetime('now'))",
+                (step_version, name),
+            )
+            version = step_version
+        conn.execute("COMMIT")
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    return version
@@ -0,0 +1,298 @@
+"""Auto-process pipeline: ingest -> transcribe -> summarize as concurrent stages.
+
+Each stage has its own worker threads; stages are connected by bounded
+queues, so a slow stage blocks the one before it (backpressure) instead of
+piling up work. While session N is summarized (I/O-bound, Ollama), session
+N+1 is already transcribing (CPU-bound, faster-whisper).
+
+Transcription runs as a job_queue job (an active job of the session is
+reused), so the pipeline never transcribes a session twice at once.
+"""
+import asyncio
+import logging
+import queue
+import threading
+import time
+import uuid
+from collections import deque
+from pathlib import Path
+from typing import Callable, Optional
+
+from backend.config import (
+    PIPELINE_INGEST_WORKERS,
+    PIPELINE_QUEUE_SIZE,
+    PIPELINE_SHUTDOWN_TIMEOUT,
+    PIPELINE_SUMMARIZE_WORKERS,
+    PIPELINE_TRANSCRIBE_WORKERS,
+)
+
+STAGES = ("ingest", "transcribe", "summarize")
+# Finished items kept for status queries
+HISTORY_SIZE = 200
+
+log = logging.getLogger("zyquraflow")
+_thread_state = threading.local()
+
+
+def _thread_loop() -> asyncio.AbstractEventLoop:
+    """One event loop per summarize worker thread (keeps the provider's pooled client alive)."""
+    loop = getattr(_thread_state, "loop", None)
+    if loop is None:
+        loop = _thread_state.loop = asyncio.new_event_loop()
+    return loop
+
+
+def _close_thread_loop() -> None:
+    """Worker exit: close this thread's pooled LLM client, then its event loop."""
+    loop = getattr(_thread_state, "loop", None)
+    if loop is None:
+        return
+    _thread_state.loop = None
+    from backend.llm import get_llm
+    try:
+        loop.run_until_complete(get_llm().aclose())
+    except Exception:
+        log.exception("Closing the LLM client of %s failed", threading.current_thread().name)
+    finally:
+        loop.close()
+
+
+def _wait_for_transcription(job_id: str) -> None:
+    from backend.jobs import job_queue
+    job = job_queue.wait(job_id)
+    if job is None or job["status"] != "done":
+        detail = (job["error"] or job["status"]) if job else "unknown job"
+        raise ValueError(f"Transcription job {job_id} did not finish: {detail}")
+
+
+def _ingest(item: dict) -> None:
+    from backend.services import session_service
+    if item.get("session_id") is None:
+        session = session_service.create_session(case_id=item.get("case_id"))
+        item["session_id"] = session["session_id"]
+        session_service.update_audio(item["session_id"], Path(item["source"]))
+    else:
+        session_service.check_transcribable(item["session_id"])
+
+
+def _transcribe(item: dict) -> None:
+    from backend.services import session_service
+    item["job_id"] = session_service.enqueue_transcription(item["session_id"])["job_id"]
+    _wait_for_transcription(item["job_id"])
+
+
+def _summarize(item: dict) -> None:
+    from backend.services import session_service
+    job = session_service.active_transcription(item["session_id"])
+    if job is not None:  # transcription restarted meanwhile: summarize its result
+        _wait_for_transcription(job["job_id"])
+    _thread_loop().run_until_complete(session_service.summarize_session(item["session_id"]))
+
+
+class Pipeline:
+    """Bounded-queue stage pipeline. Stage functions take the item dict (injectable for tests).
+
+    submit()/submit_session() never block: the intake queue in front of
+    ingest is unbounded; the queues between stages hold queue_size items.
+    """
+
+    def __init__(
+        self,
+        ingest_workers: int = PIPELINE_INGEST_WORKERS,
+        transcribe_workers: int = PIPELINE_TRANSCRIBE_WORKERS,
+        summarize_workers: int = PIPELINE_SUMMARIZE_WORKERS,
+        queue_size: int = PIPELINE_QUEUE_SIZE,
+        stage_fns: Optional[dict] = None,
+    ):
+        self.workers = {"ingest": ingest_workers, "transcribe": transcribe_workers, "summarize": summarize_workers}
+        self.stage_fns: dict = {"ingest": _ingest, "transcribe": _transcribe, "summarize": _summarize}
+        self.stage_fns.update(stage_fns or {})
+        self._queues = {
+            "ingest": queue.Queue(),
+            "transcribe": queue.Queue(maxsize=queue_size),
+            "summarize": queue.Queue(maxsize=queue_size),
+        }
+        self._threads: list = []
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._active: dict = {}  # item_id -> item
+        self._finished: deque = deque(maxlen=HISTORY_SIZE)
+        self._stats = {stage: {"processed": 0, "failed": 0, "busy_seconds": 0.0} for stage in STAGES}
+        self._started_at: Optional[float] = None
+        self._stopping = False
+
+    def start(self) -> "Pipeline":
+        with self._lock:
+            if self._threads:
+                return self
+            self._started_at = time.time()
+            for stage in STAGES:
+                for i in range(max(1, self.workers[stage])):
+                    t = threading.Thread(target=self._work, args=(stage,), name=f"zyq-pipe-{stage}-{i}", daemon=True)
+                    t.start()
+                    self._threads.append(t)
+        return self
+
+    def _new_item(self, **fields) -> dict:
+        item = {
+            "item_id": uuid.uuid4().hex,
+            "session_id": None,
+            "source": None,
+            "case_id": None,
+            "stage": "ingest",
+            "status": "queued",
+            "error": None,
+            "timings": {},
+            "submitted_at": time.time(),
+            **fields,
+        }
+        with self._lock:
+            self._active[item["item_id"]] = item
+        self._queues["ingest"].put(item)
+        return dict(item)
+
+    def submit(self, source, case_id: Optional[str] = None) -> dict:
+        """Queue an audio file: new session (in case_id) -> transcribe -> summarize."""
+        return self._new_item(source=str(source), case_id=case_id)
+
+    def submit_session(self, session_id: str) -> dict:
+        """Queue an existing session with audio for transcribe -> summarize."""
+        return self._new_item(session_id=session_id)
+
+    def _work(self, stage: str) -> None:
+        fn: Callable = self.stage_fns[stage]
+        next_stage = STAGES[STAGES.index(stage) + 1] if stage != STAGES[-1] else None
+        q = self._queues[stage]
+        while True:
+            item = q.get()
+            if item is None:
+                _close_thread_loop()
+                return
+            if self._stopping:
+                self._finish(item, "pipeline stopped")
+                continue
+            item["stage"], item["status"] = stage, "running"
+            t0 = time.perf_counter()
+            try:
+                fn(item)
+                error = None
+            except Exception as e:
+                error = str(e) or type(e).__name__
+                if not isinstance(e, ValueError):
+                    log.exception("Pipeline stage %s failed for %s", stage, item.get("session_id") or item["source"])
+            elapsed = time.perf_counter() - t0
+            item["timings"][stage] = round(elapsed, 3)
+            with self._lock:
+                stats = self._stats[stage]
+                stats["busy_seconds"] += elapsed
+                stats["processed" if error is None else "failed"] += 1
+            if error is None and next_stage is not None:
+                item["status"] = "queued"
+                self._queues[next_stage].put(item)  # blocks while the next stage is saturated
+            else:
+                self._finish(item, error)
+
+    def _finish(self, item: dict, error: Optional[str]) -> None:
+        item["status"] = "done" if error is None else "failed"
+        item["error"] = error
+        item["finished_at"] = time.time()
+        with self._lock:
+            self._active.pop(item["item_id"], None)
+            self._finished.append(item)
+            self._idle.notify_all()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until every submitted item is done or failed."""
+        with self._lock:
+            return self._idle.wait_for(lambda: not self._active, timeout)
+
+    def close(self, drain: bool = True, timeout: Optional[float] = None) -> bool:
+        """Stop the workers. drain=True finishes queued work first; otherwise items
+        not yet started fail with "pipeline stopped" (running stage calls complete).
+
+        With a timeout, gives up waiting after that many seconds overall and
+        leaves busy workers (daemon threads) behind. Returns whether all stopped.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        def remaining() -> Optional[float]:
+            return None if deadline is None else max(0.0, deadline - time.monotonic())
+
+        if drain:
+            self.wait(remaining())
+        self._stopping = True
+        stopped = True
+        # Stage by stage, so no worker is left blocked on a full queue downstream
+        for stage in STAGES:
+            threads = [t for t in self._threads if t.name.startswith(f"zyq-pipe-{stage}-")]
+            try:
+                for _ in threads:
+                    self._queues[stage].put(None, timeout=remaining())
+            except queue.Full:
+                stopped = False
+                break
+            for t in threads:
+                t.join(remaining())
+                stopped = stopped and not t.is_alive()
+        with self._lock:
+            self._threads = []
+        self._stopping = False
+        return stopped
+
+    def items(self) -> list:
+        with self._lock:
+            return [dict(i) for i in list(self._active.values()) + list(self._finished)]
+
+    def stats(self) -> dict:
+        with self._lock:
+            done = sum(1 for i in self._finished if i["status"] == "done")
+            elapsed = time.time() - self._started_at if self._started_at else 0.0
+            return {
+                "running": bool(self._threads),
+                "active": len(self._active),
+                "done": done,
+                "failed": sum(1 for i in self._finished if i["status"] == "failed"),
+                "sessions_per_hour": round(done / elapsed * 3600, 1) if elapsed and done else 0.0,
+                "stages": {
+                    stage: {
+                        "workers": self.workers[stage],
+                        "queued": self._queues[stage].qsize(),
+                        **{k: round(v, 3) if isinstance(v, float) else v for k, v in self._stats[stage].items()},
+                    }
+                    for stage in STAGES
+                },
+            }
+
+
+def run_folder(paths: list, case_id: Optional[str] = None, **pipeline_kwargs) -> tuple:
+    """Process audio files through a fresh pipeline. Returns (items, wall_seconds)."""
+    p = Pipeline(**pipeline_kwargs).start()
+    t0 = time.perf_counter()
+    for path in paths:
+        p.submit(path, case_id=case_id)
+    p.wait()
+    wall = time.perf_counter() - t0
+    p.close()
+    return p.items(), wall
+
+
+_pipeline: Optional[Pipeline] = None
+_pipeline_lock = threading.Lock()
+
+
+def get_pipeline() -> Pipeline:
+    """The app's pipeline, started on first use."""
+    global _pipeline
+    with _pipeline_lock:
+        if _pipeline is None:
+            _pipeline = Pipeline().start()
+        return _pipeline
+
+
+def shutdown_pipeline(timeout: Optional[float] = PIPELINE_SHUTDOWN_TIMEOUT) -> None:
+    """Stop the app's pipeline; workers still busy after timeout seconds are abandoned."""
+    global _pipeline
+    with _pipeline_lock:
+        p, _pipeline = _pipeline, None
+    if p is not None and not p.close(drain=False, timeout=timeout):
+        log.warning("Pipeline workers still busy after %ss; not waiting for them", timeout)
@@ -1,24 +1,112 @@
-"""Load prompts by ID from prompts/ directory."""
+"""Load prompts by ID from prompts/ directory.
+
+Prompt files are compiled once into literal parts and {placeholder} slots and
+rendered in a single pass; a file is re-read only when its mtime changes.
+"""
+import re
+import threading
 from pathlib import Path
+from typing import NamedTuple, Optional
 
 from backend.config import PROMPTS_ROOT
 
 PROMPT_IDS = {
     "summary.v0.1": "summary_v01.md",
     "fix_json.v0.1": "fix_json_v01.md",
+    "summary_chunk.v0.1": "summary_chunk_v01.md",
+    "summary_reduce.v0.1": "summary_reduce_v01.md",
 }
 
+# Rough token estimate for budgeting (no tokenizer for local models): ~4 chars/token
+CHARS_PER_TOKEN = 4
+
+_PLACEHOLDER_RE = re.compile(r"\{(\w+)\}")
+
+
+def estimate_tokens(text: str) -> int:
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+class RenderedPrompt(NamedTuple):
+    prompt_id: str
+    text: str
+    tokens: int
+
+
+class PromptTemplate:
+    """A prompt file split into literal text and placeholder names (odd indices of parts)."""
+
+    def __init__(self, prompt_id: str, text: str, mtime_ns: int = 0):
+        self.prompt_id = prompt_id
+        self.mtime_ns = mtime_ns
+        self.parts = _PLACEHOLDER_RE.split(text)
+        self.placeholders = frozenset(self.parts[1::2])
+
+    def render(self, **kwargs) -> str:
+        """Substitute {key} once per slot; values are inserted verbatim, so braces
+        inside a transcript are never substituted. Slots without a kwarg stay as-is
+        (JSON examples in the prompt text)."""
+        out = self.parts[:]
+        for i in range(1, len(out), 2):
+            name = out[i]
+            out[i] = str(kwargs[name]) if name in kwargs else "{" + name + "}"
+        return "".join(out)
+
+
+class PromptRegistry:
+    """Compiled templates by prompt ID, reloaded when the file changes on disk.
+
+    Keeps per-prompt render counts and token estimates for /api/system/stats.
+    """
+
+    def __init__(self, root: Optional[Path] = None, prompt_ids: Optional[dict] = None):
+        self.root = root
+        self.prompt_ids = PROMPT_IDS if prompt_ids is None else prompt_ids
+        self._lock = threading.Lock()
+        self._templates: dict = {}
+        self._stats: dict = {}
+        self.loads = 0
+
+    def template(self, prompt_id: str) -> PromptTemplate:
+        filename = self.prompt_ids.get(prompt_id)
+        if not filename:
+            raise ValueError(f"Unknown prompt ID: {prompt_id}")
+        path = (self.root or PROMPTS_ROOT) / filename
+        try:
+            mtime_ns = path.stat().st_mtime_ns
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Prompt file not found: {path}") from None
+        tpl = self._templates.get(prompt_id)
+        if tpl is None or tpl.mtime_ns != mtime_ns:
+            tpl = PromptTemplate(prompt_id, path.read_text(encoding="utf-8"), mtime_ns)
+            with self._lock:
+                self._templates[prompt_id] = tpl
+                self.loads += 1
+        return tpl
+
+    def render(self, prompt_id: str, **kwargs) -> RenderedPrompt:
+        text = self.template(prompt_id).render(**kwargs)
+        tokens = estimate_tokens(text)
+        with self._lock:
+            s = self._stats.setdefault(prompt_id, {"renders": 0, "last_tokens": 0, "max_tokens": 0})
+            s["renders"] += 1
+            s["last_tokens"] = tokens
+            s["max_tokens"] = max(s["max_tokens"], tokens)
+        return RenderedPrompt(prompt_id, text, tokens)
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._stats.clear()
+            self.loads = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"loads": self.loads, "prompts": {k: dict(v) for k, v in self._stats.items()}}
+
+
+prompt_registry = PromptRegistry()
+
 
 def load_prompt(prompt_id: str, **kwargs: str) -> str:
     """Load prompt by ID and format with kwargs."""
-    filename = PROMPT_IDS.get(prompt_id)
-    if not filename:
-        raise ValueError(f"Unknown prompt ID: {prompt_id}")
-    path = PROMPTS_ROOT / filename
-    if not path.exists():
-        raise FileNotFoundError(f"Prompt file not found: {path}")
-    text = path.read_text(encoding="utf-8")
-    # Simple placeholder replacement {key}
-    for k, v in kwargs.items():
-        text = text.replace("{" + k + "}", str(v))
-    return text
+    return prompt_registry.render(prompt_id, **kwargs).text
@@ -1,6 +1,8 @@
 """LLM provider interface."""
+import asyncio
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from typing import AsyncIterator
 
 
 @dataclass
@@ -9,9 +11,55 @@ class LLMResponse:
     model: str
     prompt_id: str
     duration_ms: float
+    mock: bool = False  # fallback text, not produced by a model (never cached)
+    cached: bool = False  # served from the LLM response cache
+
+
+class MockText(str):
+    """A streamed chunk that is mock fallback text rather than model output."""
+
+
+class CachedText(str):
+    """A streamed chunk served from the LLM response cache."""
 
 
 class LLMProvider(ABC):
     @abstractmethod
     async def complete(self, prompt: str, model: str, prompt_id: str, **kwargs) -> LLMResponse:
         pass
+
+    async def stream(self, prompt: str, model: str, prompt_id: str, **kwargs) -> AsyncIterator[str]:
+        """Yield the completion as text chunks. Default: one chunk from complete()."""
+        resp = await self.complete(prompt, model, prompt_id, **kwargs)
+        yield MockText(resp.text) if resp.mock else resp.text
+
+    async def health(self, timeout: float = 2.0) -> bool:
+        """Whether the backing service is reachable."""
+        return False
+
+    async def aclose(self) -> None:
+        """Release pooled connections (app shutdown)."""
+
+
+class BoundedProvider(LLMProvider):
+    """Wraps a provider so at most `limit` completions run at once (e.g. a batch
+    sharing the Ollama server's parallel slots)."""
+
+    def __init__(self, inner: LLMProvider, limit: int):
+        self.inner = inner
+        self._semaphore = asyncio.Semaphore(max(1, limit))
+
+    async def complete(self, prompt: str, model: str, prompt_id: str, **kwargs) -> LLMResponse:
+        async with self._semaphore:
+            return await self.inner.complete(prompt, model, prompt_id, **kwargs)
+
+    async def stream(self, prompt: str, model: str, prompt_id: str, **kwargs) -> AsyncIterator[str]:
+        async with self._semaphore:
+            async for chunk in self.inner.stream(prompt, model, prompt_id, **kwargs):
+                yield chunk
+
+    async def health(self, timeout: float = 2.0) -> bool:
+        return await self.inner.health(timeout)
+
+    async def aclose(self) -> None:
+        await self.inner.aclose()
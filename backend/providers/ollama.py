@@ -1,39 +1,123 @@
 """Ollama LLM provider with mock fallback when Ollama is unavailable."""
+import asyncio
 import json
 import time
+import weakref
 from dataclasses import dataclass
+from typing import AsyncIterator
 
 import httpx
 
-from backend.providers.base import LLMProvider, LLMResponse
+from backend.providers.base import LLMProvider, LLMResponse, MockText
 
 
 @dataclass
 class OllamaConfig:
     base_url: str = "http://localhost:11434"
+    connect_timeout: float = 5.0
+    read_timeout: float = 120.0
+    max_connections: int = 8
+    max_keepalive_connections: int = 4
+    keepalive_expiry: float = 60.0
 
 
 class OllamaProvider(LLMProvider):
+    """Talks to Ollama over one pooled keep-alive httpx.AsyncClient.
+
+    httpx clients are bound to the event loop they first run on, so there is
+    one client per loop (normally just the server loop); aclose() on shutdown.
+    """
+
     def __init__(self, config: OllamaConfig | None = None):
         self.config = config or OllamaConfig()
+        self._clients = weakref.WeakKeyDictionary()  # event loop -> AsyncClient
+
+    def _client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                base_url=self.config.base_url,
+                timeout=httpx.Timeout(self.config.read_timeout, connect=self.config.connect_timeout),
+                limits=httpx.Limits(
+                    max_connections=self.config.max_connections,
+                    max_keepalive_connections=self.config.max_keepalive_connections,
+                    keepalive_expiry=self.config.keepalive_expiry,
+                ),
+            )
+            self._clients[loop] = client
+        return client
+
+    async def aclose(self) -> None:
+        """Close the client of the running loop.
+
+        A client can only be closed on its own loop: each loop that used the
+        provider (server, pipeline workers) calls aclose() before it ends.
+        """
+        client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+    async def health(self, timeout: float = 2.0) -> bool:
+        try:
+            r = await self._client().get("/api/tags", timeout=timeout)
+            return r.status_code == 200
+        except Exception:
+            return False
+
+    @staticmethod
+    def _generate_body(prompt: str, model: str, stream: bool, **kwargs) -> dict:
+        """/api/generate payload. format (a JSON schema or "json") constrains the output."""
+        body = {"model": model, "prompt": prompt, "stream": stream}
+        if kwargs.get("format") is not None:
+            body["format"] = kwargs["format"]
+        if kwargs.get("options"):
+            body["options"] = kwargs["options"]
+        return body
 
     async def complete(self, prompt: str, model: str, prompt_id: str, **kwargs) -> LLMResponse:
         start = time.perf_counter()
         try:
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                r = await client.post(
-                    f"{self.config.base_url}/api/generate",
-                    json={"model": model, "prompt": prompt, "stream": False},
-                )
-                if r.status_code != 200:
-                    return self._mock_response(prompt, model, prompt_id, start)
-                data = r.json()
-                text = data.get("response", "")
+            r = await self._client().post(
+                "/api/generate",
+                json=self._generate_body(prompt, model, False, **kwargs),
+            )
+            if r.status_code != 200:
+                return self._mock_response(prompt, model, prompt_id, start)
+            data = r.json()
+            text = data.get("response", "")
         except Exception:
             return self._mock_response(prompt, model, prompt_id, start)
         duration_ms = (time.perf_counter() - start) * 1000
         return LLMResponse(text=text, model=model, prompt_id=prompt_id, duration_ms=duration_ms)
 
+    async def stream(self, prompt: str, model: str, prompt_id: str, **kwargs) -> AsyncIterator[str]:
+        """Token streaming via Ollama's NDJSON stream; mock text if Ollama is unavailable."""
+        start = time.perf_counter()
+        got_tokens = False
+        try:
+            async with self._client().stream(
+                "POST",
+                "/api/generate",
+                json=self._generate_body(prompt, model, True, **kwargs),
+            ) as r:
+                if r.status_code == 200:
+                    async for line in r.aiter_lines():
+                        if not line.strip():
+                            continue
+                        data = json.loads(line)
+                        token = data.get("response", "")
+                        if token:
+                            got_tokens = True
+                            yield token
+                        if data.get("done"):
+                            break
+        except (httpx.HTTPError, ValueError):
+            if got_tokens:
+                raise
+        if not got_tokens:
+            yield MockText(self._mock_response(prompt, model, prompt_id, start).text)
+
     def _mock_response(self, prompt: str, model: str, prompt_id: str, start: float) -> LLMResponse:
         """Return mocked JSON when Ollama is unavailable."""
         duration_ms = (time.perf_counter() - start) * 1000
@@ -58,4 +142,5 @@ class OllamaProvider(LLMProvider):
             model=model,
             prompt_id=prompt_id,
             duration_ms=duration_ms,
+            mock=True,
         )
@@ -0,0 +1,126 @@
+"""HTTP response encoding: fast JSON rendering and gzip/brotli compression."""
+import gzip
+import json
+from typing import Optional
+
+from fastapi.responses import JSONResponse
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+
+from backend.config import COMPRESS_BROTLI_QUALITY, COMPRESS_GZIP_LEVEL, COMPRESS_MIN_BYTES
+
+try:
+    import orjson
+except ImportError:  # optional: stdlib json fallback
+    orjson = None
+
+try:
+    import brotli
+except ImportError:  # optional: gzip only
+    brotli = None
+
+# Bodies above this are compressed in a worker thread, not on the event loop
+THREAD_MIN_BYTES = 256 * 1024
+
+
+def dumps(content) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson when installed.
+
+    Endpoints that return it directly skip FastAPI's jsonable_encoder pass;
+    do that only with DTOs that are already dicts/lists of str, int, float,
+    bool and None.
+    """
+
+    def render(self, content) -> bytes:
+        return dumps(content)
+
+
+def choose_encoding(accept_encoding: str) -> Optional[str]:
+    """"br" or "gzip" from an Accept-Encoding header (brotli only when installed)."""
+    accepted = set()
+    for item in accept_encoding.lower().split(","):
+        coding, _, params = item.strip().partition(";")
+        q = params.strip()
+        if q.startswith("q="):
+            try:
+                if float(q[2:]) <= 0:
+                    continue
+            except ValueError:
+                continue
+        accepted.add(coding.strip())
+    if brotli is not None and "br" in accepted:
+        return "br"
+    if "gzip" in accepted or "*" in accepted:
+        return "gzip"
+    return None
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=COMPRESS_BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=COMPRESS_GZIP_LEVEL, mtime=0)
+
+
+class CompressionMiddleware:
+    """Compress complete responses of at least minimum_size bytes with br or gzip.
+
+    Streaming responses (SSE, NDJSON; more_body=True), 206/304 and bodies
+    that already have a Content-Encoding pass through unchanged. A strong
+    ETag becomes weak on the compressed representation.
+    """
+
+    def __init__(self, app, minimum_size: int = COMPRESS_MIN_BYTES):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        start: dict = {}
+        passthrough = False
+
+        async def send_compressed(message) -> None:
+            nonlocal passthrough
+            if message["type"] == "http.response.start":
+                start.update(message)
+                return
+            if passthrough or message["type"] != "http.response.body":
+                await send(message)
+                return
+            passthrough = True  # only the first body message can be compressed
+            body = message.get("body", b"")
+            headers = MutableHeaders(raw=start["headers"])
+            if (
+                message.get("more_body", False)
+                or len(body) < self.minimum_size
+                or start["status"] in (206, 304)
+                or "content-encoding" in headers
+            ):
+                await send(start)
+                await send(message)
+                return
+            if len(body) >= THREAD_MIN_BYTES:
+                body = await run_in_threadpool(compress, body, encoding)
+            else:
+                body = compress(body, encoding)
+            headers["Content-Encoding"] = encoding
+            headers["Content-Length"] = str(len(body))
+            headers.add_vary_header("Accept-Encoding")
+            etag = headers.get("etag")
+            if etag and not etag.startswith("W/"):
+                headers["ETag"] = "W/" + etag
+            await send(start)
+            await send({**message, "body": body})
+
+        await self.app(scope, receive, send_compressed)
@@ -1,56 +1,154 @@
 """Case use case / service."""
-from backend.db import db_cursor, init_db
-from backend.storage import generate_case_id, ensure_data_root
+import json
+from typing import Optional
+
+from backend.config import CASE_BULK_MAX
+from backend.db import db_cursor
+from backend.storage import allocate_case_ids, ensure_data_root
+
+
+def _case_list_item(row) -> dict:
+    return {
+        "case_id": row["case_id"],
+        "alias": row["alias"],
+        "created_at": row["created_at"],
+        "session_count": row["session_count"],
+        "audio_bytes": row["audio_bytes"],
+        "duration_seconds": row["duration_seconds"],
+        "last_activity_at": row["last_activity_at"],
+        "status_counts": json.loads(row["status_counts"]) if row["status_counts"] else {},
+    }
 
 
 def list_cases() -> list[dict]:
-    init_db()
+    """Cases with their session aggregates (maintained by triggers on sessions, see migration 10)."""
     with db_cursor() as cur:
         cur.execute(
             """
-            SELECT c.*, COUNT(s.session_id) as session_count
+            SELECT c.case_id, c.alias, c.created_at, c.session_count, c.audio_bytes,
+                   c.duration_seconds, c.last_activity_at,
+                   (SELECT json_group_object(status, count) FROM case_status_counts
+                    WHERE case_id = c.case_id) AS status_counts
             FROM cases c
-            LEFT JOIN sessions s ON s.case_id = c.case_id
-            GROUP BY c.case_id
             ORDER BY c.created_at DESC
             """
         )
         rows = cur.fetchall()
-    return [
-        {
-            "case_id": r["case_id"],
-            "alias": r["alias"],
-            "created_at": r["created_at"],
-            "session_count": r["session_count"],
-        }
-        for r in rows
-    ]
+    return [_case_list_item(r) for r in rows]
 
 
 def create_case(alias: str) -> dict:
-    init_db()
     ensure_data_root()
-    case_id = generate_case_id()
     with db_cursor() as cur:
+        case_id = allocate_case_ids(cur)[0]
         cur.execute(
-            "INSERT INTO cases (case_id, alias, created_at) VALUES (?, ?, datetime('now'))",
+            "INSERT INTO cases (case_id, alias, created_at, last_activity_at) "
+            "VALUES (?, ?, datetime('now'), datetime('now'))",
             (case_id, alias),
         )
     return get_case(case_id)
 
 
-def get_case(case_id: str) -> dict:
-    from backend.services.session_service import list_sessions
-    init_db()
+def create_cases(aliases: list) -> list:
+    """Create many cases in one transaction (imports); all or none. Same shape as list_cases()."""
+    if not aliases:
+        raise ValueError("Keine Fälle angegeben")
+    if len(aliases) > CASE_BULK_MAX:
+        raise ValueError(f"Höchstens {CASE_BULK_MAX} Fälle pro Anfrage")
+    ensure_data_root()
     with db_cursor() as cur:
-        cur.execute("SELECT * FROM cases WHERE case_id = ?", (case_id,))
-        row = cur.fetchone()
-    if not row:
-        return None
-    sessions = list_sessions(case_id)
+        case_ids = allocate_case_ids(cur, len(aliases))
+        cur.execute("SELECT datetime('now')")
+        created_at = cur.fetchone()[0]
+        cur.executemany(
+            "INSERT INTO cases (case_id, alias, created_at, last_activity_at) VALUES (?, ?, ?, ?)",
+            [(case_id, alias, created_at, created_at) for case_id, alias in zip(case_ids, aliases)],
+        )
+    return [
+        _case_list_item({
+            "case_id": case_id, "alias": alias, "created_at": created_at, "session_count": 0,
+            "audio_bytes": 0, "duration_seconds": 0.0, "last_activity_at": created_at, "status_counts": None,
+        })
+        for case_id, alias in zip(case_ids, aliases)
+    ]
+
+
+def get_case_page(
+    case_id: str,
+    limit: Optional[int] = None,
+    after: Optional[str] = None,
+    fields: Optional[tuple] = None,
+) -> tuple:
+    """Case with one page of its sessions. Returns (case, next_cursor); case is None if missing.
+
+    fields projects the embedded sessions (default: list fields, no transcript).
+    One query: the case row LEFT JOINed to its sessions in index order.
+    """
+    from backend.services.session_service import LIST_FIELDS, _page, _select_columns, decode_cursor
+    fields = fields or LIST_FIELDS
+    join = "s.case_id = c.case_id"
+    params: list = []
+    if after:
+        join += " AND (s.created_at, s.session_id) < (?, ?)"
+        params.extend(decode_cursor(after))
+    session_cols = ", ".join(f"s.{col}" for col in _select_columns(fields).split(", "))
+    sql = (
+        f"SELECT c.alias AS case_alias, c.created_at AS case_created_at, {session_cols} "
+        f"FROM cases c LEFT JOIN sessions s ON {join} WHERE c.case_id = ? "
+        "ORDER BY s.created_at DESC, s.session_id DESC"
+    )
+    params.append(case_id)
+    if limit is not None:
+        sql += " LIMIT ?"
+        params.append(limit + 1)
+    with db_cursor() as cur:
+        cur.execute(sql, params)
+        rows = cur.fetchall()
+    if not rows:
+        return None, None
+    head = rows[0]
+    sessions, next_cursor = _page([r for r in rows if r["session_id"] is not None], limit, fields)
     return {
-        "case_id": row["case_id"],
-        "alias": row["alias"],
-        "created_at": row["created_at"],
+        "case_id": case_id,
+        "alias": head["case_alias"],
+        "created_at": head["case_created_at"],
         "sessions": sessions,
-    }
+    }, next_cursor
+
+
+def get_case(case_id: str) -> dict:
+    return get_case_page(case_id)[0]
+
+
+def cases_version() -> int:
+    """Grows with every change to cases, including their trigger-maintained aggregates."""
+    with db_cursor() as cur:
+        cur.execute("SELECT version FROM data_versions WHERE name = 'cases'")
+        return cur.fetchone()[0]
+
+
+def case_version(case_id: str) -> Optional[tuple]:
+    """Version of a case with its sessions, or None if missing. Row versions only grow,
+    so (case version, session count, newest session version) changes with any
+    change to the case row or to the set or content of its sessions."""
+    with db_cursor() as cur:
+        cur.execute(
+            "SELECT row_version, session_count, "
+            "(SELECT MAX(row_version) FROM sessions WHERE case_id = ?1) FROM cases WHERE case_id = ?1",
+            (case_id,),
+        )
+        row = cur.fetchone()
+    return tuple(row) if row else None
+
+
+def case_session_ids(case_id: str) -> list:
+    """Ids of all sessions of a case, oldest first; ValueError if the case does not exist."""
+    with db_cursor() as cur:
+        cur.execute("SELECT 1 FROM cases WHERE case_id = ?", (case_id,))
+        if cur.fetchone() is None:
+            raise ValueError(f"Case not found: {case_id}")
+        cur.execute(
+            "SELECT session_id FROM sessions WHERE case_id = ? ORDER BY created_at, session_id",
+            (case_id,),
+        )
+        return [row["session_id"] for row in cur.fetchall()]
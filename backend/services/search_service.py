@@ -0,0 +1,99 @@
+"""Full-text search over transcripts and summaries (SQLite FTS5, table sessions_fts)."""
+import html
+import re
+from typing import Optional
+
+from backend.db import db_cursor
+
+MAX_QUERY_TERMS = 16
+_TERM_RE = re.compile(r"\w+", re.UNICODE)
+# bm25 column weights: transcript, title, key_points, action_items, summary
+_BM25 = "bm25(sessions_fts, 1.0, 5.0, 2.0, 2.0, 2.0)"
+# snippet() match markers (private-use code points): swapped for <mark> after escaping
+_MARK_OPEN, _MARK_CLOSE = "\ue000", "\ue001"
+
+
+def fts_query(q: str) -> str:
+    """User input -> FTS5 MATCH expression: all words must match (AND), the last
+    one as a prefix (search-as-you-type). Operators/quotes in the input are not
+    interpreted, so any text is a valid query."""
+    terms = _TERM_RE.findall(q or "")[:MAX_QUERY_TERMS]
+    if not terms:
+        raise ValueError("Suchbegriff fehlt")
+    quoted = [f'"{t}"' for t in terms]
+    quoted[-1] += "*"
+    return " ".join(quoted)
+
+
+def _snippet_html(raw: Optional[str]) -> Optional[str]:
+    """Escape transcript text; only the match highlights become markup."""
+    if raw is None:
+        return None
+    return html.escape(raw, quote=False).replace(_MARK_OPEN, "<mark>").replace(_MARK_CLOSE, "</mark>")
+
+
+def search_sessions(q: str, case_id: Optional[str] = None, limit: int = 20, offset: int = 0) -> list:
+    """Best matches first (bm25 over all matches; title weighs most), with a
+    highlighted snippet each: HTML-escaped text with <mark> around matches.
+
+    FTS rowids are session_search_ids.search_id. Rowid sets are applied as
+    "+rowid IN (...)" inside a rowid range: a plain rowid IN would make FTS5
+    re-run the (prefix) query once per row.
+    """
+    match = fts_query(q)
+    with db_cursor() as cur:
+        if case_id:
+            case_ids = (
+                "SELECT k.search_id FROM sessions s "
+                "JOIN session_search_ids k ON k.session_id = s.session_id WHERE s.case_id = ?2"
+            )
+            cur.execute(
+                f"""
+                SELECT rowid, {_BM25} AS score FROM sessions_fts
+                WHERE sessions_fts MATCH ?1
+                  AND rowid BETWEEN (SELECT min(search_id) FROM ({case_ids}))
+                                AND (SELECT max(search_id) FROM ({case_ids}))
+                  AND +rowid IN ({case_ids})
+                ORDER BY score LIMIT ?3 OFFSET ?4
+                """,
+                (match, case_id, limit, offset),
+            )
+        else:
+            cur.execute(
+                f"SELECT rowid, {_BM25} AS score FROM sessions_fts WHERE sessions_fts MATCH ? "
+                "ORDER BY score LIMIT ? OFFSET ?",
+                (match, limit, offset),
+            )
+        ranked = [(r["rowid"], r["score"]) for r in cur.fetchall()]
+        if not ranked:
+            return []
+        marks = ",".join("?" * len(ranked))
+        rowids = [rowid for rowid, _ in ranked]
+        cur.execute(
+            "SELECT rowid, snippet(sessions_fts, -1, ?, ?, '…', 16) AS snippet "
+            "FROM sessions_fts WHERE sessions_fts MATCH ? AND rowid BETWEEN ? AND ? "
+            f"AND +rowid IN ({marks})",
+            [_MARK_OPEN, _MARK_CLOSE, match, min(rowids), max(rowids), *rowids],
+        )
+        snippets = {r["rowid"]: _snippet_html(r["snippet"]) for r in cur.fetchall()}
+        cur.execute(
+            "SELECT k.search_id, s.session_id, s.case_id, s.created_at, s.status, "
+            "json_extract(CASE WHEN json_valid(s.summary_json) THEN s.summary_json END, '$.title') AS title "
+            "FROM session_search_ids k JOIN sessions s ON s.session_id = k.session_id "
+            f"WHERE k.search_id IN ({marks})",
+            rowids,
+        )
+        sessions = {r["search_id"]: r for r in cur.fetchall()}
+    return [
+        {
+            "session_id": sessions[rowid]["session_id"],
+            "case_id": sessions[rowid]["case_id"],
+            "created_at": sessions[rowid]["created_at"],
+            "status": sessions[rowid]["status"],
+            "title": sessions[rowid]["title"],
+            "snippet": snippets.get(rowid),
+            "score": round(-score, 4),
+        }
+        for rowid, score in ranked
+        if rowid in sessions
+    ]
@@ -1,42 +1,111 @@
 """Session use case / service."""
+import asyncio
+import base64
 import json
+import logging
+import time
 from pathlib import Path
-
-from backend.db import db_cursor, init_db
-from backend.storage import generate_session_dir, get_session_dir, get_unlinked_session_dir
-from backend.schema import validate_summary
+from typing import Optional
+
+from backend import long_audio, map_reduce
+from backend.db import db_cursor
+from backend.jobs import JobCancelled, JobContext, job_queue
+from backend.json_stream import IncrementalJSONParser
+from backend.llm_cache import cached, commit_validated
+from backend.llm_metrics import summary_metrics
+from backend.storage import (
+    AudioUpload,
+    blob_stats,
+    generate_session_dir,
+    get_session_dir,
+    get_unlinked_session_dir,
+    link_blob,
+    partial_upload_size,
+    release_blob,
+)
+from backend.schema import SUMMARY_SCHEMA, validate_summary
+from backend.summary_cache import summary_from_file, summary_from_row
+from backend.whisper_models import whisper_models
 from backend.prompts import load_prompt
 from backend.llm import get_llm, get_config
-from backend.config import DATA_ROOT
-
-
-def _session_row_to_dto(row, summary_path=None):
-    s = dict(row)
-    summary_json = None
+from backend.providers.base import BoundedProvider, CachedText, LLMResponse
+from backend.config import (
+    DATA_ROOT,
+    SUMMARY_CHUNK_TOKENS,
+    SUMMARY_PARALLELISM,
+    TRANSCRIBE_CHECKPOINT_SEGMENTS,
+    TRANSCRIBE_LANGUAGE,
+    UPLOAD_CHUNK_SIZE,
+)
+
+
+# DTO fields in response order; lists leave out the transcript unless asked for.
+SESSION_FIELDS = (
+    "session_id", "case_id", "created_at", "audio_path", "audio_sha256", "summary_path",
+    "file_size", "duration", "status", "transcript", "summary",
+)
+LIST_FIELDS = tuple(f for f in SESSION_FIELDS if f != "transcript")
+
+# DTO field -> sessions columns it is built from
+_FIELD_COLUMNS = {
+    "summary": ("summary_json", "summary_path"),
+}
+
+
+def parse_fields(spec: Optional[str], default: tuple = SESSION_FIELDS) -> tuple:
+    """Parse a fields= projection ("session_id,status,summary"). Unknown names raise ValueError."""
+    if not spec:
+        return default
+    fields = tuple(dict.fromkeys(f.strip() for f in spec.split(",") if f.strip()))
+    unknown = [f for f in fields if f not in SESSION_FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+    return fields or default
+
+
+def _select_columns(fields: tuple) -> str:
+    # session_id and created_at are always needed for cursors and summary cache keys
+    cols = {"session_id": None, "created_at": None}
+    for f in fields:
+        for col in _FIELD_COLUMNS.get(f, (f,)):
+            cols[col] = None
+    return ", ".join(cols)
+
+
+def _summary_of(s: dict, summary_path=None):
+    if s.get("summary_json"):
+        return summary_from_row(s["session_id"], s["summary_json"])
+    # Rows summarized before migration 3 and not backfilled: read summary.json
     raw = summary_path or s.get("summary_path")
     if raw:
         path = Path(raw) if Path(raw).is_absolute() else (DATA_ROOT / raw)
-        if path.exists():
-            try:
-                summary_json = json.loads(path.read_text(encoding="utf-8"))
-            except Exception:
-                pass
-    return {
-        "session_id": s["session_id"],
-        "case_id": s["case_id"],
-        "created_at": s["created_at"],
-        "audio_path": s["audio_path"] or "",
-        "summary_path": s["summary_path"],
-        "file_size": s["file_size"] or 0,
-        "duration": s["duration"],
-        "status": s["status"] or "draft",
-        "transcript": s.get("transcript"),
-        "summary": summary_json,
-    }
+        return summary_from_file(path)
+    return None
+
+
+_DTO_BUILDERS = {
+    "session_id": lambda s: s["session_id"],
+    "case_id": lambda s: s["case_id"],
+    "created_at": lambda s: s["created_at"],
+    "audio_path": lambda s: s["audio_path"] or "",
+    "audio_sha256": lambda s: s.get("audio_sha256"),
+    "summary_path": lambda s: s["summary_path"],
+    "file_size": lambda s: s["file_size"] or 0,
+    "duration": lambda s: s["duration"],
+    "status": lambda s: s["status"] or "draft",
+    "transcript": lambda s: s.get("transcript"),
+}
+
+
+def _session_row_to_dto(row, summary_path=None, fields: tuple = SESSION_FIELDS):
+    s = dict(row)
+    dto = {}
+    for f in fields:
+        dto[f] = _summary_of(s, summary_path) if f == "summary" else _DTO_BUILDERS[f](s)
+    return dto
 
 
 def create_session(case_id=None) -> dict:
-    init_db()
     session_dir, session_id = generate_session_dir(case_id)
     case_for_db = case_id if case_id and case_id != "_unlinked" else None
 
@@ -51,35 +120,100 @@ def create_session(case_id=None) -> dict:
     return get_session(session_id)
 
 
-def list_sessions(case_id=None) -> list:
-    init_db()
+def encode_cursor(created_at: str, session_id: str) -> str:
+    """Opaque keyset cursor for the session list (position after this row)."""
+    raw = json.dumps([created_at, session_id], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, session_id = json.loads(raw)
+    except Exception:
+        raise ValueError("Invalid cursor")
+    if not isinstance(created_at, str) or not isinstance(session_id, str):
+        raise ValueError("Invalid cursor")
+    return created_at, session_id
+
+
+def list_sessions_page(
+    case_id=None,
+    limit: Optional[int] = None,
+    after: Optional[str] = None,
+    fields: tuple = LIST_FIELDS,
+) -> tuple:
+    """Sessions newest first, keyset-paginated. Returns (items, next_cursor).
+
+    Ordered by (created_at, session_id) DESC so the indexes from migration 2
+    serve both the filter and the sort; next_cursor is None on the last page.
+    Only the columns behind the requested fields are selected.
+    """
+    where, params = [], []
+    if case_id:
+        where.append("case_id = ?")
+        params.append(case_id)
+    if after:
+        where.append("(created_at, session_id) < (?, ?)")
+        params.extend(decode_cursor(after))
+    sql = f"SELECT {_select_columns(fields)} FROM sessions"
+    if where:
+        sql += " WHERE " + " AND ".join(where)
+    sql += " ORDER BY created_at DESC, session_id DESC"
+    if limit is not None:
+        sql += " LIMIT ?"
+        params.append(limit + 1)
     with db_cursor() as cur:
-        if case_id:
-            cur.execute(
-                "SELECT * FROM sessions WHERE case_id = ? ORDER BY created_at DESC",
-                (case_id,),
-            )
-        else:
-            cur.execute("SELECT * FROM sessions ORDER BY created_at DESC")
+        cur.execute(sql, params)
         rows = cur.fetchall()
+    return _page(rows, limit, fields)
+
+
+def _page(rows: list, limit: Optional[int], fields: tuple) -> tuple:
+    """(dtos, next_cursor) from rows fetched newest first with LIMIT limit + 1."""
+    next_cursor = None
+    if limit is not None and len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1]["created_at"], rows[-1]["session_id"])
     from backend.db import row_to_dict
-    return [_session_row_to_dto(row_to_dict(r)) for r in rows]
+    return [_session_row_to_dto(row_to_dict(r), fields=fields) for r in rows], next_cursor
+
+
+def list_sessions(
+    case_id=None,
+    limit: Optional[int] = None,
+    after: Optional[str] = None,
+    fields: tuple = LIST_FIELDS,
+) -> list:
+    return list_sessions_page(case_id, limit, after, fields)[0]
+
+
+def sessions_version() -> int:
+    """Grows with every insert/update/delete on sessions (migration 11); versions list responses."""
+    with db_cursor() as cur:
+        cur.execute("SELECT version FROM data_versions WHERE name = 'sessions'")
+        return cur.fetchone()[0]
 
 
-def get_session(session_id: str):
-    init_db()
+def session_version(session_id: str) -> Optional[int]:
     with db_cursor() as cur:
-        cur.execute("SELECT * FROM sessions WHERE session_id = ?", (session_id,))
+        cur.execute("SELECT row_version FROM sessions WHERE session_id = ?", (session_id,))
+        row = cur.fetchone()
+    return row[0] if row else None
+
+
+def get_session(session_id: str, fields: tuple = SESSION_FIELDS):
+    with db_cursor() as cur:
+        cur.execute(f"SELECT {_select_columns(fields)} FROM sessions WHERE session_id = ?", (session_id,))
         row = cur.fetchone()
     if not row:
         return None
     from backend.db import row_to_dict
-    return _session_row_to_dto(row_to_dict(row))
+    return _session_row_to_dto(row_to_dict(row), fields=fields)
 
 
 def _resolve_session_path(session_id: str):
     """Find session dir; return (path, case_id)."""
-    init_db()
     with db_cursor() as cur:
         cur.execute("SELECT case_id FROM sessions WHERE session_id = ?", (session_id,))
         row = cur.fetchone()
@@ -91,25 +225,59 @@ def _resolve_session_path(session_id: str):
     return get_unlinked_session_dir(session_id), None
 
 
-def update_audio(session_id: str, file_path: Path, file_size: int) -> dict:
-    init_db()
+def begin_audio_upload(session_id: str, filename: str, resume: bool = False) -> AudioUpload:
+    """Open a streaming upload into the session directory (see storage.AudioUpload)."""
     session_path, _ = _resolve_session_path(session_id)
-    dest = session_path / f"audio{file_path.suffix}"
-    if file_path != dest:
-        import shutil
-        shutil.copy2(file_path, dest)
-    rel = str(dest.relative_to(DATA_ROOT))
+    return AudioUpload(session_path, Path(filename).suffix, resume=resume)
+
 
+def audio_upload_offset(session_id: str) -> int:
+    """Bytes already received for a resumable upload of this session."""
+    session_path, _ = _resolve_session_path(session_id)
+    return partial_upload_size(session_path)
+
+
+def finish_audio_upload(session_id: str, upload: AudioUpload) -> dict:
+    """Move a completed upload into place, share it with identical audio (content-addressed
+    blob store) and record size and SHA-256."""
+    dest = upload.commit()
+    link_blob(dest, upload.sha256)
+    return _set_audio(session_id, dest, upload.size, upload.sha256)
+
+
+def _set_audio(session_id: str, dest: Path, file_size: int, sha256: Optional[str]) -> dict:
+    rel = str(dest.relative_to(DATA_ROOT))
     with db_cursor() as cur:
+        cur.execute("SELECT audio_path, audio_sha256 FROM sessions WHERE session_id = ?", (session_id,))
+        row = cur.fetchone()
         cur.execute(
-            "UPDATE sessions SET audio_path = ?, file_size = ?, status = 'uploaded' WHERE session_id = ?",
-            (rel, file_size, session_id),
+            "UPDATE sessions SET audio_path = ?, file_size = ?, audio_sha256 = ?, status = 'uploaded' "
+            "WHERE session_id = ?",
+            (rel, file_size, sha256, session_id),
         )
+    previous = row["audio_path"] if row else None
+    if previous and previous != rel:
+        # Replaced by an upload with a different extension
+        (DATA_ROOT / previous).unlink(missing_ok=True)
+    if row and row["audio_sha256"] != sha256:
+        release_blob(row["audio_sha256"])
     return get_session(session_id)
 
 
+def update_audio(session_id: str, file_path: Path) -> dict:
+    """Import an existing audio file (copied in chunks, hashed on the way)."""
+    upload = begin_audio_upload(session_id, file_path.name)
+    try:
+        with open(file_path, "rb") as src:
+            for chunk in iter(lambda: src.read(UPLOAD_CHUNK_SIZE), b""):
+                upload.write(chunk)
+    except BaseException:
+        upload.abort()
+        raise
+    return finish_audio_upload(session_id, upload)
+
+
 def update_transcript(session_id: str, transcript: str) -> dict:
-    init_db()
     with db_cursor() as cur:
         cur.execute(
             "UPDATE sessions SET transcript = ? WHERE session_id = ?",
@@ -118,21 +286,55 @@ def update_transcript(session_id: str, transcript: str) -> dict:
     return get_session(session_id)
 
 
-_whisper_models = {}  # model_id -> WhisperModel (Cache pro Modell)
+def _whisper_model_id() -> str:
+    return get_config().get("whisper_model") or "base"
 
 
-def _get_whisper_model():
-    model_id = get_config().get("whisper_model") or "base"
-    if model_id not in _whisper_models:
-        from faster_whisper import WhisperModel
-        _whisper_models[model_id] = WhisperModel(model_id, device="cpu", compute_type="int8")
-    return _whisper_models[model_id]
+def _get_whisper_model(workers: int = 1):
+    return whisper_models.get(_whisper_model_id(), workers)
 
 
-def transcribe_session(session_id: str) -> dict:
-    """Speech-to-Text: Audio der Sitzung transkribieren, Transkript speichern."""
-    init_db()
-    s = get_session(session_id)
+def _cached_transcription(sha256: Optional[str], model_id: str, language: str) -> Optional[tuple]:
+    """(segments, duration) of an earlier transcription of the same audio, or None."""
+    if not sha256:
+        return None
+    with db_cursor() as cur:
+        cur.execute(
+            "SELECT segments_json, duration FROM transcript_cache "
+            "WHERE audio_sha256 = ? AND whisper_model = ? AND language = ?",
+            (sha256, model_id, language),
+        )
+        row = cur.fetchone()
+    if row is None:
+        return None
+    return json.loads(row["segments_json"]), row["duration"]
+
+
+def audio_store_stats() -> dict:
+    """Deduplicated audio blobs and cached transcriptions."""
+    with db_cursor() as cur:
+        cur.execute("SELECT COUNT(*) FROM transcript_cache")
+        cached = cur.fetchone()[0]
+    return {**blob_stats(), "transcripts_cached": cached}
+
+
+def _store_transcription(
+    sha256: Optional[str], model_id: str, language: str, segments: list, transcript: str, duration: Optional[float]
+) -> None:
+    if not sha256:
+        return
+    with db_cursor() as cur:
+        cur.execute(
+            "INSERT OR REPLACE INTO transcript_cache "
+            "(audio_sha256, whisper_model, language, transcript, segments_json, duration, created_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, datetime('now'))",
+            (sha256, model_id, language, transcript, json.dumps(segments, ensure_ascii=False), duration),
+        )
+
+
+def check_transcribable(session_id: str) -> Path:
+    """Audio file of the session; ValueError if there is nothing to transcribe."""
+    s = get_session(session_id, fields=("audio_path",))
     if not s:
         raise ValueError(f"Session not found: {session_id}")
     audio_rel = (s.get("audio_path") or "").strip()
@@ -141,72 +343,320 @@ def transcribe_session(session_id: str) -> dict:
     audio_path = DATA_ROOT / audio_rel
     if not audio_path.exists():
         raise ValueError(f"Audiodatei nicht gefunden: {audio_path}")
-    model = _get_whisper_model()
-    segments, _ = model.transcribe(str(audio_path), language=None)
-    text = " ".join(seg.text for seg in segments).strip()
-    return update_transcript(session_id, text)
+    return audio_path
+
+
+def iter_transcription(session_id: str, ctx: Optional[JobContext] = None):
+    """Transcribe and yield each segment ({index, start, end, text}) as soon as it is decoded.
+
+    The transcript so far is saved every TRANSCRIBE_CHECKPOINT_SEGMENTS segments,
+    so a crash keeps the completed part; the full text is saved at the end.
+    With a job context, progress (segment end vs. audio duration) is reported
+    and cancellation is checked after every segment. Recordings longer than
+    LONG_AUDIO_MIN_SECONDS go through the parallel long-audio mode.
+    """
+    audio_path = check_transcribable(session_id)
+    sha256 = get_session(session_id, fields=("audio_sha256",)).get("audio_sha256")
+    model_id = _whisper_model_id()
+    language = TRANSCRIBE_LANGUAGE or "auto"
+    hit = _cached_transcription(sha256, model_id, language)
+    if hit is not None:
+        # Same audio already transcribed with this model (e.g. uploaded to another session)
+        segments, duration = hit
+        yield from segments
+        if ctx is not None:
+            ctx.report(1.0)
+        _save_transcript(session_id, " ".join(seg["text"] for seg in segments).strip(), duration)
+        return
+
+    duration = long_audio.probe_duration(audio_path)
+    workers = long_audio.workers_for(duration)
+    model = _get_whisper_model(workers)
+    if workers > 1:
+        segments = long_audio.transcribe_long(model, audio_path, workers, language=TRANSCRIBE_LANGUAGE)
+    else:
+        segments, info = model.transcribe(str(audio_path), language=TRANSCRIBE_LANGUAGE)
+        duration = getattr(info, "duration", None) or duration
+    duration = duration or 0
+    texts = []
+    done = []
+    for i, seg in enumerate(segments):
+        texts.append(seg.text)
+        if ctx is not None:
+            ctx.check_cancelled()
+            if duration:
+                ctx.report(seg.end / duration)
+        if (i + 1) % TRANSCRIBE_CHECKPOINT_SEGMENTS == 0:
+            _save_transcript(session_id, " ".join(texts).strip())
+        out = {"index": i, "start": seg.start, "end": seg.end, "text": seg.text.strip()}
+        done.append(out)
+        yield out
+    transcript = " ".join(texts).strip()
+    _save_transcript(session_id, transcript, duration or None)
+    _store_transcription(sha256, model_id, language, done, transcript, duration or None)
+
+
+def _save_transcript(session_id: str, text: str, duration: Optional[float] = None) -> None:
+    with db_cursor() as cur:
+        if duration:
+            cur.execute(
+                "UPDATE sessions SET transcript = ?, duration = ? WHERE session_id = ?",
+                (text, duration, session_id),
+            )
+        else:
+            cur.execute("UPDATE sessions SET transcript = ? WHERE session_id = ?", (text, session_id))
+
+
+def transcribe_session(session_id: str, ctx: Optional[JobContext] = None) -> dict:
+    """Speech-to-Text: Audio der Sitzung transkribieren, Transkript speichern."""
+    for _ in iter_transcription(session_id, ctx=ctx):
+        pass
+    return get_session(session_id)
+
+
+def enqueue_transcription(session_id: str) -> dict:
+    """Validate the session and queue a background transcription job. Returns the job."""
+    check_transcribable(session_id)
+    return job_queue.submit("transcribe", session_id)
+
+
+def start_live_transcription(session_id: str) -> Optional[dict]:
+    """Register a live (SSE) transcription as a running transcribe job.
+
+    None if the session already has an active transcribe job; otherwise run
+    it with iter_live_transcription(job).
+    """
+    check_transcribable(session_id)
+    return job_queue.start_inline("transcribe", session_id)
+
+
+def iter_live_transcription(job: dict):
+    """Segments of a start_live_transcription() job. The job ends as done, failed,
+    or cancelled (cancel via /api/jobs, or the generator closed early)."""
+    status, error = "cancelled", None
+    try:
+        yield from iter_transcription(job["session_id"], ctx=JobContext(job_queue, job["job_id"]))
+        status = "done"
+    except JobCancelled:
+        raise ValueError("Transkription abgebrochen") from None
+    except Exception as e:
+        status, error = "failed", str(e)
+        raise
+    finally:
+        job_queue.finish(job["job_id"], status, error)
+
+
+def active_transcription(session_id: str) -> Optional[dict]:
+    """The queued or running transcribe job of the session, if any."""
+    return job_queue.active("transcribe", session_id)
+
+
+def _transcribe_job(session_id: str, ctx: JobContext) -> None:
+    transcribe_session(session_id, ctx=ctx)
+
 
+job_queue.register("transcribe", _transcribe_job)
 
-async def summarize_session(session_id: str) -> dict:
-    import time
-    import logging
-    init_db()
-    s = get_session(session_id)
+
+def check_summarizable(session_id: str) -> str:
+    """Transcript of the session; ValueError if there is nothing to summarize."""
+    s = get_session(session_id, fields=("transcript",))
     if not s:
         raise ValueError(f"Session not found: {session_id}")
     transcript = s.get("transcript") or ""
     if not transcript.strip():
         raise ValueError("No transcript to summarize")
+    return transcript
 
-    cfg = get_config()
-    llm = get_llm()
-    prompt = load_prompt("summary.v0.1", transcript=transcript)
-    t0 = time.perf_counter()
-    resp = await llm.complete(prompt, cfg["model"], "summary.v0.1")
+
+def _log_llm_call(cfg: dict, prompt_id: str, resp) -> None:
     if cfg.get("debug"):
         logging.getLogger("zyquraflow").info(
-            "LLM call: prompt_id=summary.v0.1 model=%s params={} duration_ms=%.0f%s",
+            "LLM call: prompt_id=%s model=%s params={} duration_ms=%.0f output_len=%d",
+            prompt_id,
             cfg["model"],
             resp.duration_ms,
-            " output_len=%d" % len(resp.text) if cfg.get("debug") else "",
+            len(resp.text),
         )
 
-    # Parse and validate
+
+async def _summary_prompt(transcript: str, cfg: dict, llm) -> tuple:
+    """(prompt_id, prompt) of the final summary call. Transcripts over the chunk
+    budget are first summarized per chunk (map); the final call then merges them."""
+    if map_reduce.estimate_tokens(transcript) <= SUMMARY_CHUNK_TOKENS:
+        return "summary.v0.1", load_prompt("summary.v0.1", transcript=transcript)
+    prompt = await map_reduce.reduce_prompt_for(
+        llm,
+        cfg["model"],
+        transcript,
+        on_response=lambda resp: _log_llm_call(cfg, resp.prompt_id, resp),
+    )
+    return "summary_reduce.v0.1", prompt
+
+
+async def summarize_session(session_id: str, use_cache: bool = True, cfg: dict = None, llm=None) -> dict:
+    """Summarize one session. Batches pass one cfg and (bounded, cached) llm for all sessions."""
+    transcript = check_summarizable(session_id)
+    cfg = cfg or get_config()
+    llm = llm or cached(get_llm(), use_cache)
+    prompt_id, prompt = await _summary_prompt(transcript, cfg, llm)
+    resp = await llm.complete(prompt, cfg["model"], prompt_id, format=SUMMARY_SCHEMA)
+    _log_llm_call(cfg, prompt_id, resp)
+    return await _store_summary(session_id, resp.text, cfg, llm, from_cache=getattr(resp, "cached", False))
+
+
+async def stream_summary(session_id: str, use_cache: bool = True):
+    """Summarize with token streaming. Yields ("field", {name, value}) per completed
+    top-level summary field, then ("done", session) once validated and stored."""
+    transcript = check_summarizable(session_id)
+    cfg = get_config()
+    llm = cached(get_llm(), use_cache)
+    prompt_id, prompt = await _summary_prompt(transcript, cfg, llm)
+    parser = IncrementalJSONParser()
+    chunks = []
+    t0 = time.perf_counter()
+    async for token in llm.stream(prompt, cfg["model"], prompt_id, format=SUMMARY_SCHEMA):
+        chunks.append(token)
+        for name, value in parser.feed(token):
+            yield "field", {"name": name, "value": value}
+    text = "".join(chunks)
+    _log_llm_call(cfg, prompt_id, LLMResponse(text, cfg["model"], prompt_id, (time.perf_counter() - t0) * 1000))
+    from_cache = bool(chunks) and isinstance(chunks[0], CachedText)
+    yield "done", await _store_summary(session_id, text, cfg, llm, from_cache=from_cache)
+
+
+async def _store_summary(session_id: str, text: str, cfg: dict, llm, from_cache: bool = False) -> dict:
+    """Validate LLM output (one fix_json repair round if invalid) and store it.
+
+    Only validated output is committed to the LLM response cache; from_cache
+    (served from that cache) is counted apart from fresh generations.
+    """
     try:
-        data = json.loads(resp.text)
+        data = json.loads(text)
     except json.JSONDecodeError:
         data = None
 
     valid, err = validate_summary(data) if data else (False, "Invalid JSON")
-    if not valid:
-        # Repair retry
-        fix_prompt = load_prompt("fix_json.v0.1", invalid_json=resp.text)
-        resp2 = await llm.complete(fix_prompt, cfg["model"], "fix_json.v0.1")
+    if valid:
+        summary_metrics.record(cfg["model"], "cached" if from_cache else "valid")
+        await commit_validated(text)
+    else:
+        # Repair retry (rare with schema-constrained output, counted per model)
+        fix_prompt = load_prompt("fix_json.v0.1", invalid_json=text)
+        resp2 = await llm.complete(fix_prompt, cfg["model"], "fix_json.v0.1", format=SUMMARY_SCHEMA)
+        _log_llm_call(cfg, "fix_json.v0.1", resp2)
         try:
             data = json.loads(resp2.text)
         except json.JSONDecodeError:
+            summary_metrics.record(cfg["model"], "failed")
             raise ValueError(f"Summary validation failed: {err}. Repair failed.")
         valid, err = validate_summary(data)
         if not valid:
+            summary_metrics.record(cfg["model"], "failed")
             raise ValueError(f"Summary validation failed after repair: {err}")
+        summary_metrics.record(cfg["model"], "repaired")
+        await commit_validated(resp2.text)
 
     session_path, _ = _resolve_session_path(session_id)
     summary_path = session_path / "summary.json"
-    summary_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    summary_text = json.dumps(data, indent=2)
+    summary_path.write_text(summary_text, encoding="utf-8")
     rel_summary = str(summary_path.relative_to(DATA_ROOT))
 
     with db_cursor() as cur:
         cur.execute(
-            "UPDATE sessions SET summary_path = ?, status = 'summarized' WHERE session_id = ?",
-            (rel_summary, session_id),
+            "UPDATE sessions SET summary_path = ?, summary_json = ?, status = 'summarized' WHERE session_id = ?",
+            (rel_summary, summary_text, session_id),
         )
     return get_session(session_id)
 
 
+def _batch_candidates(session_ids: list, force: bool) -> dict:
+    """session_id -> None (to summarize) or a skip/failure result."""
+    with db_cursor() as cur:
+        rows = {}
+        for i in range(0, len(session_ids), 500):
+            part = session_ids[i:i + 500]
+            cur.execute(
+                "SELECT session_id, status, length(trim(coalesce(transcript, ''))) > 0 AS has_transcript "
+                f"FROM sessions WHERE session_id IN ({','.join('?' * len(part))})",
+                part,
+            )
+            rows.update({row["session_id"]: row for row in cur.fetchall()})
+    plan = {}
+    for sid in session_ids:
+        row = rows.get(sid)
+        if row is None:
+            plan[sid] = {"session_id": sid, "status": "failed", "error": f"Session not found: {sid}"}
+        elif not row["has_transcript"]:
+            plan[sid] = {"session_id": sid, "status": "skipped", "reason": "no_transcript"}
+        elif row["status"] == "summarized" and not force:
+            plan[sid] = {"session_id": sid, "status": "skipped", "reason": "already_summarized"}
+        else:
+            plan[sid] = None
+    return plan
+
+
+async def iter_summarize_batch(session_ids: list, force: bool = False, use_cache: bool = True):
+    """Summarize many sessions; yields one result dict per session as each finishes.
+
+    Config and provider are looked up once; LLM calls of all sessions share
+    SUMMARY_PARALLELISM slots (match Ollama's OLLAMA_NUM_PARALLEL). Sessions
+    already summarized (unless force) or without transcript are skipped.
+    Closing the generator early (client gone) cancels the sessions still
+    running or waiting for a slot.
+    """
+    session_ids = list(dict.fromkeys(session_ids))
+    plan = _batch_candidates(session_ids, force)
+    for sid in session_ids:
+        if plan[sid] is not None:
+            yield plan[sid]
+    todo = [sid for sid in session_ids if plan[sid] is None]
+    if not todo:
+        return
+    cfg = get_config()
+    llm = BoundedProvider(cached(get_llm(), use_cache), SUMMARY_PARALLELISM)
+
+    async def run(sid: str) -> dict:
+        try:
+            await summarize_session(sid, cfg=cfg, llm=llm)
+            return {"session_id": sid, "status": "summarized"}
+        except Exception as e:
+            if not isinstance(e, ValueError):
+                logging.getLogger("zyquraflow").exception("Batch summarize of %s failed", sid)
+            return {"session_id": sid, "status": "failed", "error": str(e)}
+
+    tasks = [asyncio.ensure_future(run(sid)) for sid in todo]
+    try:
+        for done in asyncio.as_completed(tasks):
+            yield await done
+    finally:
+        pending = [t for t in tasks if not t.done()]
+        for t in pending:
+            t.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+async def summarize_batch(session_ids: list, force: bool = False, use_cache: bool = True) -> dict:
+    """Summarize many sessions; per-session results in input order plus counts."""
+    by_id = {}
+    async for result in iter_summarize_batch(session_ids, force=force, use_cache=use_cache):
+        by_id[result["session_id"]] = result
+    results = [by_id[sid] for sid in dict.fromkeys(session_ids)]
+    return batch_summary(results)
+
+
+def batch_summary(results: list) -> dict:
+    counts = {
+        status: sum(1 for r in results if r["status"] == status)
+        for status in ("summarized", "skipped", "failed")
+    }
+    return {"total": len(results), **counts, "results": results}
+
+
 def link_session(session_id: str, case_id: str) -> None:
     from backend.storage import move_session_to_case
     from backend.services import case_service
-    init_db()
     if case_service.get_case(case_id) is None:
         raise ValueError(f"Case not found: {case_id}")
     with db_cursor() as cur:
@@ -222,7 +672,6 @@ def link_session(session_id: str, case_id: str) -> None:
 
 def unlink_session(session_id: str) -> None:
     from backend.storage import move_session_to_case
-    init_db()
     with db_cursor() as cur:
         cur.execute("SELECT case_id FROM sessions WHERE session_id = ?", (session_id,))
         row = cur.fetchone()
@@ -1,4 +1,6 @@
 """Filesystem storage for sessions and cases."""
+import hashlib
+import os
 import shutil
 import uuid
 from pathlib import Path
@@ -7,27 +9,30 @@ from typing import Optional
 
 from backend.config import DATA_ROOT
 
+PARTIAL_UPLOAD_NAME = ".audio-upload.part"
+
 
 def ensure_data_root():
     DATA_ROOT.mkdir(parents=True, exist_ok=True)
     (DATA_ROOT / "cases").mkdir(exist_ok=True)
 
 
-def generate_case_id(db_conn=None) -> str:
-    """Generate next case ID. Pass DB conn to avoid reinit, or None to use default."""
+def allocate_case_ids(cur, count: int = 1) -> list:
+    """Reserve count consecutive case IDs of the current year.
+
+    One upsert on case_sequences: it takes the write lock, so concurrent
+    creators serialize and never get the same number. Run it in the same
+    transaction as the INSERT into cases (a rollback returns the numbers).
+    """
     yyyy = datetime.now().strftime("%Y")
-    from backend.db import get_conn, init_db
-    init_db()
-    conn = db_conn or get_conn()
-    cur = conn.cursor()
     cur.execute(
-        "SELECT COUNT(*) FROM cases WHERE case_id LIKE ?",
-        (f"CASE-{yyyy}-%",),
+        "INSERT INTO case_sequences (year, last_value) VALUES (?, ?) "
+        "ON CONFLICT (year) DO UPDATE SET last_value = last_value + excluded.last_value "
+        "RETURNING last_value",
+        (yyyy, count),
     )
-    n = cur.fetchone()[0] + 1
-    if not db_conn:
-        conn.close()
-    return f"CASE-{yyyy}-{n:04d}"
+    last = cur.fetchone()[0]
+    return [f"CASE-{yyyy}-{n:04d}" for n in range(last - count + 1, last + 1)]
 
 
 def generate_session_dir(case_id: Optional[str]) -> tuple:
@@ -70,3 +75,129 @@ def move_session_to_case(session_id: str, from_case: Optional[str], to_case: str
         dst.mkdir(parents=True, exist_ok=True)
     return dst
 
+
+class AudioUpload:
+    """Streams an upload into a temp file inside the session directory.
+
+    SHA-256 and size are computed while writing; commit() moves the file into
+    place with os.replace (same directory, so no copy). resume=True appends to
+    the session's partial upload instead (resumable chunked uploads); its
+    digest is computed once when the upload is committed.
+    """
+
+    def __init__(self, session_dir: Path, suffix: str, resume: bool = False):
+        session_dir.mkdir(parents=True, exist_ok=True)
+        self.session_dir = session_dir
+        self.suffix = suffix
+        if resume:
+            self.tmp_path = session_dir / PARTIAL_UPLOAD_NAME
+            self.size = partial_upload_size(session_dir)
+            self._sha = None
+            self._fh = open(self.tmp_path, "ab")
+        else:
+            self.tmp_path = session_dir / f".audio-{uuid.uuid4().hex}{suffix}.part"
+            self.size = 0
+            self._sha = hashlib.sha256()
+            self._fh = open(self.tmp_path, "wb")
+        self._digest = None
+
+    def write(self, chunk: bytes) -> None:
+        self._fh.write(chunk)
+        if self._sha is not None:
+            self._sha.update(chunk)
+        self.size += len(chunk)
+
+    @property
+    def sha256(self) -> str:
+        return self._ensure_hashed()
+
+    def _ensure_hashed(self) -> str:
+        """Finish the digest; a resumed upload re-reads its partial file once."""
+        if self._digest is None:
+            if self._sha is None:
+                self.close()
+                self._sha = hashlib.sha256()
+                with open(self.tmp_path, "rb") as fh:
+                    for chunk in iter(lambda: fh.read(1024 * 1024), b""):
+                        self._sha.update(chunk)
+            self._digest = self._sha.hexdigest()
+        return self._digest
+
+    def close(self) -> None:
+        if not self._fh.closed:
+            self._fh.close()
+
+    def commit(self) -> Path:
+        """Atomically move the finished upload to <session_dir>/audio<suffix>."""
+        self.close()
+        self._ensure_hashed()  # resumed uploads: hash before the partial file is renamed
+        dest = self.session_dir / f"audio{self.suffix}"
+        os.replace(self.tmp_path, dest)
+        return dest
+
+    def abort(self) -> None:
+        self.close()
+        self.tmp_path.unlink(missing_ok=True)
+
+
+def partial_upload_size(session_dir: Path) -> int:
+    """Bytes received so far for a resumable upload (0 if none)."""
+    try:
+        return (session_dir / PARTIAL_UPLOAD_NAME).stat().st_size
+    except OSError:
+        return 0
+
+
+def blob_path(sha256: str) -> Path:
+    """Content-addressed location of an audio file: blobs/sha256/<ab>/<digest>."""
+    return DATA_ROOT / "blobs" / "sha256" / sha256[:2] / sha256
+
+
+def link_blob(path: Path, sha256: str) -> bool:
+    """Share one copy of identical audio between sessions via hardlinks.
+
+    If the blob exists, path is replaced by a hardlink to it (the duplicate's
+    disk space is freed); otherwise the blob becomes a hardlink to path.
+    Returns False where hardlinks are not supported (path is then left as a
+    plain copy). Files are only ever replaced, never written in place, so a
+    shared inode is never modified.
+    """
+    blob = blob_path(sha256)
+    blob.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        if blob.exists():
+            if os.path.samefile(blob, path):
+                return True
+            tmp = path.with_name(f".audio-{uuid.uuid4().hex}.link")
+            os.link(blob, tmp)
+            os.replace(tmp, path)
+        else:
+            os.link(path, blob)
+    except OSError:
+        return False
+    return True
+
+
+def release_blob(sha256: Optional[str]) -> None:
+    """Delete a blob no session file links to any more."""
+    if not sha256:
+        return
+    blob = blob_path(sha256)
+    try:
+        if blob.stat().st_nlink <= 1:
+            blob.unlink()
+    except OSError:
+        pass
+
+
+def blob_stats() -> dict:
+    """Blob count, bytes on disk and bytes saved by sharing (extra links x size)."""
+    root = DATA_ROOT / "blobs" / "sha256"
+    blobs = stored = saved = 0
+    if root.exists():
+        for blob in root.glob("*/*"):
+            st = blob.stat()
+            blobs += 1
+            stored += st.st_size
+            saved += st.st_size * max(0, st.st_nlink - 2)  # blob + first session copy
+    return {"blobs": blobs, "bytes": stored, "bytes_saved": saved}
@@ -0,0 +1,100 @@
+"""Bounded in-memory LRU for parsed summary JSON (hit/miss counters)."""
+import json
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Hashable, Optional
+
+from backend.config import SUMMARY_CACHE_MAX_BYTES
+
+
+class SummaryCache:
+    """LRU keyed by an identity (session id or file path) plus a version.
+
+    A lookup only hits if the stored version matches (the raw JSON text for
+    DB rows, mtime for files), so stale entries are never served. Entries are
+    charged by their raw size and evicted oldest-first above max_bytes.
+    """
+
+    def __init__(self, max_bytes: int = SUMMARY_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict = OrderedDict()  # key -> (version, value, size)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_or_load(self, key: Hashable, version: Any, size: int, loader: Callable[[], Any]) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == version:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+        value = loader()
+        self._put(key, version, value, size)
+        return value
+
+    def _put(self, key, version, value, size: int) -> None:
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[2]
+            if size > self.max_bytes:
+                return
+            self._entries[key] = (version, value, size)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, (_, _, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+summary_cache = SummaryCache()
+
+
+def _parse(raw: str) -> Optional[dict]:
+    try:
+        return json.loads(raw)
+    except Exception:
+        return None
+
+
+def summary_from_row(session_id: str, raw: str) -> Optional[dict]:
+    """Parsed summary from the sessions.summary_json column."""
+    return summary_cache.get_or_load(("row", session_id), raw, len(raw), lambda: _parse(raw))
+
+
+def summary_from_file(path: Path) -> Optional[dict]:
+    """Parsed summary.json for rows written before summaries lived in the DB."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return summary_cache.get_or_load(
+        ("file", str(path)),
+        st.st_mtime_ns,
+        st.st_size,
+        lambda: _parse(path.read_text(encoding="utf-8")),
+    )
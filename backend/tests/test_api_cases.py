@@ -73,3 +73,88 @@ def test_unlink_then_link_another_case(client: TestClient):
 
     r = client.get(f"/api/sessions/{sid}")
     assert r.json()["case_id"] == case2["case_id"]
+
+
+def test_get_case_paginates_sessions(client: TestClient):
+    case = client.post("/api/cases", json={"alias": "Fall P"}).json()
+    cid = case["case_id"]
+    for _ in range(3):
+        sid = client.post("/api/sessions").json()["session_id"]
+        client.post(f"/api/cases/{cid}/sessions/{sid}")
+    r = client.get(f"/api/cases/{cid}", params={"limit": 2})
+    assert r.status_code == 200
+    assert len(r.json()["sessions"]) == 2
+    cursor = r.headers["x-next-cursor"]
+    r2 = client.get(f"/api/cases/{cid}", params={"limit": 2, "after": cursor})
+    assert len(r2.json()["sessions"]) == 1
+    assert "x-next-cursor" not in r2.headers
+
+
+def test_bulk_create_cases_continues_sequence(client: TestClient):
+    first = client.post("/api/cases", json={"alias": "Einzeln"}).json()["case_id"]
+    r = client.post("/api/cases/bulk", json={"aliases": [f"Import {i}" for i in range(300)]})
+    assert r.status_code == 200
+    created = r.json()
+    assert len(created) == 300
+    prefix, n = first.rsplit("-", 1)
+    assert [c["case_id"] for c in created] == [f"{prefix}-{int(n) + i:04d}" for i in range(1, 301)]
+    assert created[0]["alias"] == "Import 0" and created[0]["session_count"] == 0
+    assert len(client.get("/api/cases").json()) == 301
+
+
+def test_bulk_create_cases_rejects_empty_and_too_many(client: TestClient, monkeypatch):
+    assert client.post("/api/cases/bulk", json={"aliases": []}).status_code == 400
+    monkeypatch.setattr("backend.services.case_service.CASE_BULK_MAX", 2)
+    assert client.post("/api/cases/bulk", json={"aliases": ["a", "b", "c"]}).status_code == 400
+    assert client.get("/api/cases").json() == []
+
+
+def test_concurrent_case_creation_gets_unique_ids():
+    from concurrent.futures import ThreadPoolExecutor
+    from backend.services import case_service
+    with ThreadPoolExecutor(8) as ex:
+        ids = list(ex.map(lambda i: case_service.create_case(f"Fall {i}")["case_id"], range(40)))
+    assert len(set(ids)) == 40
+
+
+def _recomputed(cid: str) -> dict:
+    from backend.db import db_cursor
+    with db_cursor() as cur:
+        cur.execute(
+            "SELECT COUNT(*), coalesce(SUM(file_size), 0), coalesce(SUM(duration), 0) FROM sessions WHERE case_id = ?",
+            (cid,),
+        )
+        count, size, duration = cur.fetchone()
+        cur.execute("SELECT status, COUNT(*) FROM sessions WHERE case_id = ? GROUP BY status", (cid,))
+        statuses = dict(cur.fetchall())
+    return {"session_count": count, "audio_bytes": size, "duration_seconds": duration, "status_counts": statuses}
+
+
+def test_case_aggregates_follow_session_changes(client: TestClient):
+    from backend.db import db_cursor
+    cid = client.post("/api/cases", json={"alias": "Aggregat"}).json()["case_id"]
+    other = client.post("/api/cases", json={"alias": "Anderer"}).json()["case_id"]
+    sids = [client.post("/api/sessions").json()["session_id"] for _ in range(3)]
+    for sid in sids:
+        client.post(f"/api/cases/{cid}/sessions/{sid}")
+    with db_cursor() as cur:
+        cur.execute("UPDATE sessions SET file_size = 1000, duration = 12.5, status = 'transcribed' WHERE session_id = ?",
+                    (sids[0],))
+        cur.execute("UPDATE sessions SET file_size = 500 WHERE session_id = ?", (sids[1],))
+    client.post(f"/api/sessions/{sids[2]}/unlink")
+    client.post(f"/api/cases/{other}/sessions/{sids[2]}")
+
+    cases = {c["case_id"]: c for c in client.get("/api/cases").json()}
+    expected = {
+        "session_count": 2, "audio_bytes": 1500, "duration_seconds": 12.5,
+        "status_counts": {"draft": 1, "transcribed": 1},
+    }
+    assert {k: cases[cid][k] for k in expected} == expected == _recomputed(cid)
+    assert cases[other]["session_count"] == 1 and cases[other]["status_counts"] == {"draft": 1}
+    assert cases[cid]["last_activity_at"] is not None
+
+    with db_cursor() as cur:
+        cur.execute("DELETE FROM sessions WHERE session_id = ?", (sids[0],))
+    case = next(c for c in client.get("/api/cases").json() if c["case_id"] == cid)
+    assert case["session_count"] == 1 and case["audio_bytes"] == 500
+    assert case["status_counts"] == {"draft": 1}
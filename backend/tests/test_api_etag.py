@@ -0,0 +1,82 @@
+"""API-Tests: ETag/If-None-Match (304) für Sitzungen und Fälle, Versionen per Trigger."""
+from fastapi.testclient import TestClient
+
+
+def _revalidate(client: TestClient, url: str, etag: str, **params):
+    return client.get(url, params=params, headers={"If-None-Match": etag})
+
+
+def test_session_etag_and_304(client: TestClient):
+    sid = client.post("/api/sessions").json()["session_id"]
+    r = client.get(f"/api/sessions/{sid}")
+    etag = r.headers["etag"]
+    r2 = _revalidate(client, f"/api/sessions/{sid}", etag)
+    assert r2.status_code == 304 and r2.content == b"" and r2.headers["etag"] == etag
+    # projection is part of the representation
+    assert _revalidate(client, f"/api/sessions/{sid}", etag, fields="status").status_code == 200
+
+    client.put(f"/api/sessions/{sid}/transcript", json={"transcript": "Neu"})
+    r3 = _revalidate(client, f"/api/sessions/{sid}", etag)
+    assert r3.status_code == 200 and r3.json()["transcript"] == "Neu"
+    assert r3.headers["etag"] != etag
+    assert client.get("/api/sessions/SESSION-fehlt", headers={"If-None-Match": "*"}).status_code == 404
+
+
+def test_session_list_etag_changes_with_any_session(client: TestClient):
+    client.post("/api/sessions")
+    etag = client.get("/api/sessions").headers["etag"]
+    assert _revalidate(client, "/api/sessions", etag).status_code == 304
+    assert _revalidate(client, "/api/sessions", f'W/{etag}, "anderes"').status_code == 304
+    client.post("/api/sessions")
+    r = _revalidate(client, "/api/sessions", etag)
+    assert r.status_code == 200 and len(r.json()) == 2
+
+
+def test_case_etag_follows_case_and_session_changes(client: TestClient):
+    cid = client.post("/api/cases", json={"alias": "ETag"}).json()["case_id"]
+    sid = client.post("/api/sessions").json()["session_id"]
+    etag = client.get(f"/api/cases/{cid}").headers["etag"]
+    assert _revalidate(client, f"/api/cases/{cid}", etag).status_code == 304
+
+    client.post(f"/api/cases/{cid}/sessions/{sid}")
+    r = _revalidate(client, f"/api/cases/{cid}", etag)
+    assert r.status_code == 200 and [s["session_id"] for s in r.json()["sessions"]] == [sid]
+    etag = r.headers["etag"]
+
+    # content change of an embedded session (no aggregate changes)
+    client.put(f"/api/sessions/{sid}/transcript", json={"transcript": "Text"})
+    r = _revalidate(client, f"/api/cases/{cid}", etag)
+    assert r.status_code == 200
+    etag = r.headers["etag"]
+
+    client.post(f"/api/sessions/{sid}/unlink")
+    r = _revalidate(client, f"/api/cases/{cid}", etag)
+    assert r.status_code == 200 and r.json()["sessions"] == []
+    assert client.get("/api/cases/CASE-2020-9999", headers={"If-None-Match": etag}).status_code == 404
+
+
+def test_case_list_etag(client: TestClient):
+    etag = client.get("/api/cases").headers["etag"]
+    assert _revalidate(client, "/api/cases", etag).status_code == 304
+    cid = client.post("/api/cases", json={"alias": "Neu"}).json()["case_id"]
+    r = _revalidate(client, "/api/cases", etag)
+    assert r.status_code == 200
+    etag = r.headers["etag"]
+    sid = client.post("/api/sessions").json()["session_id"]
+    assert _revalidate(client, "/api/cases", etag).status_code == 304  # unlinked session
+    client.post(f"/api/cases/{cid}/sessions/{sid}")
+    r = _revalidate(client, "/api/cases", etag)
+    assert r.status_code == 200 and r.json()[0]["session_count"] == 1
+
+
+def test_row_version_and_updated_at_are_stamped():
+    from backend.db import db_cursor
+    from backend.services import session_service
+    sid = session_service.create_session()["session_id"]
+    v1 = session_service.session_version(sid)
+    with db_cursor() as cur:
+        cur.execute("UPDATE sessions SET status = 'transcribed' WHERE session_id = ?", (sid,))
+        cur.execute("SELECT row_version, updated_at FROM sessions WHERE session_id = ?", (sid,))
+        v2, updated_at = cur.fetchone()
+    assert v2 > v1 and updated_at is not None
+    assert session_service.sessions_version() == v2
@@ -0,0 +1,131 @@
+"""API-Tests: Volltextsuche (FTS5) über Transkripte und Zusammenfassungen."""
+import json
+import sqlite3
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.db import db_cursor
+from backend.services.search_service import fts_query
+
+
+def _session(client: TestClient, transcript: str = None, summary: dict = None) -> str:
+    sid = client.post("/api/sessions").json()["session_id"]
+    if transcript:
+        client.put(f"/api/sessions/{sid}/transcript", json={"transcript": transcript})
+    if summary:
+        with db_cursor() as cur:
+            cur.execute(
+                "UPDATE sessions SET summary_json = ?, status = 'summarized' WHERE session_id = ?",
+                (json.dumps(summary), sid),
+            )
+    return sid
+
+
+def test_finds_transcript_words_with_snippet(client: TestClient):
+    hit = _session(client, "Wir haben über das Budget für das dritte Quartal gesprochen.")
+    _session(client, "Nur Smalltalk über das Wetter.")
+    r = client.get("/api/search", params={"q": "budget quartal"})
+    assert r.status_code == 200
+    results = r.json()
+    assert [res["session_id"] for res in results] == [hit]
+    assert "<mark>Budget</mark>" in results[0]["snippet"]
+
+
+def test_summary_title_ranks_above_transcript_mention(client: TestClient):
+    in_transcript = _session(client, "Am Rande ging es kurz um die Roadmap und dann um anderes.")
+    in_title = _session(client, "Kickoff.", summary={
+        "title": "Roadmap 2025", "participants": [], "key_points": ["Meilensteine"],
+        "action_items": ["Roadmap verschicken"], "summary": "Planung.",
+    })
+    results = client.get("/api/search", params={"q": "roadmap"}).json()
+    assert [res["session_id"] for res in results] == [in_title, in_transcript]
+    assert results[0]["title"] == "Roadmap 2025"
+
+
+def test_index_follows_updates_and_prefix_matches(client: TestClient):
+    sid = _session(client, "Alter Text")
+    client.put(f"/api/sessions/{sid}/transcript", json={"transcript": "Neuer Inhalt zur Präsentation"})
+    assert client.get("/api/search", params={"q": "alter"}).json() == []
+    assert client.get("/api/search", params={"q": "präsent"}).json()[0]["session_id"] == sid
+    assert client.get("/api/search", params={"q": "prasentation"}).json()[0]["session_id"] == sid
+
+
+def test_filter_by_case(client: TestClient):
+    cid = client.post("/api/cases", json={"alias": "Fall"}).json()["case_id"]
+    in_case = _session(client, "Vertrag besprochen")
+    client.post(f"/api/cases/{cid}/sessions/{in_case}")
+    _session(client, "Vertrag ebenfalls besprochen")
+    assert len(client.get("/api/search", params={"q": "vertrag"}).json()) == 2
+    results = client.get("/api/search", params={"q": "vertrag", "case_id": cid}).json()
+    assert [res["session_id"] for res in results] == [in_case]
+    client.post(f"/api/sessions/{in_case}/unlink")
+    assert client.get("/api/search", params={"q": "vertrag", "case_id": cid}).json() == []
+
+
+def test_all_matches_are_ranked_and_paged(client: TestClient):
+    best = _session(client, "Kickoff.", summary={
+        "title": "Protokoll", "participants": [], "key_points": [], "action_items": [], "summary": "S",
+    })
+    others = [_session(client, f"Protokoll Nummer {i}") for i in range(4)]
+    first = client.get("/api/search", params={"q": "protokoll", "limit": 3}).json()
+    rest = client.get("/api/search", params={"q": "protokoll", "limit": 3, "offset": 3}).json()
+    assert first[0]["session_id"] == best  # älteste Sitzung, aber bester Treffer
+    assert {res["session_id"] for res in first + rest} == {best, *others}
+
+
+def test_snippet_escapes_transcript_html(client: TestClient):
+    _session(client, "Notiz <script>alert(1)</script> zum Budget & Plan")
+    snippet = client.get("/api/search", params={"q": "budget"}).json()[0]["snippet"]
+    assert "<script>" not in snippet
+    assert "&lt;script&gt;" in snippet and "&amp;" in snippet
+    assert "<mark>Budget</mark>" in snippet
+
+
+def test_fts_syntax_in_input_is_not_interpreted():
+    assert fts_query('budget AND "q3" OR -x*') == '"budget" "AND" "q3" "OR" "x"*'
+    with pytest.raises(ValueError):
+        fts_query('"*"')
+
+
+def test_empty_query_returns_400(client: TestClient):
+    assert client.get("/api/search", params={"q": "  "}).status_code == 400
+
+
+def test_existing_sessions_are_indexed_by_migration(tmp_path):
+    from backend.migrations import migrate
+    conn = sqlite3.connect(tmp_path / "legacy.db")
+    conn.executescript("""
+        CREATE TABLE sessions (
+            session_id TEXT PRIMARY KEY, case_id TEXT, created_at TEXT NOT NULL,
+            audio_path TEXT, summary_path TEXT, file_size INTEGER DEFAULT 0,
+            duration REAL, status TEXT DEFAULT 'draft', transcript TEXT
+        );
+        INSERT INTO sessions (session_id, created_at, transcript) VALUES ('SESSION-alt', '2024-01-01', 'Archivierte Notiz');
+    """)
+    try:
+        migrate(conn)
+        hits = conn.execute(
+            "SELECT k.session_id FROM sessions_fts JOIN session_search_ids k ON k.search_id = sessions_fts.rowid "
+            "WHERE sessions_fts MATCH 'archivierte'"
+        ).fetchall()
+    finally:
+        conn.close()
+    assert hits == [("SESSION-alt",)]
+
+
+def test_index_is_keyed_by_search_id_not_rowid(client: TestClient):
+    from backend.db import DB_PATH
+    gone = _session(client, "Protokoll Alpha")
+    kept = _session(client, "Protokoll Beta")
+    with db_cursor() as cur:
+        cur.execute("DELETE FROM sessions WHERE session_id = ?", (gone,))
+    conn = sqlite3.connect(DB_PATH)
+    try:
+        conn.execute("VACUUM")
+    finally:
+        conn.close()
+    assert [r["session_id"] for r in client.get("/api/search", params={"q": "protokoll"}).json()] == [kept]
+    with db_cursor() as cur:
+        cur.execute("SELECT session_id FROM session_search_ids")
+        assert [r["session_id"] for r in cur.fetchall()] == [kept]
@@ -1,8 +1,12 @@
 """API-Tests: Zusammenfassen (mit gemocktem LLM)."""
+import json
+
 import pytest
 from unittest.mock import AsyncMock, patch
 from fastapi.testclient import TestClient
 
+from backend.conftest import sse_events
+
 
 @pytest.fixture
 def session_with_transcript(client: TestClient):
@@ -34,6 +38,7 @@ def test_summarize_returns_valid_session(client: TestClient, session_with_transc
     with patch("backend.services.session_service.get_llm") as mock_llm:
         mock_llm.return_value.complete = AsyncMock(return_value=mock_response)
         r = client.post(f"/api/sessions/{session_with_transcript}/summarize")
+        assert "properties" in mock_llm.return_value.complete.call_args.kwargs["format"]
 
     assert r.status_code == 200
     data = r.json()
@@ -44,6 +49,30 @@ def test_summarize_returns_valid_session(client: TestClient, session_with_transc
     assert data["summary_path"]
 
 
+def _resp(text: str, prompt_id: str):
+    return type("R", (), {"text": text, "model": "llama3.2", "prompt_id": prompt_id, "duration_ms": 1.0})()
+
+
+def test_repair_round_is_counted_per_model(client: TestClient, session_with_transcript):
+    """Ungültige Erstantwort: fix_json-Runde läuft und wird in /api/system/stats gezählt."""
+    valid = json.dumps({"title": "T", "participants": [], "key_points": [], "action_items": [], "summary": "S"})
+    with patch("backend.services.session_service.get_llm") as mock_llm:
+        mock_llm.return_value.complete = AsyncMock(return_value=_resp(valid, "summary.v0.1"))
+        assert client.post(f"/api/sessions/{session_with_transcript}/summarize").status_code == 200
+        mock_llm.return_value.complete = AsyncMock(
+            side_effect=[_resp('{"title": "T"', "summary.v0.1"), _resp(valid, "fix_json.v0.1")]
+        )
+        assert client.post(f"/api/sessions/{session_with_transcript}/summarize?no_cache=true").status_code == 200
+
+    model = client.get("/api/system/config").json()["model"]
+    stats = client.get("/api/system/stats").json()["summaries"][model]
+    assert stats["summaries"] == 2
+    assert stats["valid"] == 1
+    assert stats["repaired"] == 1
+    assert stats["repair_calls"] == 1
+    assert stats["repair_rate"] == 0.5
+
+
 def test_summarize_no_transcript_returns_400(client: TestClient):
     """Ohne Transkript liefert Summarize 400."""
     create = client.post("/api/sessions").json()
@@ -54,3 +83,51 @@ def test_summarize_no_transcript_returns_400(client: TestClient):
 def test_summarize_404(client: TestClient):
     r = client.post("/api/sessions/SESSION-nonexistent123/summarize")
     assert r.status_code == 400  # oder 404, je nach Implementierung
+
+
+def test_summarize_stream_emits_fields_then_session(client: TestClient, session_with_transcript):
+    """Token-Streaming: Felder kommen einzeln, sobald sie vollständig sind; am Ende die Sitzung."""
+    text = json.dumps({
+        "title": "Stream-Test",
+        "participants": ["Anna"],
+        "key_points": ["Budget, {Q3}"],
+        "action_items": [],
+        "summary": "Kurz \"zitiert\".",
+    })
+
+    async def fake_stream(prompt, model, prompt_id, **kwargs):
+        for i in range(0, len(text), 7):
+            yield text[i:i + 7]
+
+    with patch("backend.services.session_service.get_llm") as mock_llm:
+        mock_llm.return_value.stream = fake_stream
+        r = client.post(f"/api/sessions/{session_with_transcript}/summarize/stream")
+
+    assert r.status_code == 200
+    events = sse_events(r.text)
+    fields = [data["name"] for event, data in events if event == "field"]
+    assert fields == ["title", "participants", "key_points", "action_items", "summary"]
+    assert events[2][1]["value"] == ["Budget, {Q3}"]
+    event, session = events[-1]
+    assert event == "done"
+    assert session["status"] == "summarized"
+    assert session["summary"]["title"] == "Stream-Test"
+
+
+def test_summarize_stream_reports_unexpected_errors(client: TestClient, session_with_transcript):
+    async def broken_stream(prompt, model, prompt_id, **kwargs):
+        yield '{"title": "T'
+        raise ConnectionError("Ollama weg")
+
+    with patch("backend.services.session_service.get_llm") as mock_llm:
+        mock_llm.return_value.stream = broken_stream
+        r = client.post(f"/api/sessions/{session_with_transcript}/summarize/stream")
+
+    assert r.status_code == 200
+    assert sse_events(r.text)[-1] == ("error", {"detail": "Ollama weg"})
+
+
+def test_summarize_stream_no_transcript_returns_400(client: TestClient):
+    create = client.post("/api/sessions").json()
+    r = client.post(f"/api/sessions/{create['session_id']}/summarize/stream")
+    assert r.status_code == 400
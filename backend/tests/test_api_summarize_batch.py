@@ -0,0 +1,107 @@
+"""API-Tests: Sammel-Zusammenfassung (Fall, Sitzungsliste) mit begrenzter Parallelität."""
+import asyncio
+import json
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+from backend.providers.base import LLMProvider, LLMResponse
+
+VALID = json.dumps({"title": "T", "participants": [], "key_points": [], "action_items": [], "summary": "S"})
+
+
+class _SlowLLM(LLMProvider):
+    def __init__(self):
+        self.active = 0
+        self.max_active = 0
+        self.calls = 0
+
+    async def complete(self, prompt, model, prompt_id, **kwargs):
+        self.calls += 1
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0.02)
+        self.active -= 1
+        return LLMResponse(VALID, model, prompt_id, 20.0)
+
+
+def _session(client: TestClient, transcript: str = None, case_id: str = None) -> str:
+    sid = client.post("/api/sessions").json()["session_id"]
+    if case_id:
+        client.post(f"/api/cases/{case_id}/sessions/{sid}")
+    if transcript:
+        client.put(f"/api/sessions/{sid}/transcript", json={"transcript": transcript})
+    return sid
+
+
+def test_batch_summarizes_with_bounded_concurrency(client: TestClient):
+    sids = [_session(client, f"Meeting {i}") for i in range(6)]
+    llm = _SlowLLM()
+    with patch("backend.services.session_service.get_llm", return_value=llm), \
+            patch("backend.services.session_service.SUMMARY_PARALLELISM", 2):
+        r = client.post("/api/sessions/summarize", json={"session_ids": sids})
+    assert r.status_code == 200
+    data = r.json()
+    assert data["summarized"] == 6
+    assert [res["session_id"] for res in data["results"]] == sids
+    assert llm.calls == 6
+    assert llm.max_active == 2
+    assert all(client.get(f"/api/sessions/{sid}").json()["status"] == "summarized" for sid in sids)
+
+
+def test_batch_skips_summarized_unless_forced(client: TestClient):
+    done = _session(client, "Erledigt")
+    empty = _session(client)
+    llm = _SlowLLM()
+    with patch("backend.services.session_service.get_llm", return_value=llm):
+        client.post(f"/api/sessions/{done}/summarize")
+        r = client.post("/api/sessions/summarize", json={"session_ids": [done, empty, "SESSION-gibtsnicht"]})
+        assert llm.calls == 1
+        results = r.json()["results"]
+        assert results[0] == {"session_id": done, "status": "skipped", "reason": "already_summarized"}
+        assert results[1]["reason"] == "no_transcript"
+        assert results[2]["status"] == "failed"
+
+        forced = client.post("/api/sessions/summarize?no_cache=true", json={"session_ids": [done], "force": True})
+        assert forced.json()["summarized"] == 1
+        assert llm.calls == 2
+
+
+def test_case_summarize_stream_reports_each_session(client: TestClient):
+    cid = client.post("/api/cases", json={"alias": "Batch-Fall"}).json()["case_id"]
+    sids = [_session(client, f"Teil {i}", case_id=cid) for i in range(3)]
+    _session(client, "Andere Sitzung ohne Fall")
+    with patch("backend.services.session_service.get_llm", return_value=_SlowLLM()):
+        r = client.post(f"/api/cases/{cid}/summarize/stream")
+    blocks = [dict(line.split(": ", 1) for line in b.splitlines()) for b in r.text.strip().split("\n\n")]
+    progress = [json.loads(b["data"]) for b in blocks if b["event"] == "session"]
+    assert sorted(p["session_id"] for p in progress) == sorted(sids)
+    assert [p["done"] for p in progress] == [1, 2, 3]
+    assert blocks[-1]["event"] == "done"
+    assert json.loads(blocks[-1]["data"])["summarized"] == 3
+
+
+def test_case_summarize_unknown_case_404(client: TestClient):
+    assert client.post("/api/cases/CASE-0000-9999/summarize").status_code == 404
+
+
+def test_closing_the_batch_cancels_outstanding_sessions(client: TestClient):
+    from backend.services import session_service
+    sids = [_session(client, f"Meeting {i}") for i in range(4)]
+    llm = _SlowLLM()
+
+    async def first_then_close():
+        batch = session_service.iter_summarize_batch(sids)
+        first = await batch.__anext__()
+        await batch.aclose()  # wie ein getrennter SSE-Client
+        calls = llm.calls
+        await asyncio.sleep(0.1)
+        return first, calls
+
+    with patch("backend.services.session_service.get_llm", return_value=llm), \
+            patch("backend.services.session_service.SUMMARY_PARALLELISM", 1):
+        first, calls_at_close = asyncio.run(first_then_close())
+    assert first["status"] == "summarized"
+    assert llm.calls == calls_at_close  # nach dem Schließen startet kein weiterer LLM-Aufruf
+    statuses = [client.get(f"/api/sessions/{sid}").json()["status"] for sid in sids]
+    assert statuses.count("summarized") == 1
@@ -55,3 +55,43 @@ def test_list_whisper_models(client: TestClient):
     assert "models" in data
     assert "base" in data["models"]
     assert "small" in data["models"]
+
+
+def test_config_is_read_once_and_persisted(client: TestClient):
+    from backend.llm import config_store, get_config
+    before = config_store.loads
+    for _ in range(5):
+        get_config()
+    client.patch("/api/system/config", json={"model": "llama3.2:3b"})
+    assert get_config()["model"] == "llama3.2:3b"
+    assert config_store.loads == before + 1
+    config_store.invalidate()
+    assert get_config()["model"] == "llama3.2:3b"
+    assert config_store.loads == before + 2
+
+
+def test_config_subscribers_get_changed_keys_only(client: TestClient):
+    from backend.llm import config_store
+    calls = []
+    unsubscribe = config_store.subscribe(lambda changed, cfg: calls.append((changed, cfg["whisper_model"])))
+    try:
+        current = client.get("/api/system/config").json()
+        client.patch("/api/system/config", json={"whisper_model": "small", "model": current["model"]})
+        client.patch("/api/system/config", json={"whisper_model": "small"})
+        assert calls == [({"whisper_model": "small"}, "small")]
+    finally:
+        unsubscribe()
+    client.patch("/api/system/config", json={"whisper_model": "tiny"})
+    assert len(calls) == 1
+
+
+def test_first_update_after_invalidate_notifies_subscribers(client: TestClient):
+    from backend.llm import config_store
+    calls = []
+    unsubscribe = config_store.subscribe(lambda changed, cfg: calls.append(changed))
+    try:
+        config_store.invalidate()
+        client.patch("/api/system/config", json={"whisper_model": "medium"})
+        assert calls == [{"whisper_model": "medium"}]
+    finally:
+        unsubscribe()
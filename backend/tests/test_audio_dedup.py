@@ -0,0 +1,64 @@
+"""Tests: inhaltsadressierte Audio-Ablage (Hardlinks) und Transkript-Cache pro Audio-Hash."""
+import hashlib
+import os
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+from backend import storage
+from backend.conftest import FakeWhisper
+
+AUDIO = b"RIFF" + os.urandom(4096)
+
+
+def _upload(client: TestClient, data: bytes = AUDIO, filename: str = "a.wav") -> dict:
+    sid = client.post("/api/sessions").json()["session_id"]
+    return client.put(f"/api/sessions/{sid}/audio", params={"filename": filename}, content=data).json()
+
+
+def test_identical_uploads_share_one_blob(client: TestClient, tmp_path):
+    a = _upload(client)
+    b = _upload(client)
+    sha = hashlib.sha256(AUDIO).hexdigest()
+    assert a["audio_sha256"] == b["audio_sha256"] == sha
+    blob = storage.blob_path(sha)
+    assert os.path.samefile(blob, tmp_path / a["audio_path"])
+    assert os.path.samefile(blob, tmp_path / b["audio_path"])
+    assert blob.stat().st_nlink == 3
+    stats = client.get("/api/system/stats").json()["audio_store"]
+    assert stats["blobs"] == 1
+    assert stats["bytes_saved"] == len(AUDIO)
+
+
+def test_replaced_audio_releases_unused_blob(client: TestClient):
+    s = _upload(client)
+    old_blob = storage.blob_path(s["audio_sha256"])
+    client.put(f"/api/sessions/{s['session_id']}/audio", params={"filename": "b.mp3"}, content=b"ID3 neu")
+    assert not old_blob.exists()
+    assert client.get("/api/system/stats").json()["audio_store"]["blobs"] == 1
+
+
+def test_same_audio_is_transcribed_once(client: TestClient):
+    a = _upload(client)
+    b = _upload(client)
+    whisper = FakeWhisper(n=3, duration=9.0)
+    with patch("backend.services.session_service._get_whisper_model", return_value=whisper) as get_model:
+        first = client.get(f"/api/sessions/{a['session_id']}/transcribe/stream").text
+        second = client.get(f"/api/sessions/{b['session_id']}/transcribe/stream").text
+    assert get_model.call_count == 1  # second session served from transcript_cache
+    assert first.count("event: segment") == second.count("event: segment") == 3
+    sa = client.get(f"/api/sessions/{a['session_id']}").json()
+    sb = client.get(f"/api/sessions/{b['session_id']}").json()
+    assert sb["transcript"] == sa["transcript"] == "Teil 0 Teil 1 Teil 2"
+    assert sb["duration"] == 9.0
+    assert client.get("/api/system/stats").json()["audio_store"]["transcripts_cached"] == 1
+
+
+def test_other_whisper_model_is_not_served_from_cache(client: TestClient):
+    a = _upload(client)
+    b = _upload(client)
+    with patch("backend.services.session_service._get_whisper_model", return_value=FakeWhisper(n=2)) as get_model:
+        client.get(f"/api/sessions/{a['session_id']}/transcribe/stream")
+        client.patch("/api/system/config", json={"whisper_model": "small"})
+        client.get(f"/api/sessions/{b['session_id']}/transcribe/stream")
+    assert get_model.call_count == 2
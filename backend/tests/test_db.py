@@ -0,0 +1,64 @@
+"""Unit-Tests: Connection-Pool und db_cursor (WAL, Wiederverwendung, Rollback)."""
+import threading
+
+import pytest
+
+from backend.db import db_cursor, pool
+
+
+def test_cursor_reuses_connection_per_thread():
+    with db_cursor() as cur:
+        first = cur.connection
+    with db_cursor() as cur:
+        assert cur.connection is first
+
+
+def test_threads_get_own_connections():
+    with db_cursor() as cur:
+        main_conn = cur.connection
+    seen = []
+
+    def worker():
+        with db_cursor() as cur:
+            seen.append(cur.connection)
+
+    t = threading.Thread(target=worker)
+    t.start()
+    t.join()
+    assert seen and seen[0] is not main_conn
+
+
+def test_wal_mode_enabled():
+    with db_cursor() as cur:
+        cur.execute("PRAGMA journal_mode")
+        assert cur.fetchone()[0] == "wal"
+
+
+def test_rollback_on_error():
+    with pytest.raises(RuntimeError):
+        with db_cursor() as cur:
+            cur.execute("INSERT INTO config (key, value) VALUES ('rollback_probe', 'x')")
+            raise RuntimeError("boom")
+    with db_cursor() as cur:
+        cur.execute("SELECT value FROM config WHERE key = 'rollback_probe'")
+        assert cur.fetchone() is None
+
+
+def test_nested_cursor_shares_outer_transaction():
+    with pytest.raises(RuntimeError):
+        with db_cursor() as outer:
+            with db_cursor() as inner:
+                inner.execute("INSERT INTO config (key, value) VALUES ('nested_probe', 'x')")
+            raise RuntimeError("boom")
+    with db_cursor() as cur:
+        cur.execute("SELECT value FROM config WHERE key = 'nested_probe'")
+        assert cur.fetchone() is None
+
+
+def test_close_all_resets_pool():
+    with db_cursor() as cur:
+        before = cur.connection
+    pool.close_all()
+    with db_cursor() as cur:
+        assert cur.connection is not before
+        cur.execute("SELECT 1")
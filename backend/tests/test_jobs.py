@@ -0,0 +1,166 @@
+"""Tests: Hintergrund-Jobs (Transkription als Job, Fortschritt, Abbruch, Neustart)."""
+import threading
+import time
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+from backend.conftest import FakeWhisper, sse_events
+from backend.db import db_cursor
+from backend.jobs import job_queue
+
+
+def _session_with_audio(client: TestClient) -> str:
+    sid = client.post("/api/sessions").json()["session_id"]
+    client.put(f"/api/sessions/{sid}/audio", params={"filename": "a.wav"}, content=b"RIFF")
+    return sid
+
+
+def test_transcribe_job_writes_transcript_and_duration(client: TestClient, wait_for_job):
+    sid = _session_with_audio(client)
+    with patch("backend.services.session_service._get_whisper_model", return_value=FakeWhisper()):
+        job = client.post(f"/api/sessions/{sid}/transcribe").json()
+        job = wait_for_job(job["job_id"])
+    assert job["status"] == "done"
+    s = client.get(f"/api/sessions/{sid}").json()
+    assert s["transcript"] == "Teil 0 Teil 1 Teil 2 Teil 3"
+    assert s["duration"] == 40.0
+    assert client.get("/api/jobs", params={"session_id": sid}).json()[0]["job_id"] == job["job_id"]
+
+
+def test_second_transcribe_returns_active_job(client: TestClient, wait_for_job):
+    sid = _session_with_audio(client)
+    gate = threading.Event()
+    with patch("backend.services.session_service._get_whisper_model", return_value=FakeWhisper(gate=gate)):
+        first = client.post(f"/api/sessions/{sid}/transcribe").json()
+        second = client.post(f"/api/sessions/{sid}/transcribe").json()
+        gate.set()
+        wait_for_job(first["job_id"])
+    assert second["job_id"] == first["job_id"]
+
+
+def test_cancel_running_job(client: TestClient, wait_for_job):
+    sid = _session_with_audio(client)
+    gate = threading.Event()
+    with patch("backend.services.session_service._get_whisper_model", return_value=FakeWhisper(n=50, gate=gate)):
+        job = client.post(f"/api/sessions/{sid}/transcribe").json()
+        deadline = time.monotonic() + 2
+        while client.get(f"/api/jobs/{job['job_id']}").json()["status"] != "running":
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+        r = client.post(f"/api/jobs/{job['job_id']}/cancel")
+        assert r.status_code == 200
+        gate.set()
+        job = wait_for_job(job["job_id"])
+    assert job["status"] == "cancelled"
+    assert client.get(f"/api/sessions/{sid}").json()["transcript"] is None
+
+
+def test_get_job_404(client: TestClient):
+    assert client.get("/api/jobs/JOB-gibtsnicht").status_code == 404
+    assert client.post("/api/jobs/JOB-gibtsnicht/cancel").status_code == 404
+
+
+def test_queued_jobs_survive_restart(client: TestClient, wait_for_job):
+    sid = _session_with_audio(client)
+    with db_cursor() as cur:
+        cur.execute(
+            "INSERT INTO jobs (job_id, kind, session_id, status, created_at) "
+            "VALUES ('JOB-vorher', 'transcribe', ?, 'running', datetime('now'))",
+            (sid,),
+        )
+    with patch("backend.services.session_service._get_whisper_model", return_value=FakeWhisper(n=1)):
+        assert job_queue.resume() == 1
+        job = wait_for_job("JOB-vorher")
+    assert job["status"] == "done"
+    assert client.get(f"/api/sessions/{sid}").json()["transcript"] == "Teil 0"
+
+
+def test_transcribe_stream_emits_segments(client: TestClient):
+    sid = _session_with_audio(client)
+    with patch("backend.services.session_service._get_whisper_model", return_value=FakeWhisper(n=3, duration=9)):
+        r = client.get(f"/api/sessions/{sid}/transcribe/stream")
+    assert r.status_code == 200
+    assert r.headers["content-type"].startswith("text/event-stream")
+    events = sse_events(r.text)
+    assert [e for e, _ in events] == ["segment", "segment", "segment", "done"]
+    assert events[1][1] == {"index": 1, "start": 3.0, "end": 6.0, "text": "Teil 1"}
+    assert events[-1][1]["session_id"] == sid
+    assert client.get(f"/api/sessions/{sid}").json()["transcript"] == "Teil 0 Teil 1 Teil 2"
+    assert client.get(f"/api/jobs/{r.headers['X-Job-Id']}").json()["status"] == "done"
+
+
+def test_transcribe_stream_during_active_job_returns_409(client: TestClient, wait_for_job):
+    sid = _session_with_audio(client)
+    gate = threading.Event()
+    with patch("backend.services.session_service._get_whisper_model", return_value=FakeWhisper(gate=gate)):
+        job = client.post(f"/api/sessions/{sid}/transcribe").json()
+        r = client.get(f"/api/sessions/{sid}/transcribe/stream")
+        gate.set()
+        wait_for_job(job["job_id"])
+    assert r.status_code == 409
+    assert job["job_id"] in r.json()["detail"]
+
+
+def test_running_stream_is_the_active_transcription(client: TestClient):
+    from backend.services import session_service
+    sid = _session_with_audio(client)
+    gate = threading.Event()
+    responses = []
+    with patch("backend.services.session_service._get_whisper_model", return_value=FakeWhisper(n=2, gate=gate)):
+        stream = threading.Thread(target=lambda: responses.append(client.get(f"/api/sessions/{sid}/transcribe/stream")))
+        stream.start()
+        deadline = time.monotonic() + 5
+        while session_service.active_transcription(sid) is None and time.monotonic() < deadline:
+            time.sleep(0.01)
+        job = client.post(f"/api/sessions/{sid}/transcribe").json()
+        second = client.get(f"/api/sessions/{sid}/transcribe/stream")
+        gate.set()
+        stream.join(5)
+    assert second.status_code == 409
+    assert responses[0].headers["X-Job-Id"] == job["job_id"]  # kein zweiter Job neben dem Stream
+    assert client.get(f"/api/jobs/{job['job_id']}").json()["status"] == "done"
+    assert len(client.get("/api/jobs", params={"session_id": sid}).json()) == 1
+
+
+def test_transcribe_stream_without_audio_returns_400(client: TestClient):
+    sid = client.post("/api/sessions").json()["session_id"]
+    assert client.get(f"/api/sessions/{sid}/transcribe/stream").status_code == 400
+
+
+def test_partial_transcript_is_checkpointed(client: TestClient):
+    from backend.services import session_service
+    sid = _session_with_audio(client)
+    with patch("backend.services.session_service._get_whisper_model", return_value=FakeWhisper(n=5)), \
+            patch("backend.services.session_service.TRANSCRIBE_CHECKPOINT_SEGMENTS", 2):
+        stream = session_service.iter_transcription(sid)
+        for _ in range(3):
+            next(stream)
+        # Nach 2 Segmenten gesichert, obwohl die Transkription noch läuft
+        assert client.get(f"/api/sessions/{sid}").json()["transcript"] == "Teil 0 Teil 1"
+        stream.close()
+
+
+def test_concurrent_submits_create_one_job():
+    from backend.jobs import JobQueue
+    gate = threading.Event()
+    queue = JobQueue(max_workers=1)
+    queue.register("probe", lambda session_id, ctx: gate.wait(2))
+    barrier = threading.Barrier(8)
+    job_ids = []
+
+    def submit():
+        barrier.wait()
+        job_ids.append(queue.submit("probe", "SESSION-x")["job_id"])
+
+    threads = [threading.Thread(target=submit) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    gate.set()
+    queue.shutdown(wait=True)
+    assert len(set(job_ids)) == 1
+    with db_cursor() as cur:
+        cur.execute("SELECT COUNT(*) AS n FROM jobs WHERE kind = 'probe'")
+        assert cur.fetchone()["n"] == 1
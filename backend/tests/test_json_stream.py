@@ -0,0 +1,43 @@
+"""Tests: inkrementeller JSON-Parser für gestreamte LLM-Ausgaben."""
+import json
+
+from backend.json_stream import IncrementalJSONParser
+
+SUMMARY = {
+    "title": "Budget {Q3}, \"final\"",
+    "participants": ["Anna", "Bert"],
+    "key_points": [{"text": "a, b"}, "c]"],
+    "action_items": [],
+    "summary": "Backslash \\ und Ende.",
+}
+
+
+def _feed_all(text: str, step: int) -> tuple:
+    parser = IncrementalJSONParser()
+    fields = []
+    for i in range(0, len(text), step):
+        fields.extend(parser.feed(text[i:i + step]))
+    return parser, fields
+
+
+def test_fields_complete_in_order_for_any_chunking():
+    text = json.dumps(SUMMARY, ensure_ascii=False, indent=2)
+    for step in (1, 2, 3, 7, len(text)):
+        parser, fields = _feed_all(text, step)
+        assert fields == list(SUMMARY.items()), step
+        assert parser.done
+        assert parser.fields == SUMMARY
+
+
+def test_field_is_emitted_when_its_delimiter_arrives():
+    parser = IncrementalJSONParser()
+    assert parser.feed('{"title": "A", "summ') == [("title", "A")]
+    assert parser.feed('ary": "B"') == []
+    assert parser.feed("}") == [("summary", "B")]
+    assert parser.done
+
+
+def test_leading_fence_and_trailing_text_are_ignored():
+    parser, fields = _feed_all('```json\n{"title": "X"}\n```', 4)
+    assert fields == [("title", "X")]
+    assert parser.done
@@ -0,0 +1,142 @@
+"""Tests: persistenter LLM-Antwort-Cache (Schlüssel, TTL, LRU, kein Caching von Mock-Antworten)."""
+import asyncio
+import time
+from unittest.mock import AsyncMock, patch
+
+from backend.llm import get_config
+from backend.llm_cache import CachedProvider, LLMCache, cache_key
+from backend.providers.base import CachedText, LLMProvider, LLMResponse, MockText
+
+
+class _Counting(LLMProvider):
+    def __init__(self, mock: bool = False):
+        self.calls = 0
+        self.mock = mock
+
+    async def complete(self, prompt, model, prompt_id, **kwargs):
+        self.calls += 1
+        return LLMResponse(f"out:{prompt}:{self.calls}", model, prompt_id, 1.0, mock=self.mock)
+
+
+def test_key_covers_prompt_id_prompt_model_and_params():
+    base = cache_key("summary.v0.1", "p", "m", {"format": {"a": 1}})
+    assert base == cache_key("summary.v0.1", "p", "m", {"format": {"a": 1}})
+    assert len({
+        base,
+        cache_key("fix_json.v0.1", "p", "m", {"format": {"a": 1}}),
+        cache_key("summary.v0.1", "q", "m", {"format": {"a": 1}}),
+        cache_key("summary.v0.1", "p", "n", {"format": {"a": 1}}),
+        cache_key("summary.v0.1", "p", "m", {}),
+    }) == 5
+
+
+def test_repeated_call_is_served_from_cache():
+    inner = _Counting()
+    cache = LLMCache()
+    llm = CachedProvider(inner, cache)
+    first = asyncio.run(llm.complete("p", "m", "summary.v0.1"))
+    cache.commit(first.text)
+    second = asyncio.run(llm.complete("p", "m", "summary.v0.1"))
+    assert inner.calls == 1
+    assert second.text == first.text and second.cached and not first.cached
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_mock_responses_are_never_cached():
+    inner = _Counting(mock=True)
+    cache = LLMCache()
+    llm = CachedProvider(inner, cache)
+    asyncio.run(llm.complete("p", "m", "summary.v0.1"))
+    asyncio.run(llm.complete("p", "m", "summary.v0.1"))
+
+    async def stream():
+        return [c async for c in llm.stream("p", "m", "summary.v0.1")]
+
+    chunks = asyncio.run(stream())
+    assert isinstance(chunks[0], MockText)
+    assert inner.calls == 3
+    assert cache.stats()["entries"] == 0
+
+
+def test_streamed_text_is_cached_after_commit():
+    inner = _Counting()
+    cache = LLMCache()
+    llm = CachedProvider(inner, cache)
+
+    async def stream():
+        return [c async for c in llm.stream("p", "m", "summary.v0.1")]
+
+    first = "".join(asyncio.run(stream()))
+    cache.commit(first)
+    chunks = asyncio.run(stream())
+    assert "".join(chunks) == first == "out:p:1"
+    assert isinstance(chunks[0], CachedText)
+    assert inner.calls == 1
+
+
+def test_uncommitted_responses_are_not_cached():
+    inner = _Counting()
+    cache = LLMCache()
+    llm = CachedProvider(inner, cache)
+    asyncio.run(llm.complete("p", "m", "summary.v0.1"))
+    asyncio.run(llm.complete("p", "m", "summary.v0.1"))
+    assert inner.calls == 2
+    assert cache.stats()["entries"] == 0
+
+
+def test_expired_entries_are_misses():
+    cache = LLMCache(ttl_seconds=60)
+    cache.put("k", "summary.v0.1", "m", "alt")
+    with patch("backend.llm_cache.time.time", return_value=time.time() + 120):
+        assert cache.get("k") is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_least_recently_used_are_evicted_over_budget():
+    cache = LLMCache(max_bytes=25)
+    cache.put("a", "p", "m", "x" * 10)
+    time.sleep(0.01)
+    cache.put("b", "p", "m", "x" * 10)
+    time.sleep(0.01)
+    assert cache.get("a") is not None  # a is now more recent than b
+    cache.put("c", "p", "m", "x" * 10)
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+    stats = cache.stats()
+    assert stats["bytes"] <= 25
+    assert stats["evictions"] == 1
+
+
+def test_summarize_twice_calls_llm_once_unless_bypassed(client):
+    sid = client.post("/api/sessions").json()["session_id"]
+    client.put(f"/api/sessions/{sid}/transcript", json={"transcript": "Kurzes Meeting mit Anna."})
+    text = '{"title": "T", "participants": ["Anna"], "key_points": [], "action_items": [], "summary": "S"}'
+    resp = LLMResponse(text, "m", "summary.v0.1", 1.0)
+    with patch("backend.services.session_service.get_llm") as mock_llm:
+        mock_llm.return_value.complete = AsyncMock(return_value=resp)
+        for _ in range(2):
+            assert client.post(f"/api/sessions/{sid}/summarize").status_code == 200
+        assert mock_llm.return_value.complete.call_count == 1
+        assert client.post(f"/api/sessions/{sid}/summarize?no_cache=true").status_code == 200
+        assert mock_llm.return_value.complete.call_count == 2
+
+    stats = client.get("/api/system/stats").json()
+    assert stats["llm_cache"]["hits"] == 1
+    assert stats["llm_cache"]["entries"] == 1
+    # the cache hit is not a fresh generation
+    summaries = stats["summaries"][get_config()["model"]]
+    assert summaries["cached"] == 1 and summaries["valid"] == 2 and summaries["summaries"] == 2
+
+
+def test_invalid_summary_is_not_cached(client):
+    sid = client.post("/api/sessions").json()["session_id"]
+    client.put(f"/api/sessions/{sid}/transcript", json={"transcript": "Kurzes Meeting."})
+    bad = LLMResponse("kein JSON", "m", "summary.v0.1", 1.0)
+    with patch("backend.services.session_service.get_llm") as mock_llm:
+        mock_llm.return_value.complete = AsyncMock(return_value=bad)
+        for _ in range(2):
+            assert client.post(f"/api/sessions/{sid}/summarize").status_code == 400
+        # summary + fix_json per attempt, nothing replayed from the cache
+        assert mock_llm.return_value.complete.call_count == 4
+    assert client.get("/api/system/stats").json()["llm_cache"]["entries"] == 0
@@ -0,0 +1,130 @@
+"""Unit-Tests: Long-Audio-Modus (Chunk-Planung an Pausen, Merge, Worker-Anzahl)."""
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from backend.conftest import FakeWhisper
+from backend.long_audio import merge_segments, plan_chunks, transcribe_chunks, workers_for
+
+SR = 100  # Samples pro Sekunde, damit die Zahlen lesbar bleiben
+
+
+def _speech(*ranges):
+    return [{"start": a * SR, "end": b * SR} for a, b in ranges]
+
+
+def test_chunks_cut_in_silence_and_cover_audio():
+    speech = _speech((0, 50), (60, 130), (140, 200), (210, 260))
+    chunks = plan_chunks(speech, 270 * SR, sampling_rate=SR, target_s=100, max_s=300)
+    # erster Chunk endet mitten in der Pause 130..140
+    assert chunks[0] == (0, 135 * SR)
+    assert chunks[-1][1] == 270 * SR
+    for (_, prev_end), (start, _) in zip(chunks, chunks[1:]):
+        assert start == prev_end
+
+
+def test_long_speech_region_is_split_with_overlap():
+    chunks = plan_chunks(_speech((0, 700)), 700 * SR, sampling_rate=SR, target_s=100, max_s=300, overlap_s=2)
+    assert len(chunks) == 3
+    assert chunks[1][0] < chunks[0][1]  # Überlappung am harten Schnitt
+    assert chunks[-1][1] == 700 * SR
+
+
+def test_no_speech_gives_single_chunk():
+    assert plan_chunks([], 50 * SR, sampling_rate=SR) == [(0, 50 * SR)]
+
+
+def test_merge_offsets_and_drops_overlap_duplicates():
+    seg = lambda a, b, t: SimpleNamespace(start=a, end=b, text=t)  # noqa: E731
+    merged = list(merge_segments([
+        (0.0, [seg(0, 5, " Hallo"), seg(5, 10, " Welt")]),
+        (9.0, [seg(0, 0.8, " Welt"), seg(1, 4, " weiter")]),  # 9.0..9.8 doppelt
+    ]))
+    assert [s.text.strip() for s in merged] == ["Hallo", "Welt", "weiter"]
+    assert merged[-1].start == 10.0 and merged[-1].end == 13.0
+
+
+def test_workers_depend_on_duration(monkeypatch):
+    monkeypatch.setattr("backend.long_audio.LONG_AUDIO_MAX_WORKERS", 4)
+    assert workers_for(None) == 1
+    assert workers_for(60) == 1
+    assert workers_for(3 * 3600, cpu_count=8) > 1
+    assert workers_for(3 * 3600, cpu_count=1) == 1
+
+
+def test_transcribe_chunks_detects_language_once_and_keeps_order():
+    calls = []
+
+    class Model:
+        def transcribe(self, audio, language=None, vad_filter=True):
+            calls.append(language)
+            first = audio[0]
+            return iter([SimpleNamespace(start=0.0, end=1.0, text=f" {first}")]), SimpleNamespace(language="de")
+
+    audio = list(range(10))
+    segs = list(transcribe_chunks(Model(), audio, [(0, 3), (3, 6), (6, 10)], workers=3, sampling_rate=1))
+    assert [s.text.strip() for s in segs] == ["0", "3", "6"]
+    assert [s.start for s in segs] == [0.0, 3.0, 6.0]
+    assert calls[0] is None and calls[1:] == ["de", "de"]
+
+
+def test_closing_transcribe_chunks_does_not_run_remaining_chunks():
+    import threading
+    started = []
+    gate = threading.Event()
+
+    class Model:
+        def transcribe(self, audio, language=None, vad_filter=True):
+            started.append(audio[0])
+            if audio[0] >= 2:
+                gate.wait(2)
+            return iter([SimpleNamespace(start=0.0, end=1.0, text=f" {audio[0]}")]), SimpleNamespace(language="de")
+
+    audio = list(range(20))
+    chunks = [(i, i + 1) for i in range(20)]
+    gen = transcribe_chunks(Model(), audio, chunks, workers=2, sampling_rate=1)
+    assert [next(gen).text.strip(), next(gen).text.strip()] == ["0", "1"]
+    t0 = time.monotonic()
+    gen.close()  # wartet nicht auf die laufenden Chunks 2 und 3
+    assert time.monotonic() - t0 < 1
+    gate.set()
+    time.sleep(0.05)
+    assert set(started) <= {0, 1, 2, 3}  # nie mehr als workers Chunks in Arbeit, keine neuen nach close
+
+
+def test_known_language_skips_serial_detection():
+    import threading
+    barrier = threading.Barrier(3, timeout=2)
+    calls = []
+
+    class Model:
+        def transcribe(self, audio, language=None, vad_filter=True):
+            calls.append(language)
+            barrier.wait()  # alle drei Chunks laufen gleichzeitig, auch der erste
+            return iter([SimpleNamespace(start=0.0, end=1.0, text=f" {audio[0]}")]), SimpleNamespace(language="en")
+
+    audio = list(range(9))
+    segs = list(transcribe_chunks(Model(), audio, [(0, 3), (3, 6), (6, 9)], workers=3, language="de", sampling_rate=1))
+    assert [s.text.strip() for s in segs] == ["0", "3", "6"]
+    assert calls == ["de", "de", "de"]
+
+
+def test_ram_estimate_counts_workers():
+    from backend.whisper_models import WhisperModelManager
+    assert WhisperModelManager.estimate_mb("base") == 250
+    assert WhisperModelManager.estimate_mb("base", workers=3) > 250
+
+
+def test_long_recordings_use_configured_language(client, wait_for_job, monkeypatch):
+    monkeypatch.setattr("backend.services.session_service.TRANSCRIBE_LANGUAGE", "de")
+    sid = client.post("/api/sessions").json()["session_id"]
+    client.put(f"/api/sessions/{sid}/audio", params={"filename": "a.wav"}, content=b"RIFF")
+    seg = SimpleNamespace(start=0.0, end=1.0, text="Hallo")
+    with patch("backend.services.session_service._get_whisper_model", return_value=FakeWhisper()) as get_model, \
+            patch("backend.long_audio.probe_duration", return_value=3600.0), \
+            patch("backend.long_audio.workers_for", return_value=2), \
+            patch("backend.long_audio.transcribe_long", return_value=iter([seg])) as transcribe_long:
+        job = client.post(f"/api/sessions/{sid}/transcribe").json()
+        assert wait_for_job(job["job_id"])["status"] == "done"
+    assert transcribe_long.call_args.kwargs["language"] == "de"
+    get_model.assert_called_once_with(2)  # Modellvariante mit aufgeteilten CPU-Threads
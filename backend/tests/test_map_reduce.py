@@ -0,0 +1,86 @@
+"""Tests: Map-Reduce-Zusammenfassung langer Transkripte (Chunking, Parallelität, Reduce)."""
+import asyncio
+import json
+
+from backend import map_reduce
+from backend.map_reduce import estimate_tokens, reduce_prompt_for, split_transcript
+
+SENTENCES = [f"Satz Nummer {i} über das Budget." for i in range(400)]
+TRANSCRIPT = " ".join(SENTENCES)
+
+
+def test_split_respects_budget_and_covers_every_sentence():
+    chunks = split_transcript(TRANSCRIPT, chunk_tokens=200, overlap_tokens=20)
+    assert len(chunks) > 1
+    assert all(estimate_tokens(c) <= 200 for c in chunks)
+    joined = " ".join(chunks)
+    assert all(s in joined for s in SENTENCES)
+
+
+def test_consecutive_chunks_overlap():
+    chunks = split_transcript(TRANSCRIPT, chunk_tokens=200, overlap_tokens=20)
+    for prev, nxt in zip(chunks, chunks[1:]):
+        first_sentence = nxt.split(". ")[0] + "."
+        assert first_sentence in prev
+
+
+def test_short_transcript_is_one_chunk_and_long_words_are_cut():
+    assert split_transcript("Kurz. Knapp.", chunk_tokens=100) == ["Kurz. Knapp."]
+    chunks = split_transcript("x" * 1000, chunk_tokens=50, overlap_tokens=0)
+    assert "".join(chunks) == "x" * 1000
+    assert all(len(c) <= 200 for c in chunks)
+
+
+class _FakeLLM:
+    """Antwortet mit gültigem JSON und misst die maximale Parallelität."""
+
+    def __init__(self):
+        self.active = 0
+        self.max_active = 0
+        self.calls = []
+
+    async def complete(self, prompt, model, prompt_id, **kwargs):
+        self.calls.append(prompt_id)
+        n = len(self.calls)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        text = json.dumps({
+            "title": f"Teil {n}",
+            "participants": ["Anna"],
+            "key_points": ["Budget"],
+            "action_items": [],
+            "summary": "Kurz.",
+        })
+        return type("R", (), {"text": text, "model": model, "prompt_id": prompt_id, "duration_ms": 1.0})()
+
+
+def test_chunks_are_summarized_with_bounded_parallelism():
+    llm = _FakeLLM()
+    prompt = asyncio.run(reduce_prompt_for(llm, "m", TRANSCRIPT, chunk_tokens=500, overlap_tokens=20, parallelism=3))
+    n_chunks = len(split_transcript(TRANSCRIPT, 500, 20))
+    assert llm.calls == ["summary_chunk.v0.1"] * n_chunks
+    assert llm.max_active == 3
+    assert "Teil 1" in prompt and f"Teil {n_chunks}" in prompt
+
+
+def test_too_many_partials_are_reduced_in_groups():
+    llm = _FakeLLM()
+    prompt = asyncio.run(reduce_prompt_for(llm, "m", TRANSCRIPT, chunk_tokens=250, overlap_tokens=0, parallelism=4))
+    assert "summary_reduce.v0.1" in llm.calls
+    partials = prompt.split("---\n")[1]
+    assert estimate_tokens(partials) <= 250
+
+
+def test_long_transcript_is_summarized_via_map_reduce(client, monkeypatch):
+    assert estimate_tokens(TRANSCRIPT) > map_reduce.SUMMARY_CHUNK_TOKENS
+    sid = client.post("/api/sessions").json()["session_id"]
+    client.put(f"/api/sessions/{sid}/transcript", json={"transcript": TRANSCRIPT})
+    llm = _FakeLLM()
+    monkeypatch.setattr("backend.services.session_service.get_llm", lambda: llm)
+    r = client.post(f"/api/sessions/{sid}/summarize")
+    assert r.status_code == 200
+    assert r.json()["status"] == "summarized"
+    assert llm.calls.count("summary_chunk.v0.1") > 1
+    assert llm.calls[-1] == "summary_reduce.v0.1"
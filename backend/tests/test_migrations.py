@@ -0,0 +1,80 @@
+"""Unit-Tests: Schema-Migrationen (schema_version, Idempotenz, Upgrade alter DBs)."""
+import sqlite3
+
+from backend import db
+from backend.migrations import LATEST_VERSION, MIGRATIONS, current_version, migrate
+
+
+def test_fresh_db_is_at_latest_version():
+    conn = db.get_conn()
+    try:
+        assert current_version(conn) == LATEST_VERSION
+        rows = conn.execute("SELECT version FROM schema_version ORDER BY version").fetchall()
+        assert [r[0] for r in rows] == [m[0] for m in MIGRATIONS]
+    finally:
+        conn.close()
+
+
+def test_init_db_is_idempotent():
+    assert db.init_db() == LATEST_VERSION
+    assert db.init_db() == LATEST_VERSION
+    conn = db.get_conn()
+    try:
+        n = conn.execute("SELECT COUNT(*) FROM schema_version").fetchone()[0]
+    finally:
+        conn.close()
+    assert n == len(MIGRATIONS)
+
+
+def test_legacy_db_without_schema_version_is_upgraded(tmp_path):
+    path = tmp_path / "legacy.db"
+    conn = sqlite3.connect(path)
+    conn.executescript("""
+        CREATE TABLE config (key TEXT PRIMARY KEY, value TEXT);
+        CREATE TABLE cases (case_id TEXT PRIMARY KEY, alias TEXT NOT NULL, created_at TEXT NOT NULL);
+        CREATE TABLE sessions (
+            session_id TEXT PRIMARY KEY, case_id TEXT, created_at TEXT NOT NULL,
+            audio_path TEXT, summary_path TEXT, file_size INTEGER DEFAULT 0,
+            duration REAL, status TEXT DEFAULT 'draft', transcript TEXT
+        );
+        INSERT INTO config (key, value) VALUES ('model', 'phi3:mini');
+        INSERT INTO sessions (session_id, created_at) VALUES ('SESSION-old', '2024-01-01 00:00:00');
+        INSERT INTO cases (case_id, alias, created_at) VALUES
+            ('CASE-2024-0001', 'a', '2024-01-01'), ('CASE-2024-0007', 'b', '2024-01-02'),
+            ('CASE-2025-0002', 'c', '2025-01-01');
+    """)
+    conn.commit()
+    try:
+        assert migrate(conn) == LATEST_VERSION
+        assert conn.execute("SELECT value FROM config WHERE key = 'model'").fetchone()[0] == "phi3:mini"
+        assert conn.execute("SELECT COUNT(*) FROM sessions").fetchone()[0] == 1
+        # case numbering continues after the highest existing number per year
+        assert dict(conn.execute("SELECT year, last_value FROM case_sequences").fetchall()) == {
+            "2024": 7, "2025": 2,
+        }
+    finally:
+        conn.close()
+
+
+def test_summary_files_are_backfilled_into_db(tmp_path):
+    (tmp_path / "s1").mkdir()
+    (tmp_path / "s1" / "summary.json").write_text('{"title": "Alt"}', encoding="utf-8")
+    path = tmp_path / "legacy2.db"
+    conn = sqlite3.connect(path)
+    conn.executescript("""
+        CREATE TABLE sessions (
+            session_id TEXT PRIMARY KEY, case_id TEXT, created_at TEXT NOT NULL,
+            audio_path TEXT, summary_path TEXT, file_size INTEGER DEFAULT 0,
+            duration REAL, status TEXT DEFAULT 'draft', transcript TEXT
+        );
+        INSERT INTO sessions (session_id, created_at, summary_path) VALUES ('SESSION-a', '2024-01-01', 's1/summary.json');
+        INSERT INTO sessions (session_id, created_at, summary_path) VALUES ('SESSION-b', '2024-01-01', 'fehlt/summary.json');
+    """)
+    conn.commit()
+    try:
+        migrate(conn)
+        rows = dict(conn.execute("SELECT session_id, summary_json FROM sessions").fetchall())
+    finally:
+        conn.close()
+    assert rows["SESSION-a"] == '{"title": "Alt"}'
+    assert rows["SESSION-b"] is None
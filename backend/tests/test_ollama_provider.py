@@ -0,0 +1,134 @@
+"""Tests: OllamaProvider gegen einen lokalen Stand-in-Server (Keep-Alive, Mock-Fallback)."""
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from backend.providers.ollama import OllamaConfig, OllamaProvider
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    connections = set()
+    requests = []
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, payload: dict):
+        body = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        _Handler.connections.add(self.client_address)
+        self._send({"models": []})
+
+    def do_POST(self):
+        _Handler.connections.add(self.client_address)
+        req = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        _Handler.requests.append(req)
+        if req.get("stream"):
+            lines = [{"response": tok, "done": False} for tok in ("echo", ":", req["prompt"])]
+            lines.append({"response": "", "done": True})
+            body = "".join(json.dumps(line) + "\n" for line in lines).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/x-ndjson")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+        self._send({"response": f"echo:{req['prompt']}"})
+
+
+@pytest.fixture
+def stand_in_server():
+    _Handler.connections = set()
+    _Handler.requests = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    t = threading.Thread(target=server.serve_forever, daemon=True)
+    t.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_complete_reuses_one_keepalive_connection(stand_in_server):
+    provider = OllamaProvider(OllamaConfig(base_url=stand_in_server))
+
+    async def run():
+        texts = [(await provider.complete(f"p{i}", "m", "summary.v0.1")).text for i in range(5)]
+        assert await provider.health()
+        await provider.aclose()
+        return texts
+
+    texts = asyncio.run(run())
+    assert texts == [f"echo:p{i}" for i in range(5)]
+    assert len(_Handler.connections) == 1
+
+
+def test_unreachable_server_falls_back_to_mock():
+    provider = OllamaProvider(OllamaConfig(base_url="http://127.0.0.1:9", connect_timeout=0.5))
+
+    async def run():
+        resp = await provider.complete("x", "m", "summary.v0.1")
+        healthy = await provider.health(timeout=0.5)
+        await provider.aclose()
+        return resp, healthy
+
+    resp, healthy = asyncio.run(run())
+    assert json.loads(resp.text)["title"].startswith("Mock Summary")
+    assert healthy is False
+
+
+def test_client_is_recreated_for_new_event_loop(stand_in_server):
+    provider = OllamaProvider(OllamaConfig(base_url=stand_in_server))
+    r1 = asyncio.run(provider.complete("a", "m", "summary.v0.1"))
+    r2 = asyncio.run(provider.complete("b", "m", "summary.v0.1"))
+    assert (r1.text, r2.text) == ("echo:a", "echo:b")
+
+
+def test_stream_yields_ndjson_tokens(stand_in_server):
+    provider = OllamaProvider(OllamaConfig(base_url=stand_in_server))
+
+    async def run():
+        tokens = [t async for t in provider.stream("p", "m", "summary.v0.1")]
+        await provider.aclose()
+        return tokens
+
+    assert asyncio.run(run()) == ["echo", ":", "p"]
+
+
+def test_stream_falls_back_to_mock():
+    provider = OllamaProvider(OllamaConfig(base_url="http://127.0.0.1:9", connect_timeout=0.5))
+
+    async def run():
+        tokens = [t async for t in provider.stream("x", "m", "summary.v0.1")]
+        await provider.aclose()
+        return tokens
+
+    tokens = asyncio.run(run())
+    assert len(tokens) == 1
+    assert json.loads(tokens[0])["title"].startswith("Mock Summary")
+
+
+def test_format_schema_is_sent_to_ollama(stand_in_server):
+    from backend.schema import SUMMARY_SCHEMA
+
+    provider = OllamaProvider(OllamaConfig(base_url=stand_in_server))
+
+    async def run():
+        await provider.complete("a", "m", "summary.v0.1", format=SUMMARY_SCHEMA)
+        await provider.complete("b", "m", "summary.v0.1")
+        await provider.aclose()
+
+    asyncio.run(run())
+    with_format, without_format = _Handler.requests
+    assert with_format["format"] == SUMMARY_SCHEMA
+    assert "format" not in without_format
@@ -0,0 +1,138 @@
+"""Tests: Auto-Verarbeitung als Pipeline (überlappende Stufen, Backpressure, Fehler)."""
+import json
+import threading
+import time
+from unittest.mock import AsyncMock, patch
+
+from fastapi.testclient import TestClient
+
+from backend.conftest import FakeWhisper
+from backend.pipeline import Pipeline, run_folder
+
+
+def _sleeper(seconds: float, log: list = None):
+    def stage(item):
+        if log is not None:
+            log.append((item["source"], time.perf_counter()))
+        time.sleep(seconds)
+    return stage
+
+
+def test_stages_overlap():
+    fns = {"ingest": lambda item: None, "transcribe": _sleeper(0.05), "summarize": _sleeper(0.05)}
+    items, wall = run_folder([f"r{i}.wav" for i in range(8)], stage_fns=fns, summarize_workers=1)
+    assert all(i["status"] == "done" for i in items)
+    # sequential: 8 x (0.05 + 0.05) = 0.8s; pipelined: ~ 8 x 0.05 + 0.05
+    assert wall < 0.65
+
+
+def test_bounded_queue_applies_backpressure():
+    release = threading.Event()
+    ingested = []
+
+    def ingest(item):
+        ingested.append(item["source"])
+
+    fns = {"ingest": ingest, "transcribe": lambda item: release.wait(2), "summarize": lambda item: None}
+    p = Pipeline(queue_size=1, stage_fns=fns).start()
+    for i in range(6):
+        p.submit(f"r{i}.wav")
+    time.sleep(0.1)
+    # 1 transcribing + 1 in the transcribe queue + 1 ingested and blocked on put
+    assert len(ingested) == 3
+    assert p.stats()["stages"]["ingest"]["queued"] == 3
+    release.set()
+    assert p.wait(2)
+    p.close()
+    assert len(ingested) == 6
+
+
+def test_failed_stage_stops_item_and_is_reported():
+    def transcribe(item):
+        if item["source"] == "bad.wav":
+            raise ValueError("kaputt")
+
+    fns = {"ingest": lambda item: None, "transcribe": transcribe, "summarize": lambda item: None}
+    items, _ = run_folder(["ok.wav", "bad.wav"], stage_fns=fns)
+    by_source = {i["source"]: i for i in items}
+    assert by_source["ok.wav"]["status"] == "done"
+    assert by_source["bad.wav"]["status"] == "failed"
+    assert by_source["bad.wav"]["stage"] == "transcribe"
+    assert by_source["bad.wav"]["error"] == "kaputt"
+    assert "summarize" not in by_source["bad.wav"]["timings"]
+
+
+def test_process_endpoint_transcribes_then_summarizes(client: TestClient):
+    sid = client.post("/api/sessions").json()["session_id"]
+    client.put(f"/api/sessions/{sid}/audio", params={"filename": "a.wav"}, content=b"RIFF")
+    summary = json.dumps({"title": "T", "participants": [], "key_points": [], "action_items": [], "summary": "S"})
+    resp = type("R", (), {"text": summary, "model": "m", "prompt_id": "summary.v0.1", "duration_ms": 1.0})()
+    with patch("backend.services.session_service._get_whisper_model", return_value=FakeWhisper(n=2)), \
+            patch("backend.services.session_service.get_llm") as mock_llm:
+        mock_llm.return_value.complete = AsyncMock(return_value=resp)
+        r = client.post(f"/api/sessions/{sid}/process")
+        assert r.status_code == 202
+        from backend.pipeline import get_pipeline
+        assert get_pipeline().wait(5)
+    s = client.get(f"/api/sessions/{sid}").json()
+    assert s["transcript"] == "Teil 0 Teil 1"
+    assert s["status"] == "summarized"
+    status = client.get("/api/pipeline").json()
+    assert status["done"] == 1
+    assert status["stages"]["summarize"]["processed"] == 1
+
+
+def test_process_without_audio_returns_400(client: TestClient):
+    sid = client.post("/api/sessions").json()["session_id"]
+    assert client.post(f"/api/sessions/{sid}/process").status_code == 400
+
+
+def test_process_reuses_running_transcribe_job(client: TestClient, wait_for_job):
+    sid = client.post("/api/sessions").json()["session_id"]
+    client.put(f"/api/sessions/{sid}/audio", params={"filename": "a.wav"}, content=b"RIFF")
+    summary = json.dumps({"title": "T", "participants": [], "key_points": [], "action_items": [], "summary": "S"})
+    resp = type("R", (), {"text": summary, "model": "m", "prompt_id": "summary.v0.1", "duration_ms": 1.0})()
+    gate = threading.Event()
+    whisper = FakeWhisper(n=2, gate=gate)
+    with patch("backend.services.session_service._get_whisper_model", return_value=whisper), \
+            patch("backend.services.session_service.get_llm") as mock_llm:
+        mock_llm.return_value.complete = AsyncMock(return_value=resp)
+        job = client.post(f"/api/sessions/{sid}/transcribe").json()
+        assert client.post(f"/api/sessions/{sid}/process").status_code == 202
+        from backend.pipeline import get_pipeline
+        deadline = time.monotonic() + 5
+        while not any(i.get("job_id") for i in get_pipeline().items()) and time.monotonic() < deadline:
+            time.sleep(0.01)
+        gate.set()
+        assert get_pipeline().wait(5)
+    assert get_pipeline().items()[0]["job_id"] == job["job_id"]
+    assert wait_for_job(job["job_id"])["status"] == "done"
+    assert [j["job_id"] for j in client.get("/api/jobs", params={"session_id": sid}).json()] == [job["job_id"]]
+    assert client.get(f"/api/sessions/{sid}").json()["status"] == "summarized"
+
+
+def test_close_with_timeout_leaves_busy_workers():
+    release = threading.Event()
+    fns = {"ingest": lambda item: None, "transcribe": lambda item: release.wait(5), "summarize": lambda item: None}
+    p = Pipeline(stage_fns=fns).start()
+    p.submit("a.wav")
+    time.sleep(0.05)
+    t0 = time.monotonic()
+    assert p.close(drain=False, timeout=0.2) is False
+    assert time.monotonic() - t0 < 1
+    release.set()
+
+
+def test_summarize_workers_close_llm_client_and_loop():
+    from backend.pipeline import _thread_loop
+    loops = []
+
+    def summarize(item):
+        loops.append(_thread_loop())
+
+    fns = {"ingest": lambda item: None, "transcribe": lambda item: None, "summarize": summarize}
+    with patch("backend.llm.get_llm") as get_llm:
+        get_llm.return_value.aclose = AsyncMock()
+        run_folder(["a.wav"], stage_fns=fns, summarize_workers=1)
+    assert get_llm.return_value.aclose.await_count == 1
+    assert loops[0].is_closed()
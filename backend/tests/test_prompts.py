@@ -0,0 +1,44 @@
+"""Prompt-Registry: Single-Pass-Rendering, Reload bei Dateiänderung, Token-Schätzung."""
+import os
+
+import pytest
+
+from backend.prompts import PromptRegistry, estimate_tokens, load_prompt, prompt_registry
+
+
+def test_transcript_braces_are_not_substituted():
+    text = load_prompt("summary_chunk.v0.1", transcript="Wir sagten {part} und {transcript}.", part=2, parts=5)
+    assert "Wir sagten {part} und {transcript}." in text
+    assert "part 2 of 5" in text
+    # JSON-Beispiel im Prompt bleibt erhalten
+    assert '"title"' in text and "{\n" in text
+
+
+def test_render_reports_tokens_and_stats():
+    rendered = prompt_registry.render("summary.v0.1", transcript="x" * 4000)
+    assert rendered.tokens == estimate_tokens(rendered.text) >= 1000
+    stats = prompt_registry.stats()["prompts"]["summary.v0.1"]
+    assert stats["renders"] == 1 and stats["max_tokens"] == rendered.tokens
+
+
+def test_reload_only_on_mtime_change(tmp_path):
+    path = tmp_path / "p.md"
+    path.write_text("Hallo {name}!", encoding="utf-8")
+    registry = PromptRegistry(root=tmp_path, prompt_ids={"p": "p.md"})
+    assert registry.render("p", name="Welt").text == "Hallo Welt!"
+    assert registry.render("p", name="Du").text == "Hallo Du!"
+    assert registry.loads == 1
+
+    path.write_text("Servus {name}!", encoding="utf-8")
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert registry.render("p", name="Welt").text == "Servus Welt!"
+    assert registry.loads == 2
+
+
+def test_unknown_prompt_and_missing_file(tmp_path):
+    with pytest.raises(ValueError):
+        load_prompt("nope.v0.1")
+    registry = PromptRegistry(root=tmp_path, prompt_ids={"p": "fehlt.md"})
+    with pytest.raises(FileNotFoundError):
+        registry.render("p")
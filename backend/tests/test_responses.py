@@ -0,0 +1,47 @@
+"""Antwort-Kodierung: schnelles JSON-Rendering, gzip-Kompression ab Schwellwert."""
+import json
+
+from fastapi.testclient import TestClient
+
+from backend import responses
+from backend.responses import FastJSONResponse, choose_encoding
+
+
+def test_large_session_is_gzipped_and_revalidates(client: TestClient):
+    sid = client.post("/api/sessions").json()["session_id"]
+    transcript = "Wir besprechen das Budget für Q3 – „Zitat“ und Umlaute äöü. " * 2000
+    client.put(f"/api/sessions/{sid}/transcript", json={"transcript": transcript})
+
+    r = client.get(f"/api/sessions/{sid}", headers={"Accept-Encoding": "gzip"})
+    assert r.headers["content-encoding"] == "gzip"
+    assert int(r.headers["content-length"]) < len(transcript) // 10
+    assert "accept-encoding" in r.headers["vary"].lower()
+    assert r.json()["transcript"] == transcript
+    etag = r.headers["etag"]
+    assert etag.startswith('W/"')
+    assert client.get(f"/api/sessions/{sid}", headers={"If-None-Match": etag}).status_code == 304
+
+    plain = client.get(f"/api/sessions/{sid}", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in plain.headers
+    assert plain.json() == r.json()
+
+
+def test_small_responses_are_not_compressed(client: TestClient):
+    r = client.get("/health", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in r.headers
+
+
+def test_choose_encoding(monkeypatch):
+    monkeypatch.setattr(responses, "brotli", None)
+    assert choose_encoding("gzip, deflate, br") == "gzip"
+    assert choose_encoding("br;q=1.0, gzip;q=0") is None
+    assert choose_encoding("identity") is None
+    monkeypatch.setattr(responses, "brotli", object())
+    assert choose_encoding("gzip, br") == "br"
+
+
+def test_json_fallback_without_orjson(monkeypatch):
+    content = {"a": "äö", "b": [1, 2.5, None, True]}
+    fast = FastJSONResponse(content).body
+    monkeypatch.setattr(responses, "orjson", None)
+    assert json.loads(FastJSONResponse(content).body) == json.loads(fast) == content
@@ -0,0 +1,68 @@
+"""Unit-Tests: Summary-Cache (LRU, Speicherbudget, Zähler) und Summary-Spalte."""
+import json
+from unittest.mock import patch
+
+from backend.summary_cache import SummaryCache, summary_from_file
+
+
+def test_hit_requires_same_version():
+    cache = SummaryCache(max_bytes=1000)
+    loads = []
+    loader = lambda: loads.append(1) or {"v": len(loads)}  # noqa: E731
+    assert cache.get_or_load("a", "v1", 10, loader) == {"v": 1}
+    assert cache.get_or_load("a", "v1", 10, loader) == {"v": 1}
+    assert cache.get_or_load("a", "v2", 10, loader) == {"v": 2}
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+    assert stats["entries"] == 1
+    assert stats["bytes"] == 10
+
+
+def test_evicts_least_recently_used_over_budget():
+    cache = SummaryCache(max_bytes=25)
+    for key in ("a", "b"):
+        cache.get_or_load(key, 1, 10, lambda: key)
+    cache.get_or_load("a", 1, 10, lambda: "a")  # a wird zuletzt benutzt
+    cache.get_or_load("c", 1, 10, lambda: "c")
+    stats = cache.stats()
+    assert stats["evictions"] == 1
+    assert stats["bytes"] <= 25
+    hits_before = stats["hits"]
+    cache.get_or_load("a", 1, 10, lambda: "a")
+    assert cache.stats()["hits"] == hits_before + 1
+
+
+def test_oversized_entry_is_not_cached():
+    cache = SummaryCache(max_bytes=5)
+    assert cache.get_or_load("big", 1, 50, lambda: "x") == "x"
+    assert cache.stats()["entries"] == 0
+
+
+def test_file_cache_reloads_after_change(tmp_path):
+    path = tmp_path / "summary.json"
+    path.write_text(json.dumps({"title": "A"}), encoding="utf-8")
+    assert summary_from_file(path)["title"] == "A"
+    path.write_text(json.dumps({"title": "B-geaendert"}), encoding="utf-8")
+    assert summary_from_file(path)["title"] == "B-geaendert"
+    assert summary_from_file(tmp_path / "fehlt.json") is None
+
+
+def test_list_sessions_serves_summary_without_file_reads(client):
+    from backend.db import db_cursor
+    sid = client.post("/api/sessions").json()["session_id"]
+    summary = {"title": "T", "participants": [], "key_points": [], "action_items": [], "summary": "S"}
+    with db_cursor() as cur:
+        cur.execute(
+            "UPDATE sessions SET summary_path = 'nirgends/summary.json', summary_json = ? WHERE session_id = ?",
+            (json.dumps(summary), sid),
+        )
+    with patch("pathlib.Path.read_text") as read_text, patch("pathlib.Path.stat") as stat:
+        r = client.get("/api/sessions")
+        r2 = client.get("/api/sessions")
+    assert read_text.call_count == 0
+    assert stat.call_count == 0
+    assert r.json()[0]["summary"]["title"] == "T"
+    assert r2.json()[0]["summary"]["title"] == "T"
+    stats = client.get("/api/system/stats").json()["summary_cache"]
+    assert stats["hits"] >= 1
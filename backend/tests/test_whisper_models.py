@@ -0,0 +1,80 @@
+"""Unit-Tests: Whisper-Modellverwaltung (Single-Flight-Laden, LRU unter RAM-Budget)."""
+import threading
+import time
+
+from fastapi.testclient import TestClient
+
+from backend.whisper_models import WhisperModelManager
+
+
+def test_concurrent_get_loads_model_once():
+    calls = []
+
+    def slow_loader(model_id, workers=1):
+        calls.append(model_id)
+        time.sleep(0.05)
+        return object()
+
+    mgr = WhisperModelManager(budget_mb=1000, loader=slow_loader)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(mgr.get("base"))) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert calls == ["base"]
+    assert len({id(r) for r in results}) == 1
+
+
+def test_lru_eviction_under_budget():
+    mgr = WhisperModelManager(budget_mb=900, loader=lambda m, workers=1: m.upper())
+    mgr.get("base")   # 250
+    mgr.get("small")  # 600 -> 850
+    mgr.get("base")   # base zuletzt benutzt
+    mgr.get("tiny")   # 150 -> small muss weichen
+    loaded = [m["model_id"] for m in mgr.status()["models"]]
+    assert loaded == ["tiny", "base"]
+    assert mgr.status()["used_mb"] == 400
+
+
+def test_model_larger_than_budget_still_loads():
+    mgr = WhisperModelManager(budget_mb=100, loader=lambda m, workers=1: m)
+    assert mgr.get("medium") == "medium"
+    assert mgr.get("tiny") == "tiny"
+    assert [m["model_id"] for m in mgr.status()["models"]] == ["tiny"]
+
+
+def test_preload_runs_in_background():
+    mgr = WhisperModelManager(budget_mb=1000, loader=lambda m, workers=1: m)
+    mgr.preload("tiny").join(2)
+    assert mgr.status()["models"][0]["model_id"] == "tiny"
+
+
+def test_loaded_models_endpoint(client: TestClient):
+    r = client.get("/api/system/whisper-models/loaded")
+    assert r.status_code == 200
+    data = r.json()
+    assert "budget_mb" in data
+    assert isinstance(data["models"], list)
+
+
+def test_long_audio_variant_is_cached_separately():
+    mgr = WhisperModelManager(budget_mb=10_000, loader=lambda m, workers=1: (m, workers))
+    assert mgr.get("base") == ("base", 1)
+    assert mgr.get("base", workers=4) == ("base", 4)
+    assert mgr.get("base") == ("base", 1)
+    assert sorted((m["model_id"], m["workers"]) for m in mgr.status()["models"]) == [("base", 1), ("base", 4)]
+    assert mgr.unload("base") and mgr.status()["models"] == []
+
+
+def test_only_long_audio_loads_split_cpu_threads(monkeypatch):
+    import sys
+    from types import SimpleNamespace
+    from backend.whisper_models import _load_faster_whisper
+    calls = []
+    monkeypatch.setitem(sys.modules, "faster_whisper", SimpleNamespace(WhisperModel=lambda *a, **kw: calls.append(kw)))
+    monkeypatch.setattr("backend.whisper_models.os.cpu_count", lambda: 8)
+    _load_faster_whisper("base")
+    _load_faster_whisper("base", workers=4)
+    assert "cpu_threads" not in calls[0] and "num_workers" not in calls[0]
+    assert calls[1]["cpu_threads"] == 2 and calls[1]["num_workers"] == 4
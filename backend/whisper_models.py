@@ -0,0 +1,161 @@
+"""Whisper model manager: single-flight loading, LRU eviction under a RAM budget."""
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional
+
+from backend.config import WHISPER_RAM_BUDGET_MB
+
+# Approximate resident size of faster-whisper models (CPU, int8), in MB
+MODEL_RAM_MB = {
+    "tiny": 150,
+    "base": 250,
+    "small": 600,
+    "medium": 1600,
+    "large-v2": 3200,
+    "large-v3": 3200,
+}
+DEFAULT_MODEL_RAM_MB = 1000
+# Each extra parallel worker (num_workers) keeps its own decoding buffers: about this share of the model size
+WORKER_RAM_FRACTION = 0.25
+
+log = logging.getLogger("zyquraflow")
+
+
+def _load_faster_whisper(model_id: str, workers: int = 1):
+    """workers=1: one stream with faster-whisper's default threads. workers>1
+    (long-audio mode): transcribe() runs concurrently on one model and the
+    cores are split between the workers instead of giving each all of them."""
+    from faster_whisper import WhisperModel
+    if workers <= 1:
+        return WhisperModel(model_id, device="cpu", compute_type="int8")
+    return WhisperModel(
+        model_id,
+        device="cpu",
+        compute_type="int8",
+        num_workers=workers,
+        cpu_threads=max(1, (os.cpu_count() or 1) // workers),
+    )
+
+
+def _rss_bytes() -> Optional[int]:
+    """Current resident set size (Linux only; None elsewhere)."""
+    try:
+        with open("/proc/self/statm") as fh:
+            return int(fh.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+class WhisperModelManager:
+    """Keeps loaded models within budget_mb, evicting least recently used ones.
+
+    Models are cached per (model_id, workers): the single-stream model and
+    the long-audio variant with split CPU threads are separate entries. Each
+    key has its own load lock, so concurrent callers for a cold model wait
+    for one load instead of loading it twice. A model larger than the whole
+    budget is still loaded (alone) rather than refused.
+    """
+
+    def __init__(
+        self,
+        budget_mb: int = WHISPER_RAM_BUDGET_MB,
+        loader: Callable = _load_faster_whisper,
+    ):
+        self.budget_mb = budget_mb
+        self.loader = loader  # loader(model_id, workers)
+        self._models: OrderedDict = OrderedDict()  # (model_id, workers) -> info dict (incl. "model")
+        self._lock = threading.Lock()
+        self._load_locks: dict = {}
+
+    @staticmethod
+    def estimate_mb(model_id: str, workers: int = 1) -> int:
+        """Weights once plus buffers for each additional parallel worker."""
+        base = MODEL_RAM_MB.get(model_id, DEFAULT_MODEL_RAM_MB)
+        return base + int(base * WORKER_RAM_FRACTION * (max(1, workers) - 1))
+
+    def _hit(self, key: tuple):
+        with self._lock:
+            info = self._models.get(key)
+            if info is None:
+                return None
+            self._models.move_to_end(key)
+            info["last_used"] = time.time()
+            info["uses"] += 1
+            return info["model"]
+
+    def get(self, model_id: str, workers: int = 1):
+        """The model for one stream, or for workers concurrent long-audio chunks."""
+        key = (model_id, max(1, workers))
+        model = self._hit(key)
+        if model is not None:
+            return model
+        with self._lock:
+            load_lock = self._load_locks.setdefault(key, threading.Lock())
+        with load_lock:
+            model = self._hit(key)  # loaded by another thread while we waited
+            if model is not None:
+                return model
+            self._make_room(self.estimate_mb(*key))
+            rss_before = _rss_bytes()
+            t0 = time.perf_counter()
+            model = self.loader(*key)
+            load_seconds = time.perf_counter() - t0
+            rss_after = _rss_bytes()
+            now = time.time()
+            with self._lock:
+                self._models[key] = {
+                    "model": model,
+                    "estimated_mb": self.estimate_mb(*key),
+                    "rss_delta_mb": (
+                        round((rss_after - rss_before) / 2**20, 1)
+                        if rss_before is not None and rss_after is not None else None
+                    ),
+                    "load_seconds": round(load_seconds, 3),
+                    "loaded_at": now,
+                    "last_used": now,
+                    "uses": 1,
+                }
+            log.info("Whisper model %s (workers=%d) loaded in %.1fs", model_id, key[1], load_seconds)
+            return model
+
+    def _used_mb(self) -> int:
+        return sum(info["estimated_mb"] for info in self._models.values())
+
+    def _make_room(self, needed_mb: int) -> None:
+        with self._lock:
+            while self._models and self._used_mb() + needed_mb > self.budget_mb:
+                (evicted, workers), _ = self._models.popitem(last=False)
+                log.info("Whisper model %s (workers=%d) evicted (RAM budget %d MB)", evicted, workers, self.budget_mb)
+
+    def unload(self, model_id: str) -> bool:
+        """Drop every loaded variant of model_id."""
+        with self._lock:
+            keys = [key for key in self._models if key[0] == model_id]
+            for key in keys:
+                del self._models[key]
+            return bool(keys)
+
+    def preload(self, model_id: str) -> threading.Thread:
+        """Load a model in a background thread (startup warm-up)."""
+        def run():
+            try:
+                self.get(model_id)
+            except Exception as e:
+                log.warning("Whisper preload of %s failed: %s", model_id, e)
+        t = threading.Thread(target=run, name=f"whisper-preload-{model_id}", daemon=True)
+        t.start()
+        return t
+
+    def status(self) -> dict:
+        with self._lock:
+            models = [
+                {"model_id": model_id, "workers": workers, **{k: v for k, v in info.items() if k != "model"}}
+                for (model_id, workers), info in reversed(self._models.items())
+            ]
+            return {"budget_mb": self.budget_mb, "used_mb": self._used_mb(), "models": models}
+
+
+whisper_models = WhisperModelManager()
@@ -0,0 +1,101 @@
+"""Benchmark: connect-per-call vs. pooled SQLite connections.
+
+Run from repo root:  python scripts/bench_db.py [--sessions 500] [--requests 2000] [--threads 4]
+
+"before" re-creates the old db_cursor (new sqlite3.connect per call) and
+patches it into the services; "after" uses the pooled layer. Both run on the
+same database, which init_db() has switched to WAL, so the numbers isolate
+the connection cost, not the journal mode.
+"""
+import argparse
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+TMP = Path(tempfile.mkdtemp(prefix="zyq-bench-"))
+os.environ["ZYQURAFLOW_DATA"] = str(TMP)
+
+import backend.db  # noqa: E402
+import backend.llm  # noqa: E402
+from backend.services import session_service, case_service  # noqa: E402
+
+
+def legacy_db_cursor_factory(db_path):
+    @contextmanager
+    def legacy_db_cursor():
+        conn = sqlite3.connect(db_path)
+        conn.row_factory = sqlite3.Row
+        try:
+            yield conn.cursor()
+            conn.commit()
+        finally:
+            conn.close()
+    return legacy_db_cursor
+
+
+def seed(n_sessions: int) -> list:
+    ids = []
+    for _ in range(n_sessions):
+        ids.append(session_service.create_session()["session_id"])
+    return ids
+
+
+def run(label, fn, ids, n_requests, threads):
+    def one(i):
+        fn(ids[i % len(ids)])
+
+    start = time.perf_counter()
+    if threads == 1:
+        for i in range(n_requests):
+            one(i)
+    else:
+        with ThreadPoolExecutor(max_workers=threads) as ex:
+            list(ex.map(one, range(n_requests)))
+    elapsed = time.perf_counter() - start
+    print(f"{label:<34} {n_requests / elapsed:>10.0f} req/s")
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--sessions", type=int, default=500)
+    ap.add_argument("--requests", type=int, default=2000)
+    ap.add_argument("--threads", type=int, default=4)
+    args = ap.parse_args()
+
+    db_path = TMP / "bench.db"
+    backend.db.DB_PATH = db_path
+    backend.db.init_db()
+
+    from fastapi.testclient import TestClient
+    from backend.main import app
+
+    ids = seed(args.sessions)
+    client = TestClient(app)
+
+    def service_call(sid):
+        session_service.get_session(sid)
+
+    def http_call(sid):
+        client.get(f"/api/sessions/{sid}")
+
+    modules = (session_service, case_service, backend.llm)
+    pooled = {m: m.db_cursor for m in modules}
+    legacy = legacy_db_cursor_factory(db_path)
+
+    for mode in ("before", "after"):
+        for m in modules:
+            m.db_cursor = legacy if mode == "before" else pooled[m]
+        for threads in (1, args.threads):
+            run(f"{mode} get_session  threads={threads}", service_call, ids, args.requests, threads)
+            run(f"{mode} GET /api/sessions/{{id}} t={threads}", http_call, ids, args.requests // 2, threads)
+    backend.db.pool.close_all()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Benchmark: real-time factor of single-stream vs. VAD-chunked parallel transcription.
+
+Run from repo root (needs faster-whisper and a recording):
+    python scripts/bench_long_audio.py path/to/meeting.m4a [--model base] [--workers 4] [--language de]
+
+RTF = processing time / audio duration (lower is better; 0.1 = 10x real time).
+Both runs load the model through the app's loader, so each uses the thread
+settings the app ships for its path (single stream vs. long-audio workers).
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from backend import long_audio  # noqa: E402
+from backend.config import TRANSCRIBE_LANGUAGE  # noqa: E402
+from backend.whisper_models import _load_faster_whisper  # noqa: E402
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("audio")
+    ap.add_argument("--model", default="base")
+    ap.add_argument("--workers", type=int, default=long_audio.LONG_AUDIO_MAX_WORKERS)
+    ap.add_argument("--language", default=TRANSCRIBE_LANGUAGE)
+    args = ap.parse_args()
+
+    duration = long_audio.probe_duration(args.audio)
+    print(f"audio: {args.audio}  duration: {duration:.0f}s  model: {args.model}")
+
+    model = _load_faster_whisper(args.model)
+    t0 = time.perf_counter()
+    segments, info = model.transcribe(args.audio, language=args.language)
+    n_single = sum(1 for _ in segments)
+    single = time.perf_counter() - t0
+    duration = duration or info.duration
+    print(f"single-stream          {single:8.1f}s  RTF {single / duration:.3f}  segments {n_single}")
+
+    model = _load_faster_whisper(args.model, args.workers)
+    t0 = time.perf_counter()
+    n_chunked = sum(1 for _ in long_audio.transcribe_long(model, args.audio, args.workers, args.language))
+    chunked = time.perf_counter() - t0
+    print(f"chunked, {args.workers} workers     {chunked:8.1f}s  RTF {chunked / duration:.3f}  segments {n_chunked}")
+    print(f"speed-up               {single / chunked:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Micro-benchmark: per-call httpx.AsyncClient vs. the provider's shared keep-alive client.
+
+Run from repo root:  python scripts/bench_ollama_client.py [--calls 500]
+
+A local stand-in for Ollama answers /api/generate instantly, so the numbers
+show pure client/connection overhead per LLM call.
+"""
+import argparse
+import asyncio
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import httpx
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from backend.providers.ollama import OllamaConfig, OllamaProvider  # noqa: E402
+
+
+class StandIn(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        body = json.dumps({"response": "{}"}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+async def per_call_client(base_url: str, calls: int) -> float:
+    """The previous implementation: new AsyncClient (and TCP connection) per call."""
+    t0 = time.perf_counter()
+    for i in range(calls):
+        async with httpx.AsyncClient(timeout=60.0) as client:
+            r = await client.post(f"{base_url}/api/generate", json={"model": "m", "prompt": str(i), "stream": False})
+            r.json()
+    return time.perf_counter() - t0
+
+
+async def shared_client(base_url: str, calls: int) -> float:
+    provider = OllamaProvider(OllamaConfig(base_url=base_url))
+    t0 = time.perf_counter()
+    for i in range(calls):
+        await provider.complete(str(i), "m", "summary.v0.1")
+    elapsed = time.perf_counter() - t0
+    await provider.aclose()
+    return elapsed
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--calls", type=int, default=500)
+    args = ap.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandIn)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    before = asyncio.run(per_call_client(base_url, args.calls))
+    after = asyncio.run(shared_client(base_url, args.calls))
+    print(f"per-call client   {before / args.calls * 1000:7.2f} ms/call")
+    print(f"shared client     {after / args.calls * 1000:7.2f} ms/call")
+    print(f"overhead removed  {(before - after) / args.calls * 1000:7.2f} ms/call ({before / after:.1f}x)")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
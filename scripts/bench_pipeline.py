@@ -0,0 +1,77 @@
+"""Benchmark: sessions/hour of step-by-step processing vs. the auto-process pipeline.
+
+Run from repo root:
+    python scripts/bench_pipeline.py path/to/folder          # real: faster-whisper + Ollama
+    python scripts/bench_pipeline.py --simulate 50 [--stt 0.4 --llm 0.3]
+
+Real mode imports every audio file of the folder into a scratch data dir,
+once strictly sequentially (upload, transcribe, summarize per file) and once
+through the pipeline. --simulate replaces the stages with sleeps of the given
+seconds per session, to show the overlap without models.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+os.environ.setdefault("ZYQURAFLOW_DATA", tempfile.mkdtemp(prefix="zyq-bench-pipe-"))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from backend import pipeline  # noqa: E402
+from backend.config import PIPELINE_SUMMARIZE_WORKERS, PIPELINE_TRANSCRIBE_WORKERS  # noqa: E402
+from backend.db import init_db  # noqa: E402
+
+AUDIO_SUFFIXES = {".wav", ".mp3", ".m4a", ".ogg", ".flac", ".webm"}
+
+
+def sequential(paths: list, stage_fns: dict) -> float:
+    t0 = time.perf_counter()
+    for path in paths:
+        item = {"source": str(path), "session_id": None, "case_id": None}
+        for stage in pipeline.STAGES:
+            stage_fns[stage](item)
+    return time.perf_counter() - t0
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("folder", nargs="?")
+    ap.add_argument("--simulate", type=int, metavar="N", help="N fake recordings instead of a folder")
+    ap.add_argument("--stt", type=float, default=0.4, help="simulated transcription seconds per session")
+    ap.add_argument("--llm", type=float, default=0.3, help="simulated summary seconds per session")
+    ap.add_argument("--transcribe-workers", type=int, default=PIPELINE_TRANSCRIBE_WORKERS)
+    ap.add_argument("--summarize-workers", type=int, default=PIPELINE_SUMMARIZE_WORKERS)
+    args = ap.parse_args()
+
+    if args.simulate:
+        paths = [f"sim-{i}.wav" for i in range(args.simulate)]
+        stage_fns = {
+            "ingest": lambda item: time.sleep(0.01),
+            "transcribe": lambda item: time.sleep(args.stt),
+            "summarize": lambda item: time.sleep(args.llm),
+        }
+    elif args.folder:
+        init_db()
+        paths = sorted(p for p in Path(args.folder).iterdir() if p.suffix.lower() in AUDIO_SUFFIXES)
+        stage_fns = {"ingest": pipeline._ingest, "transcribe": pipeline._transcribe, "summarize": pipeline._summarize}
+    else:
+        ap.error("folder or --simulate N required")
+
+    n = len(paths)
+    print(f"{n} recordings, transcribe workers {args.transcribe_workers}, summarize workers {args.summarize_workers}")
+    seq = sequential(paths, stage_fns)
+    items, piped = pipeline.run_folder(
+        paths,
+        stage_fns=stage_fns,
+        transcribe_workers=args.transcribe_workers,
+        summarize_workers=args.summarize_workers,
+    )
+    failed = sum(1 for i in items if i["status"] != "done")
+    print(f"sequential   {seq:8.1f}s  {n / seq * 3600:8.0f} sessions/hour")
+    print(f"pipeline     {piped:8.1f}s  {n / piped * 3600:8.0f} sessions/hour  ({seq / piped:.2f}x, {failed} failed)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Benchmark: prompt rendering, old load_prompt (read file + str.replace per kwarg)
+vs. the compiled prompt registry.
+
+Run from repo root:  python scripts/bench_prompts.py [--chars 400000] [--runs 200]
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from backend.config import PROMPTS_ROOT  # noqa: E402
+from backend.prompts import PROMPT_IDS, load_prompt  # noqa: E402
+
+
+def legacy_load_prompt(prompt_id: str, **kwargs) -> str:
+    """The previous implementation, for comparison."""
+    text = (PROMPTS_ROOT / PROMPT_IDS[prompt_id]).read_text(encoding="utf-8")
+    for k, v in kwargs.items():
+        text = text.replace("{" + k + "}", str(v))
+    return text
+
+
+def timed(fn, runs: int) -> float:
+    t0 = time.perf_counter()
+    for _ in range(runs):
+        fn()
+    return (time.perf_counter() - t0) / runs * 1000
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--chars", type=int, default=400_000, help="transcript length")
+    ap.add_argument("--runs", type=int, default=200)
+    args = ap.parse_args()
+
+    sentence = "Dann besprechen wir das Budget für Q3 und die nächsten Schritte. "
+    transcript = (sentence * (args.chars // len(sentence) + 1))[: args.chars]
+    cases = [
+        ("summary.v0.1", {"transcript": transcript}),
+        # transcript first: every further kwarg rescans it with str.replace
+        ("summary_chunk.v0.1", {"transcript": transcript, "part": 3, "parts": 9}),
+    ]
+    print(f"transcript {args.chars} chars, {args.runs} runs each")
+    for prompt_id, kwargs in cases:
+        assert legacy_load_prompt(prompt_id, **kwargs) == load_prompt(prompt_id, **kwargs)
+        old = timed(lambda: legacy_load_prompt(prompt_id, **kwargs), args.runs)
+        new = timed(lambda: load_prompt(prompt_id, **kwargs), args.runs)
+        print(f"{prompt_id:<22} legacy {old:7.3f} ms   registry {new:7.3f} ms   {old / new:5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
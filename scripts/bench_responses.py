@@ -0,0 +1,97 @@
+"""Benchmark: JSON encode time and bytes on the wire for session/case endpoints.
+
+Run from repo root:  python scripts/bench_responses.py [--sessions 50] [--transcript-chars 200000]
+
+"before" is FastAPI's default path (jsonable_encoder + stdlib json via
+JSONResponse), "after" is FastJSONResponse on the same DTOs (orjson when
+installed). Bytes are shown uncompressed, gzip and brotli (if installed).
+"""
+import argparse
+import gzip
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+TMP = Path(tempfile.mkdtemp(prefix="zyq-bench-resp-"))
+os.environ["ZYQURAFLOW_DATA"] = str(TMP)
+
+import backend.db  # noqa: E402
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+
+from backend import responses  # noqa: E402
+from backend.config import COMPRESS_BROTLI_QUALITY, COMPRESS_GZIP_LEVEL  # noqa: E402
+from backend.db import db_cursor  # noqa: E402
+from backend.services import case_service, session_service  # noqa: E402
+
+SENTENCE = "Dann besprechen wir das Budget für Q3, die Risiken und die nächsten Schritte. "
+
+
+def seed(n: int, chars: int) -> tuple:
+    case_id = case_service.create_case("Benchmark")["case_id"]
+    transcript = (SENTENCE * (chars // len(SENTENCE) + 1))[:chars]
+    summary = json.dumps({
+        "title": "Quartalsplanung",
+        "summary": SENTENCE * 20,
+        "key_points": [SENTENCE] * 8,
+        "action_items": [SENTENCE] * 5,
+    }, ensure_ascii=False)
+    with db_cursor() as cur:
+        cur.executemany(
+            "INSERT INTO sessions (session_id, case_id, created_at, audio_path, status, file_size, duration, "
+            "transcript, summary_json) VALUES (?, ?, datetime('now', ?), '', 'summarized', 1000000, 1800, ?, ?)",
+            [(f"SESSION-bench-{i:05d}", case_id, f"-{i} minutes", transcript, summary) for i in range(n)],
+        )
+    return case_id, f"SESSION-bench-{0:05d}"
+
+
+def timed(fn, runs: int) -> float:
+    fn()
+    t0 = time.perf_counter()
+    for _ in range(runs):
+        fn()
+    return (time.perf_counter() - t0) / runs * 1000
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--sessions", type=int, default=50)
+    ap.add_argument("--transcript-chars", type=int, default=200_000)
+    ap.add_argument("--runs", type=int, default=20)
+    args = ap.parse_args()
+
+    backend.db.DB_PATH = TMP / "bench.db"
+    backend.db.init_db()
+    case_id, session_id = seed(args.sessions, args.transcript_chars)
+
+    payloads = {
+        "GET /api/sessions/{id}": session_service.get_session(session_id),
+        "GET /api/sessions?fields=+transcript": session_service.list_sessions(
+            fields=session_service.SESSION_FIELDS
+        ),
+        "GET /api/sessions": session_service.list_sessions(),
+        "GET /api/cases/{id}": case_service.get_case(case_id),
+        "GET /api/cases": case_service.list_cases(),
+    }
+    print(f"{args.sessions} sessions, transcripts of {args.transcript_chars} chars, "
+          f"orjson={'yes' if responses.orjson else 'no'}, brotli={'yes' if responses.brotli else 'no'}")
+    print(f"{'endpoint':<38} {'before ms':>10} {'after ms':>9} {'bytes':>11} {'gzip':>10} {'br':>10} {'gzip ms':>8}")
+    for name, dto in payloads.items():
+        before = timed(lambda: JSONResponse(jsonable_encoder(dto)), args.runs)
+        after = timed(lambda: responses.FastJSONResponse(dto), args.runs)
+        body = responses.FastJSONResponse(dto).body
+        gz_ms = timed(lambda: gzip.compress(body, compresslevel=COMPRESS_GZIP_LEVEL, mtime=0), 3)
+        gz = len(responses.compress(body, "gzip"))
+        br = (
+            len(responses.brotli.compress(body, quality=COMPRESS_BROTLI_QUALITY)) if responses.brotli else None
+        )
+        print(f"{name:<38} {before:10.2f} {after:9.2f} {len(body):11,d} {gz:10,d} "
+              f"{br if br is not None else '-':>10} {gz_ms:8.2f}")
+
+
+if __name__ == "__main__":
+    main()
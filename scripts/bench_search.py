@@ -0,0 +1,101 @@
+"""Benchmark: /api/search latency (FTS5) on a large synthetic archive.
+
+Run from repo root:  python scripts/bench_search.py [--sessions 100000] [--words 150]
+
+Seeds sessions with random transcripts (Zipf-like vocabulary, so there are
+both very common and rare words) plus summaries, then times typical queries
+through search_service.
+"""
+import argparse
+import itertools
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+TMP = Path(tempfile.mkdtemp(prefix="zyq-bench-"))
+os.environ["ZYQURAFLOW_DATA"] = str(TMP)
+
+import backend.db  # noqa: E402
+from backend.db import db_cursor  # noqa: E402
+from backend.services import search_service  # noqa: E402
+
+SYLLABLES = ["ba", "ke", "lo", "mi", "nu", "ra", "se", "ti", "vo", "ze", "ch", "st", "an", "er", "un"]
+
+
+def _word(rnd: random.Random) -> str:
+    return "".join(rnd.choices(SYLLABLES, k=rnd.randint(2, 5)))
+
+
+_rnd = random.Random(7)
+VOCAB = list(dict.fromkeys(_word(_rnd) for _ in range(40000)))[:20000]
+# Zipf-like: word i has weight 1/(i+1)
+CUM_WEIGHTS = list(itertools.accumulate(1 / (i + 1) for i in range(len(VOCAB))))
+
+
+def seed(n: int, words: int) -> None:
+    rnd = random.Random(42)
+
+    def pick(k):
+        return " ".join(rnd.choices(VOCAB, cum_weights=CUM_WEIGHTS, k=k))
+
+    rows = []
+    for i in range(n):
+        transcript = pick(words)
+        summary = json.dumps({
+            "title": pick(4),
+            "participants": ["Anna"],
+            "key_points": [pick(5) for _ in range(3)],
+            "action_items": [pick(4)],
+            "summary": pick(25),
+        })
+        rows.append((f"SESSION-{i:032x}", f"CASE-2025-{i % 500:04d}", transcript, summary))
+    with db_cursor() as cur:
+        cur.executemany(
+            "INSERT INTO sessions (session_id, case_id, created_at, status, transcript, summary_json) "
+            "VALUES (?, ?, datetime('now'), 'summarized', ?, ?)",
+            rows,
+        )
+
+
+def timed(repeat: int, **kwargs) -> tuple:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        results = search_service.search_sessions(**kwargs)
+        best = min(best, time.perf_counter() - t0)
+    return best, len(results)
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--sessions", type=int, default=100_000)
+    ap.add_argument("--words", type=int, default=150)
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args()
+
+    backend.db.DB_PATH = TMP / "bench.db"
+    backend.db.init_db()
+    t0 = time.perf_counter()
+    seed(args.sessions, args.words)
+    print(f"seeded {args.sessions} sessions ({args.words} words each) in {time.perf_counter() - t0:.1f}s")
+
+    queries = [
+        ("rare word", {"q": VOCAB[15000]}),
+        ("mid-frequency word", {"q": VOCAB[500]}),
+        ("two words", {"q": f"{VOCAB[120]} {VOCAB[900]}"}),
+        ("prefix (3 chars)", {"q": VOCAB[2000][:3]}),
+        ("very common word", {"q": VOCAB[0]}),
+        ("common word, one case", {"q": VOCAB[2], "case_id": "CASE-2025-0007"}),
+    ]
+    for label, params in queries:
+        seconds, n = timed(args.repeat, **params)
+        print(f"{label:24s} {seconds * 1000:8.2f} ms  ({n} results)")
+
+
+if __name__ == "__main__":
+    main()
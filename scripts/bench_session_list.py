@@ -0,0 +1,74 @@
+"""Benchmark: full vs. lean session list payloads.
+
+Run from repo root:  python scripts/bench_session_list.py [--sessions 1000] [--transcript-kb 200]
+
+Compares GET /api/sessions with every field (transcript included, the old
+behaviour) against the default lean list DTOs.
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+TMP = Path(tempfile.mkdtemp(prefix="zyq-bench-"))
+os.environ["ZYQURAFLOW_DATA"] = str(TMP)
+
+import backend.db  # noqa: E402
+from backend.db import db_cursor  # noqa: E402
+
+
+def seed(n: int, transcript_kb: int) -> None:
+    transcript = ("Wir besprechen das Budget und die Timeline. " * 40)[:1024] * transcript_kb
+    summary = json.dumps({
+        "title": "Planung", "participants": ["Anna", "Bert"],
+        "key_points": ["Budget", "Timeline"], "action_items": ["Angebot einholen"],
+        "summary": "Kurze Zusammenfassung.",
+    })
+    with db_cursor() as cur:
+        cur.executemany(
+            "INSERT INTO sessions (session_id, created_at, audio_path, status, transcript, summary_path, summary_json) "
+            "VALUES (?, datetime('now'), '', 'summarized', ?, 'x/summary.json', ?)",
+            [(f"SESSION-{i:032x}", transcript, summary) for i in range(n)],
+        )
+
+
+def measure(client, params, repeat):
+    best, size = float("inf"), 0
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        r = client.get("/api/sessions", params=params)
+        best = min(best, time.perf_counter() - t0)
+        size = len(r.content)
+    return best, size
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--sessions", type=int, default=1000)
+    ap.add_argument("--transcript-kb", type=int, default=200)
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+
+    backend.db.DB_PATH = TMP / "bench.db"
+    backend.db.init_db()
+    seed(args.sessions, args.transcript_kb)
+
+    from fastapi.testclient import TestClient
+    from backend.main import app
+    from backend.services.session_service import SESSION_FIELDS
+    client = TestClient(app)
+
+    full_t, full_b = measure(client, {"fields": ",".join(SESSION_FIELDS)}, args.repeat)
+    lean_t, lean_b = measure(client, {}, args.repeat)
+    print(f"full list   {full_b / 1e6:10.2f} MB  {full_t * 1000:9.1f} ms")
+    print(f"lean list   {lean_b / 1e6:10.2f} MB  {lean_t * 1000:9.1f} ms")
+    print(f"reduction   {full_b / lean_b:10.0f}x    {full_t / lean_t:9.0f}x")
+    backend.db.pool.close_all()
+
+
+if __name__ == "__main__":
+    main()
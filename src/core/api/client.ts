@@ -1,6 +1,8 @@
 import { config } from '../config'
 import type {
+  BatchSummaryResult,
   SessionDto,
+  SessionPage,
   SessionCreate,
   CaseDto,
   CaseCreate,
@@ -8,6 +10,8 @@ import type {
   SystemConfig,
   HealthResponse,
   ProviderInfo,
+  JobDto,
+  TranscriptSegment,
 } from './types'
 
 const baseUrl = () => config.backendUrl
@@ -37,16 +41,40 @@ export async function listSessions(caseId?: string): Promise<SessionDto[]> {
   return fetchApi<SessionDto[]>(`/api/sessions${q}`)
 }
 
+/** Page size of the session lists in the UI */
+export const SESSION_PAGE_SIZE = 100
+
+/**
+ * Keyset-paginated session list; pass nextCursor back as `after` for the next page.
+ * With `fields` the items only carry those fields (e.g. ['session_id', 'status']).
+ */
+export async function listSessionsPage(
+  opts: { caseId?: string; limit?: number; after?: string; fields?: string[] } = {},
+): Promise<SessionPage> {
+  const params = new URLSearchParams()
+  if (opts.caseId) params.set('case_id', opts.caseId)
+  if (opts.limit) params.set('limit', String(opts.limit))
+  if (opts.after) params.set('after', opts.after)
+  if (opts.fields?.length) params.set('fields', opts.fields.join(','))
+  const res = await fetch(`${baseUrl()}/api/sessions?${params}`)
+  if (!res.ok) {
+    const err = await res.json().catch(() => ({ detail: res.statusText }))
+    throw new Error(err.detail ?? `HTTP ${res.status}`)
+  }
+  return { items: await res.json(), nextCursor: res.headers.get('X-Next-Cursor') }
+}
+
 export async function getSession(sessionId: string): Promise<SessionDto> {
   return fetchApi<SessionDto>(`/api/sessions/${sessionId}`)
 }
 
 export async function uploadAudio(sessionId: string, file: File): Promise<SessionDto> {
-  const form = new FormData()
-  form.append('file', file)
-  const res = await fetch(`${baseUrl()}/api/sessions/${sessionId}/audio`, {
-    method: 'POST',
-    body: form,
+  // Raw body: the backend streams it straight into the session directory
+  const q = `?filename=${encodeURIComponent(file.name)}`
+  const res = await fetch(`${baseUrl()}/api/sessions/${sessionId}/audio${q}`, {
+    method: 'PUT',
+    headers: { 'Content-Type': file.type || 'application/octet-stream' },
+    body: file,
   })
   if (!res.ok) {
     const err = await res.json().catch(() => ({ detail: res.statusText }))
@@ -62,10 +90,57 @@ export async function updateTranscript(sessionId: string, transcript: string): P
   })
 }
 
-export async function transcribeSession(sessionId: string): Promise<SessionDto> {
-  return fetchApi<SessionDto>(`/api/sessions/${sessionId}/transcribe`, {
+/** Startet die Transkription als Hintergrund-Job, wartet auf das Ende und liefert die Sitzung. */
+export async function transcribeSession(
+  sessionId: string,
+  onProgress?: (job: JobDto) => void,
+): Promise<SessionDto> {
+  let job = await fetchApi<JobDto>(`/api/sessions/${sessionId}/transcribe`, {
     method: 'POST',
   })
+  while (job.status === 'queued' || job.status === 'running') {
+    onProgress?.(job)
+    await new Promise((r) => setTimeout(r, 1000))
+    job = await getJob(job.job_id)
+  }
+  if (job.status !== 'done') {
+    throw new Error(job.error ?? `Transkription ${job.status}`)
+  }
+  return getSession(sessionId)
+}
+
+/** Live-Transkription per SSE: onSegment pro Segment, Promise endet mit der Sitzung. */
+export function streamTranscription(
+  sessionId: string,
+  onSegment: (seg: TranscriptSegment) => void,
+): Promise<SessionDto> {
+  return new Promise((resolve, reject) => {
+    const es = new EventSource(`${baseUrl()}/api/sessions/${sessionId}/transcribe/stream`)
+    es.addEventListener('segment', (e) => onSegment(JSON.parse((e as MessageEvent).data)))
+    es.addEventListener('done', (e) => {
+      es.close()
+      resolve(JSON.parse((e as MessageEvent).data))
+    })
+    es.addEventListener('error', (e) => {
+      es.close()
+      const data = (e as MessageEvent).data
+      reject(new Error(data ? JSON.parse(data).detail : 'Transkription fehlgeschlagen'))
+    })
+  })
+}
+
+/** Auto-Verarbeitung: Transkription und Zusammenfassung laufen serverseitig über die Pipeline. */
+export async function processSession(sessionId: string): Promise<{ item_id: string; status: string }> {
+  return fetchApi(`/api/sessions/${sessionId}/process`, { method: 'POST' })
+}
+
+/* Jobs */
+export async function getJob(jobId: string): Promise<JobDto> {
+  return fetchApi<JobDto>(`/api/jobs/${jobId}`)
+}
+
+export async function cancelJob(jobId: string): Promise<JobDto> {
+  return fetchApi<JobDto>(`/api/jobs/${jobId}/cancel`, { method: 'POST' })
 }
 
 export async function summarizeSession(sessionId: string): Promise<SessionDto> {
@@ -74,6 +149,51 @@ export async function summarizeSession(sessionId: string): Promise<SessionDto> {
   })
 }
 
+/** Summarize with token streaming: onField fires per finished summary field (title, key_points, …). */
+export async function summarizeSessionStream(
+  sessionId: string,
+  onField: (name: string, value: unknown) => void,
+): Promise<SessionDto> {
+  const res = await fetch(`${baseUrl()}/api/sessions/${sessionId}/summarize/stream`, { method: 'POST' })
+  if (!res.ok || !res.body) {
+    const err = await res.json().catch(() => ({ detail: res.statusText }))
+    throw new Error(err.detail ?? `HTTP ${res.status}`)
+  }
+  const reader = res.body.pipeThrough(new TextDecoderStream()).getReader()
+  let buffer = ''
+  for (;;) {
+    const { value, done } = await reader.read()
+    if (done) break
+    buffer += value
+    let sep: number
+    while ((sep = buffer.indexOf('\n\n')) >= 0) {
+      const block = buffer.slice(0, sep)
+      buffer = buffer.slice(sep + 2)
+      const event = /^event: (.*)$/m.exec(block)?.[1]
+      const data = JSON.parse(/^data: (.*)$/m.exec(block)?.[1] ?? 'null')
+      if (event === 'field') onField(data.name, data.value)
+      else if (event === 'done') return data
+      else if (event === 'error') throw new Error(data.detail)
+    }
+  }
+  throw new Error('Zusammenfassung abgebrochen')
+}
+
+/** Summarize several sessions in one request (server limits LLM parallelism). */
+export async function summarizeSessions(sessionIds: string[], force = false): Promise<BatchSummaryResult> {
+  return fetchApi<BatchSummaryResult>('/api/sessions/summarize', {
+    method: 'POST',
+    body: JSON.stringify({ session_ids: sessionIds, force }),
+  })
+}
+
+export async function summarizeCase(caseId: string, force = false): Promise<BatchSummaryResult> {
+  return fetchApi<BatchSummaryResult>(`/api/cases/${caseId}/summarize`, {
+    method: 'POST',
+    body: JSON.stringify({ force }),
+  })
+}
+
 /* Cases */
 export async function listCases(): Promise<CaseDto[]> {
   return fetchApi<CaseDto[]>('/api/cases')
@@ -86,6 +206,14 @@ export async function createCase(body: CaseCreate): Promise<CaseDto> {
   })
 }
 
+/** Viele Fälle in einer Transaktion anlegen (Import). */
+export async function createCases(aliases: string[]): Promise<CaseDto[]> {
+  return fetchApi<CaseDto[]>('/api/cases/bulk', {
+    method: 'POST',
+    body: JSON.stringify({ aliases }),
+  })
+}
+
 export async function getCase(caseId: string): Promise<CaseDto & { sessions: SessionDto[] }> {
   return fetchApi<CaseDto & { sessions: SessionDto[] }>(`/api/cases/${caseId}`)
 }
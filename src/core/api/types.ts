@@ -13,6 +13,7 @@ export interface SessionDto {
   case_id: string | null
   created_at: string
   audio_path: string
+  audio_sha256?: string | null
   summary_path: string | null
   file_size: number
   duration: number | null
@@ -21,6 +22,45 @@ export interface SessionDto {
   summary?: SummaryJson
 }
 
+export interface SessionPage {
+  items: SessionDto[]
+  nextCursor: string | null
+}
+
+export interface BatchSessionResult {
+  session_id: string
+  status: 'summarized' | 'skipped' | 'failed'
+  reason?: 'already_summarized' | 'no_transcript'
+  error?: string
+}
+
+export interface BatchSummaryResult {
+  total: number
+  summarized: number
+  skipped: number
+  failed: number
+  results: BatchSessionResult[]
+}
+
+export interface TranscriptSegment {
+  index: number
+  start: number
+  end: number
+  text: string
+}
+
+export interface JobDto {
+  job_id: string
+  kind: string
+  session_id: string | null
+  status: 'queued' | 'running' | 'done' | 'failed' | 'cancelled'
+  progress: number
+  error: string | null
+  created_at: string
+  started_at: string | null
+  finished_at: string | null
+}
+
 export interface SessionCreate {
   case_id?: string | null
 }
@@ -30,6 +70,11 @@ export interface CaseDto {
   alias: string
   created_at: string
   session_count?: number
+  audio_bytes?: number
+  duration_seconds?: number
+  last_activity_at?: string | null
+  /** Anzahl Sitzungen je Status, z. B. { draft: 2, summarized: 5 } */
+  status_counts?: Record<string, number>
 }
 
 export interface CaseCreate {
@@ -9,6 +9,7 @@ export function CasesScreen() {
   const [selected, setSelected] = useState<CaseDto | null>(null)
   const [sessions, setSessions] = useState<SessionDto[]>([])
   const [allSessions, setAllSessions] = useState<SessionDto[]>([])
+  const [nextCursor, setNextCursor] = useState<string | null>(null)
   const [alias, setAlias] = useState('')
   const [loading, setLoading] = useState(false)
   const [error, setError] = useState<string | null>(null)
@@ -22,10 +23,16 @@ export function CasesScreen() {
     }
   }
 
-  const loadSessions = async () => {
+  // Zum Verknüpfen reichen ID und Fall; weitere Seiten auf Anforderung
+  const loadSessions = async (after?: string) => {
     try {
-      const list = await api.listSessions()
-      setAllSessions(list)
+      const page = await api.listSessionsPage({
+        limit: api.SESSION_PAGE_SIZE,
+        after,
+        fields: ['session_id', 'case_id'],
+      })
+      setAllSessions((prev) => (after ? [...prev, ...page.items] : page.items))
+      setNextCursor(page.nextCursor)
     } catch (e) {
       setError(String(e))
     }
@@ -154,7 +161,12 @@ export function CasesScreen() {
                   </li>
                 ))}
             </ul>
-            {linkableSessions.length === 0 && (
+            {nextCursor && (
+              <Button size="sm" variant="ghost" onClick={() => loadSessions(nextCursor)}>
+                Weitere Sitzungen laden
+              </Button>
+            )}
+            {linkableSessions.length === 0 && !nextCursor && (
               <p className="cases-empty">Keine Sitzungen zum Verknüpfen. Zuerst Sitzungen anlegen.</p>
             )}
           </Card>
@@ -3,19 +3,23 @@ import { render, screen, waitFor } from '@testing-library/react'
 import userEvent from '@testing-library/user-event'
 import { SessionsScreen } from './SessionsScreen'
 import * as api from '@core/api/client'
+import type { SessionDto } from '@core/api/types'
 
 vi.mock('@core/api/client')
 
 describe('SessionsScreen', () => {
   beforeEach(() => {
-    vi.mocked(api.listSessions).mockResolvedValue([])
+    vi.mocked(api.listSessionsPage).mockResolvedValue({ items: [], nextCursor: null })
   })
 
-  it('rendert „Sitzung anlegen“-Button und lädt Sitzungen', async () => {
+  it('rendert „Sitzung anlegen“-Button und lädt Sitzungen seitenweise', async () => {
     render(<SessionsScreen />)
     await waitFor(() => {
-      expect(api.listSessions).toHaveBeenCalled()
+      expect(api.listSessionsPage).toHaveBeenCalled()
     })
+    const opts = vi.mocked(api.listSessionsPage).mock.calls[0][0]
+    expect(opts?.limit).toBeGreaterThan(0)
+    expect(opts?.fields).not.toContain('transcript')
     expect(screen.getByRole('button', { name: /sitzung anlegen/i })).toBeInTheDocument()
   })
 
@@ -32,10 +36,9 @@ describe('SessionsScreen', () => {
       status: 'draft',
     }
     vi.mocked(api.createSession).mockResolvedValue(mockSession)
-    vi.mocked(api.listSessions).mockResolvedValueOnce([]).mockResolvedValueOnce([mockSession])
 
     render(<SessionsScreen />)
-    await waitFor(() => { expect(api.listSessions).toHaveBeenCalled() })
+    await waitFor(() => { expect(api.listSessionsPage).toHaveBeenCalled() })
     await user.click(screen.getByRole('button', { name: /sitzung anlegen/i }))
 
     await waitFor(() => {
@@ -45,4 +48,24 @@ describe('SessionsScreen', () => {
       expect(screen.getByText(/test123/)).toBeInTheDocument()
     })
   })
+
+  it('lädt mit „Weitere laden“ die nächste Seite über den Cursor', async () => {
+    const user = userEvent.setup()
+    const row = (id: string) =>
+      ({ session_id: id, case_id: null, created_at: '2026-01-01T00:00:00', status: 'draft' }) as SessionDto
+    vi.mocked(api.listSessionsPage).mockImplementation(async (opts) =>
+      opts?.after === 'c1'
+        ? { items: [row('SESSION-bbbb2222')], nextCursor: null }
+        : { items: [row('SESSION-aaaa1111')], nextCursor: 'c1' },
+    )
+
+    render(<SessionsScreen />)
+    await user.click(await screen.findByRole('button', { name: /weitere laden/i }))
+
+    await waitFor(() => {
+      expect(screen.getAllByRole('listitem')).toHaveLength(2)
+    })
+    expect(api.listSessionsPage).toHaveBeenLastCalledWith(expect.objectContaining({ after: 'c1' }))
+    expect(screen.queryByRole('button', { name: /weitere laden/i })).not.toBeInTheDocument()
+  })
 })
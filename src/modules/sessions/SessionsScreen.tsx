@@ -1,39 +1,61 @@
-import { useState, useEffect, useCallback } from 'react'
+import { useState, useEffect, useCallback, useRef } from 'react'
 import { Button, Card, TextArea } from '@ui-kit'
 import * as api from '@core/api/client'
 import type { SessionDto, SummaryJson } from '@core/api/types'
 import './SessionsScreen.css'
 
+// Die Liste zeigt nur ID und Status; Details lädt selectSession nach
+const LIST_FIELDS = ['session_id', 'case_id', 'created_at', 'status']
+
 export function SessionsScreen() {
   const [sessions, setSessions] = useState<SessionDto[]>([])
+  const [nextCursor, setNextCursor] = useState<string | null>(null)
   const [selected, setSelected] = useState<SessionDto | null>(null)
   const [transcript, setTranscript] = useState('')
   const [loading, setLoading] = useState(false)
   const [transcribing, setTranscribing] = useState(false)
   const [error, setError] = useState<string | null>(null)
+  // Zuletzt angeklickte Sitzung: ältere Detail-Antworten werden verworfen
+  const selectRequest = useRef<string | null>(null)
 
   const loadSessions = useCallback(async () => {
     try {
-      const list = await api.listSessions()
-      setSessions(list)
-      if (selected && !list.find((s) => s.session_id === selected.session_id)) {
+      const page = await api.listSessionsPage({ limit: api.SESSION_PAGE_SIZE, fields: LIST_FIELDS })
+      setSessions(page.items)
+      setNextCursor(page.nextCursor)
+      // Nur bei vollständiger Liste heißt eine fehlende Auswahl: gelöscht
+      const current = selectRequest.current
+      if (current && !page.nextCursor && !page.items.find((s) => s.session_id === current)) {
+        selectRequest.current = null
         setSelected(null)
       }
     } catch (e: unknown) {
       setError(e instanceof Error ? e.message : String(e))
     }
-  }, [selected?.session_id])
+  }, [])
 
   useEffect(() => {
     loadSessions()
   }, [loadSessions])
 
+  const loadMoreSessions = async () => {
+    if (!nextCursor) return
+    try {
+      const page = await api.listSessionsPage({ limit: api.SESSION_PAGE_SIZE, after: nextCursor, fields: LIST_FIELDS })
+      setSessions((prev) => [...prev, ...page.items.filter((s) => !prev.some((p) => p.session_id === s.session_id))])
+      setNextCursor(page.nextCursor)
+    } catch (e: unknown) {
+      setError(e instanceof Error ? e.message : String(e))
+    }
+  }
+
   const handleCreateSession = async () => {
     setError(null)
     setLoading(true)
     try {
       const s = await api.createSession()
       setSessions((prev) => [s, ...prev])
+      selectRequest.current = s.session_id
       setSelected(s)
       setTranscript('')
     } catch (e: unknown) {
@@ -105,9 +127,20 @@ export function SessionsScreen() {
     }
   }
 
-  const selectSession = (s: SessionDto) => {
+  const selectSession = async (s: SessionDto) => {
+    selectRequest.current = s.session_id
     setSelected(s)
     setTranscript(s.transcript ?? '')
+    // Listen liefern kein Transkript mehr – Details nachladen
+    try {
+      const full = await api.getSession(s.session_id)
+      if (selectRequest.current !== full.session_id) return
+      setSelected(full)
+      setTranscript(full.transcript ?? '')
+    } catch (e: unknown) {
+      if (selectRequest.current !== s.session_id) return
+      setError(e instanceof Error ? e.message : String(e))
+    }
   }
 
   const summary = selected?.summary
@@ -140,6 +173,11 @@ export function SessionsScreen() {
               </li>
             ))}
           </ul>
+          {nextCursor && (
+            <Button variant="ghost" onClick={loadMoreSessions} fullWidth>
+              Weitere laden
+            </Button>
+          )}
         </Card>
       </div>
       <div className="sessions-main">